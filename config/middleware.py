@@ -1,10 +1,18 @@
 import json
+import re
 
+from django.http import FileResponse, HttpResponse
 from django.template.response import TemplateResponse
 from django.utils.decorators import sync_only_middleware
 
+from core.folders.domain.key_cache import folder_key_cache
+from core.permissions.matrix import permission_matrix_cache
+
 __all__ = [
     "custom_debug_toolbar_middleware",
+    "folder_key_cache_middleware",
+    "permission_matrix_cache_middleware",
+    "file_range_middleware",
 ]
 
 
@@ -23,3 +31,113 @@ def custom_debug_toolbar_middleware(get_response):
         return response
 
     return middleware
+
+
+@sync_only_middleware
+def folder_key_cache_middleware(get_response):
+    def middleware(request):
+        with folder_key_cache():
+            return get_response(request)
+
+    return middleware
+
+
+@sync_only_middleware
+def permission_matrix_cache_middleware(get_response):
+    def middleware(request):
+        with permission_matrix_cache():
+            return get_response(request)
+
+    return middleware
+
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Returns the first and the last byte of a single byte range. Headers that
+    can not be parsed or ask for several ranges are ignored and return None,
+    a valid range outside of the file raises RangeNotSatisfiable.
+    """
+    match = RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if first == "" and last == "":
+        return None
+    if first == "":
+        # a suffix range like bytes=-500 asks for the last 500 bytes
+        if int(last) == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def iter_range(file, start: int, length: int, block_size: int):
+    file.seek(start)
+    while length > 0:
+        data = file.read(min(block_size, length))
+        if not data:
+            break
+        length -= len(data)
+        yield data
+
+
+@sync_only_middleware
+def file_range_middleware(get_response):
+    """
+    Answers range requests for file downloads. The file of the response needs
+    to be seekable, which the decrypted files are even if they are stored on s3.
+    """
+
+    def middleware(request):
+        response = get_response(request)
+
+        if (
+            not isinstance(response, FileResponse)
+            or response.status_code != 200
+            or "Content-Length" not in response
+        ):
+            return response
+        file = getattr(response, "file_to_stream", None)
+        if file is None or not file.seekable():
+            return response
+
+        response["Accept-Ranges"] = "bytes"
+        header = request.headers.get("Range")
+        if header is None:
+            return response
+
+        size = int(response["Content-Length"])
+        try:
+            byte_range = parse_range(header, size)
+        except RangeNotSatisfiable:
+            file.close()
+            invalid = HttpResponse(status=416)
+            invalid["Content-Range"] = "bytes */{}".format(size)
+            return invalid
+        if byte_range is None:
+            return response
+
+        start, end = byte_range
+        length = end - start + 1
+        response.streaming_content = iter_range(
+            file, start, length, response.block_size
+        )
+        response.status_code = 206
+        response["Content-Range"] = "bytes {}-{}/{}".format(start, end, size)
+        response["Content-Length"] = str(length)
+        return response
+
+    return middleware
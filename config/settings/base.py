@@ -68,6 +68,9 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "config.middleware.folder_key_cache_middleware",
+    "config.middleware.permission_matrix_cache_middleware",
+    "config.middleware.file_range_middleware",
 ]
 
 # Url conf
@@ -217,6 +220,15 @@ CACHES = {
     }
 }
 
+# files, how many files of one request are encrypted and uploaded in parallel
+FILES_UPLOAD_WORKERS = env.int("FILES_UPLOAD_WORKERS", 4)
+
+# encryption, how many public key wraps of one key distribution run in parallel
+KEY_DISTRIBUTION_WORKERS = env.int("KEY_DISTRIBUTION_WORKERS", 4)
+
+# records dashboard, how long the total of a search may be reused
+RECORDS_TOTAL_CACHE_SECONDS = env.int("RECORDS_TOTAL_CACHE_SECONDS", 60)
+
 # session overwrite
 # https://docs.djangoproject.com/en/5.1/topics/http/sessions/#example
 SESSION_ENGINE = "config.session"
@@ -255,6 +267,7 @@ DUMMY_USER_PASSWORD = "qwe123"
 # those are used within core.cronjobs and imported by string
 CRONJOBS = [
     "core.data_sheets.cronjobs.update_statistic_fields",
+    "core.statistics.cronjobs.update_statistics_rollups",
 ]
 
 # testing
@@ -265,6 +278,14 @@ REPOSITORY_TIMELINE_EVENT = "core.timeline.repository.EventStoreTimelineEventRep
 
 # messagebus
 MESSAGEBUS_EVENT_STORE = "messagebus.impl.store.DjangoEventStore"
+MESSAGEBUS_OUTBOX = "messagebus.impl.outbox.DjangoOutbox"
+# "sync" runs the handlers inside of the use case, "outbox" stores the events
+# and leaves the handlers to the process_outbox management command
+MESSAGEBUS_DISPATCH = env.str("MESSAGEBUS_DISPATCH", "sync")
+
+# use case audit logging, the logged paths are written in batches
+LOGGED_PATH_BUFFER_SIZE = env.int("LOGGED_PATH_BUFFER_SIZE", 100)
+LOGGED_PATH_BUFFER_SECONDS = env.float("LOGGED_PATH_BUFFER_SECONDS", 5.0)
 
 # use case settings
 USECASE_INJECTIONS = "core.injections.INJECTIONS"
@@ -277,3 +298,8 @@ MI_EMAIL_HOST = env.str("MI_EMAIL_HOST", "not-set")
 MI_EMAIL_PORT = env.int("MI_EMAIL_PORT", -1)
 MI_EMAIL_USER = env.str("MI_EMAIL_USER", "not-set")
 MI_EMAIL_PASSWORD = env.str("MI_EMAIL_PASSWORD", "not-set")
+# how many mails are fetched with one command and parsed and encrypted in parallel
+MI_FETCH_BATCH_SIZE = env.int("MI_FETCH_BATCH_SIZE", 50)
+MI_IMPORT_WORKERS = env.int("MI_IMPORT_WORKERS", 4)
+# attachments larger than this are spooled to a temporary file while importing
+MI_ATTACHMENT_SPOOL_SIZE = env.int("MI_ATTACHMENT_SPOOL_SIZE", 1024 * 1024)
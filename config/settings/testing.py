@@ -40,3 +40,8 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "tmp/media/testing/")
 STORAGES["staticfiles"][
     "BACKEND"
 ] = "django.contrib.staticfiles.storage.StaticFilesStorage"
+
+# Logged paths
+# Flush logged paths on every add. Inside the transaction of a test the flush
+# waits for a commit that never happens, core/conftest.py drops those rows.
+LOGGED_PATH_BUFFER_SIZE = 1
@@ -1,5 +1,7 @@
+from botocore.exceptions import ClientError
 from django.utils.crypto import get_random_string
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
 
 
 class CustomS3Boto3Storage(S3Boto3Storage):
@@ -10,3 +12,17 @@ class CustomS3Boto3Storage(S3Boto3Storage):
         exists) to the filename.
         """
         return "%s_%s%s" % (get_random_string(7), file_root, file_ext)
+
+    def open_range(self, name, start=0):
+        """
+        Return the streaming body of the object from the byte 'start' on. The
+        object is not downloaded into a temporary file like with 'open'.
+        """
+        name = self._normalize_name(clean_name(name))
+        kwargs = {"Range": "bytes={}-".format(start)} if start else {}
+        try:
+            return self.bucket.Object(name).get(**kwargs)["Body"]
+        except ClientError as err:
+            if err.response["ResponseMetadata"]["HTTPStatusCode"] == 404:
+                raise FileNotFoundError("File does not exist: %s" % name)
+            raise
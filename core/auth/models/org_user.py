@@ -26,6 +26,11 @@ from core.encryption.value_objects.asymmetric_key import (
     AsymmetricKey,
 )
 from core.org.models import Org, OrgEncryption
+from core.permissions.matrix import (
+    get_permission_matrix,
+    get_permission_matrix_cache,
+    invalidate_permission_matrix,
+)
 from core.permissions.models import HasPermission, Permission
 from core.permissions.static import (
     PERMISSION_ADMIN_MANAGE_RECORD_ACCESS_REQUESTS,
@@ -444,6 +449,7 @@ class OrgUser(models.Model):
         else:
             raise ValueError("You need to pass 'permission_name' or 'permission'")
         HasPermission.objects.create(user=self, permission=p)
+        invalidate_permission_matrix(self.org_id)
 
     def __has_as_user_permission(self, permission):
         return HasPermission.objects.filter(user=self, permission=permission).exists()
@@ -467,6 +473,11 @@ class OrgUser(models.Model):
         return self.__has_as_user_permission(permission)
 
     def has_permission(self, permission: Union[str, "Permission"]) -> bool:
+        if get_permission_matrix_cache() is not None:
+            name = permission if isinstance(permission, str) else permission.name
+            matrix = get_permission_matrix(self.org_id)
+            return matrix.has_permission(self.pk, name)
+
         if isinstance(permission, str):
             try:
                 from core.models import Permission
@@ -491,13 +502,15 @@ class OrgUser(models.Model):
         from core.records.models.access import RecordsAccessRequest
         from core.records.models.deletion import RecordsDeletion
 
+        permissions = get_permission_matrix(self.org_id).permissions_of(self.pk)
+
         # profiles
         profiles = OrgUser.objects.filter(org=self.org, locked=True).count()
-        if self.has_permission(PERMISSION_ADMIN_MANAGE_USERS):
+        if PERMISSION_ADMIN_MANAGE_USERS in permissions:
             profiles += OrgUser.objects.filter(org=self.org, accepted=False).count()
 
         # deletion requests
-        if self.has_permission(PERMISSION_ADMIN_MANAGE_RECORD_DELETION_REQUESTS):
+        if PERMISSION_ADMIN_MANAGE_RECORD_DELETION_REQUESTS in permissions:
             record_deletion_requests = RecordsDeletion.objects.filter(
                 requestor__org=self.org, state="re"
             ).count()
@@ -505,7 +518,7 @@ class OrgUser(models.Model):
             record_deletion_requests = 0
 
         # permit requests
-        if self.has_permission(PERMISSION_ADMIN_MANAGE_RECORD_ACCESS_REQUESTS):
+        if PERMISSION_ADMIN_MANAGE_RECORD_ACCESS_REQUESTS in permissions:
             record_permit_requests = RecordsAccessRequest.objects.filter(
                 requestor__org=self.org, state="re"
             ).count()
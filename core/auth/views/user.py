@@ -22,6 +22,7 @@ from core.auth.models import UserProfile
 from core.auth.models.session import CustomSession
 from core.auth.use_cases.user import run_user_login_checks, set_new_password_of_myself
 from core.legal.models.legal_requirement import LegalRequirement
+from core.seedwork.encryption import RSA_KEY_CACHE
 
 
 def strip_scheme(url: str):
@@ -87,6 +88,9 @@ class CustomLoginView(LoginView):
 
 class CustomLogoutView(LogoutView):
     def post(self, *args, **kwargs):
+        user_key = self.request.session.get("user_key")
+        if isinstance(user_key, dict) and "private_key" in user_key:
+            RSA_KEY_CACHE.purge(user_key["private_key"])
         CustomSession.objects.filter(user_id=self.request.user.pk).delete()
         return super().post(*args, **kwargs)
 
@@ -0,0 +1,11 @@
+import pytest
+
+from core.other.logged_path_buffer import LOGGED_PATH_BUFFER
+
+
+@pytest.fixture(autouse=True)
+def clear_logged_path_buffer():
+    # the transaction of a test is never committed, the buffer would keep its
+    # rows and write them during a later test
+    yield
+    LOGGED_PATH_BUFFER.clear()
@@ -1,5 +1,5 @@
 import json
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 from uuid import UUID, uuid4
 
 from django.core.files.base import File as DjangoFile
@@ -238,30 +238,33 @@ class DataSheet(FolderItemMixin, models.Model):
         key = enc_key.decrypt(decryption_key)
         return key.get_key()
 
+    def __get_decrypted_entries(self, user: OrgUser) -> list[Any]:
+        # the entry types have different fields, the abstract base knows none
+        all_entries: list[Any] = []
+        for entry_type in self.ALL_ENTRY_TYPES:
+            all_entries += getattr(self, entry_type).all()
+        encrypted = [e for e in all_entries if e.encrypted_entry]
+        if encrypted:
+            aes_key_record = self.get_aes_key(user)
+            DataSheetEntryEncryptedModelMixin.decrypt_all(encrypted, aes_key_record)
+        return all_entries
+
     def get_entries(self, user: OrgUser):
         entries = {}
-        aes_key_record = self.get_aes_key(user)
-        for entry_type in self.ALL_ENTRY_TYPES:
-            for entry in getattr(self, entry_type).all():
-                if entry.encrypted_entry:
-                    entry.decrypt(aes_key_record=aes_key_record)
-                entries[entry.field.name] = {
-                    "id": entry.id,
-                    "name": entry.field.name,
-                    "type": entry.field.type,
-                    "field": entry.field.pk,
-                    "value": entry.get_raw_value(),
-                }
+        for entry in self.__get_decrypted_entries(user):
+            entries[entry.field.name] = {
+                "id": entry.id,
+                "name": entry.field.name,
+                "type": entry.field.type,
+                "field": entry.field.pk,
+                "value": entry.get_raw_value(),
+            }
         return entries
 
     def get_entries_new(self, user: OrgUser):
         entries = {}
-        aes_key_record = self.get_aes_key(user)
-        for entry_type in self.ALL_ENTRY_TYPES:
-            for entry in getattr(self, entry_type).all():
-                if entry.encrypted_entry:
-                    entry.decrypt(aes_key_record=aes_key_record)
-                entries[str(entry.field.uuid)] = entry.get_raw_value()
+        for entry in self.__get_decrypted_entries(user):
+            entries[str(entry.field.uuid)] = entry.get_raw_value()
         return entries
 
 
@@ -293,10 +296,10 @@ class DataSheetEntryEncryptedModelMixin(EncryptedModelMixin):
     def encrypt(
         self, user: Optional[OrgUser] = None, private_key_user=None, aes_key_record=None
     ):
-        data_sheet: DataSheet = self.record  # type: ignore
         if user and not private_key_user:
             private_key_user = user.keyring.get_private_key()
         if user and private_key_user:
+            data_sheet: DataSheet = self.record  # type: ignore
             key = data_sheet.get_aes_key(user=user, private_key_user=private_key_user)
         elif aes_key_record:
             key = aes_key_record
@@ -203,19 +203,37 @@ class RecordField(models.Model):
         model = apps.get_model("core", name)
         return model
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         raise NotImplementedError()
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         raise NotImplementedError()
 
     def create_or_update_entry(
-        self, user: OrgUser, record_id: int, value: str | list[str]
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
     ):
+        # only encrypted fields need the key of the data sheet, that is why the
+        # others can ignore it
         if self.entries.filter(record_id=record_id).exists():
-            self.update_entry(user, record_id, value)
+            self.update_entry(user, record_id, value, aes_key_record)
         else:
-            self.create_entry(user, record_id, value)
+            self.create_entry(user, record_id, value, aes_key_record)
 
     def delete_entry(self, record_id: int):
         raise NotImplementedError()
@@ -256,7 +274,13 @@ class DataSheetStateField(RecordField):
                 "The value is not in the options: {}.".format(self.options)
             )
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         from .data_sheet import DataSheetStateEntry
 
         assert isinstance(value, str)
@@ -266,7 +290,13 @@ class DataSheetStateField(RecordField):
             entry.closed_at = timezone.now()
         entry.save()
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         assert isinstance(value, str)
         self.validate_value(value)
         entry = self.entries.get(record_id=record_id)
@@ -322,7 +352,13 @@ class DataSheetUsersField(RecordField):
 
         return [{"name": i.name, "id": i.pk} for i in users]
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         from .data_sheet import DataSheetUsersEntry
 
         assert isinstance(value, list), value
@@ -343,7 +379,13 @@ class DataSheetUsersField(RecordField):
                     folder.grant_access(u, user)
             r.save(folder)
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         entry = self.entries.get(record_id=record_id)
         entry.value.set(value)  # type: ignore
         self.do_share_keys(user, entry)
@@ -388,7 +430,13 @@ class DataSheetSelectField(RecordField):
                 "The value is not in the options: {}.".format(self.options)
             )
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         from .data_sheet import DataSheetSelectEntry
 
         self.validate_value(value)
@@ -396,7 +444,13 @@ class DataSheetSelectField(RecordField):
         entry = DataSheetSelectEntry(field_id=self.pk, record_id=record_id, value=value)
         entry.save()
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         self.validate_value(value)
         entry = self.entries.get(record_id=record_id)
         assert isinstance(value, str)
@@ -443,7 +497,13 @@ class DataSheetMultipleField(RecordField):
                 "The value is not in the options: {}.".format(self.options)
             )
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         from .data_sheet import DataSheetMultipleEntry
 
         self.validate_value(value)
@@ -452,7 +512,13 @@ class DataSheetMultipleField(RecordField):
         )
         entry.save()
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         self.validate_value(value)
         entry = self.entries.get(record_id=record_id)
         entry.value = value
@@ -500,21 +566,39 @@ class DataSheetEncryptedSelectField(RecordField):
                 "The value is not in the options: {}.".format(self.options)
             )
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         from .data_sheet import DataSheetEncryptedSelectEntry
 
         self.validate_value(value)
         entry = DataSheetEncryptedSelectEntry(
             field_id=self.pk, record_id=record_id, value=value
         )
-        entry.encrypt(user=user)
+        if aes_key_record is not None:
+            entry.encrypt(aes_key_record=aes_key_record)
+        else:
+            entry.encrypt(user=user)
         entry.save()
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         self.validate_value(value)
         entry = self.entries.get(record_id=record_id)
         entry.value = value  # type: ignore
-        entry.encrypt(user=user)
+        if aes_key_record is not None:
+            entry.encrypt(aes_key_record=aes_key_record)
+        else:
+            entry.encrypt(user=user)
         entry.save()
 
     def delete_entry(self, record_id: int):
@@ -553,10 +637,22 @@ class DataSheetEncryptedFileField(RecordField):
     def __str__(self):
         return "recordEncryptedFileField: {}; name: {};".format(self.pk, self.name)
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         raise Exception("this is not supported")
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         raise Exception("this is not supported")
 
     def delete_old_entries(self, record_id: int):
@@ -632,7 +728,13 @@ class DataSheetStandardField(RecordField):
     def validate_value(self, value: str | list[str]):
         assert isinstance(value, str)
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         from .data_sheet import DataSheetStandardEntry
 
         self.validate_value(value)
@@ -642,7 +744,13 @@ class DataSheetStandardField(RecordField):
         )
         entry.save()
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         self.validate_value(value)
         entry = self.entries.get(record_id=record_id)
         assert isinstance(value, str)
@@ -688,21 +796,39 @@ class DataSheetEncryptedStandardField(RecordField):
     def validate_value(self, value: str | list[str]):
         assert isinstance(value, str)
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         from .data_sheet import DataSheetEncryptedStandardEntry
 
         self.validate_value(value)
         entry = DataSheetEncryptedStandardEntry(
             field_id=self.pk, record_id=record_id, value=value
         )
-        entry.encrypt(user=user)
+        if aes_key_record is not None:
+            entry.encrypt(aes_key_record=aes_key_record)
+        else:
+            entry.encrypt(user=user)
         entry.save()
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         self.validate_value(value)
         entry = self.entries.get(record_id=record_id)
         entry.value = value  # type: ignore
-        entry.encrypt(user)
+        if aes_key_record is not None:
+            entry.encrypt(aes_key_record=aes_key_record)
+        else:
+            entry.encrypt(user=user)
         entry.save()
 
     def delete_entry(self, record_id: int):
@@ -746,7 +872,13 @@ class DataSheetStatisticField(RecordField):
     def validate_value(self, value: str | list[str]):
         assert isinstance(value, str)
 
-    def create_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def create_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         from .data_sheet import DataSheetStatisticEntry
 
         self.validate_value(value)
@@ -756,7 +888,13 @@ class DataSheetStatisticField(RecordField):
         )
         entry.save()
 
-    def update_entry(self, user: OrgUser, record_id: int, value: str | list[str]):
+    def update_entry(
+        self,
+        user: OrgUser,
+        record_id: int,
+        value: str | list[str],
+        aes_key_record: str | None = None,
+    ):
         self.validate_value(value)
         entry = self.entries.get(record_id=record_id)
         assert isinstance(value, str)
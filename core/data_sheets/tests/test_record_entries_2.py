@@ -5,6 +5,7 @@ import sys
 import pytest
 from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.management import call_command
 from django.test import Client
 
 from core.auth.models import OrgUser
@@ -33,6 +34,7 @@ from core.data_sheets.models.template import (
     DataSheetStatisticField,
     DataSheetUsersField,
 )
+from core.data_sheets.use_cases.entry import create_or_update_entry, update_entries
 from core.folders.infrastructure.folder_repository import DjangoFolderRepository
 from core.models import UserProfile
 from core.org.models.org import Org
@@ -41,6 +43,8 @@ from core.permissions.static import (
     PERMISSION_ADMIN_MANAGE_RECORD_TEMPLATES,
     PERMISSION_RECORDS_ADD_RECORD,
 )
+from core.records.models import RecordsRecord
+from core.seedwork.use_case_layer import UseCaseError
 from core.tests import test_helpers
 
 
@@ -936,3 +940,146 @@ def test_record_updated_on_delete(db, post, standard_field, standard_entry, reco
     assert response.status_code == 200
     record.refresh_from_db()
     assert record.updated > updated
+
+
+def test_update_entries(
+    db,
+    record,
+    auth_client,
+    standard_entry,
+    enc_standard_field,
+    select_field,
+    state_field,
+    statistic_entry,
+    aes_key_record,
+):
+    data = {
+        "action": "data_sheets/update_entries",
+        "record_id": record.pk,
+        "entries": {
+            str(standard_entry.field.uuid): "Hallo 2",
+            str(enc_standard_field.uuid): "Secret",
+            str(select_field.uuid): "Option 2",
+            str(state_field.uuid): "Closed",
+            str(statistic_entry.field.uuid): None,
+        },
+    }
+    response = auth_client.post(
+        "/api/command/", json.dumps(data), content_type="application/json"
+    )
+    assert response.status_code == 200
+    assert DataSheetStandardEntry.objects.get().value == "Hallo 2"
+    assert DataSheetSelectEntry.objects.get().value == "Option 2"
+    assert DataSheetStateEntry.objects.get().closed_at is not None
+    assert DataSheetStatisticEntry.objects.count() == 0
+    entry = DataSheetEncryptedStandardEntry.objects.get()
+    entry.decrypt(aes_key_record=aes_key_record)
+    assert entry.value == "Secret"
+
+
+def test_update_entries_is_atomic(
+    db, record, auth_client, standard_field, select_field
+):
+    data = {
+        "action": "data_sheets/update_entries",
+        "record_id": record.pk,
+        "entries": {
+            str(standard_field.uuid): "Hallo",
+            str(select_field.uuid): "Not an option",
+        },
+    }
+    response = auth_client.post(
+        "/api/command/", json.dumps(data), content_type="application/json"
+    )
+    assert response.status_code == 400
+    assert DataSheetStandardEntry.objects.count() == 0
+
+
+def test_update_entries_encrypts_with_the_key_of_the_sheet(
+    db, record, enc_standard_field, enc_select_field, aes_key_record
+):
+    org_user = OrgUser.objects.get(user__email="dummy@law-orga.de")
+    entries = {enc_standard_field.uuid: "Secret", enc_select_field.uuid: "Option 1"}
+
+    update_entries(org_user, record.pk, entries)
+    update_entries(org_user, record.pk, {enc_standard_field.uuid: "Secret 2"})
+
+    entry = DataSheetEncryptedStandardEntry.objects.get()
+    entry.decrypt(aes_key_record=aes_key_record)
+    assert entry.value == "Secret 2"
+    select = DataSheetEncryptedSelectEntry.objects.get()
+    select.decrypt(aes_key_record=aes_key_record)
+    assert select.value == "Option 1"
+
+
+def test_update_entries_rejects_file_fields(db, record, file_field):
+    org_user = OrgUser.objects.get(user__email="dummy@law-orga.de")
+
+    with pytest.raises(UseCaseError):
+        update_entries(org_user, record.pk, {file_field.uuid: "test.txt"})
+
+
+@pytest.fixture
+def records_record(record, template):
+    records_record = RecordsRecord.objects.create(
+        name="AZ-001", org=template.org, folder_uuid=record.folder_uuid
+    )
+    records_record.set_attributes([record])
+    records_record.save()
+    yield records_record
+
+
+def test_entry_change_patches_record_attributes(
+    db, record, records_record, standard_entry, post
+):
+    data = {
+        "value": "Hallo 2",
+        "action": "data_sheets/create_or_update_entry",
+        "record_id": record.pk,
+        "field_id": standard_entry.field.uuid,
+    }
+    response = post(data)
+    assert response.status_code == 200
+    records_record.refresh_from_db()
+    attributes = json.loads(records_record.attributes)
+    assert attributes[standard_entry.field.name] == "Hallo 2"
+    assert attributes["sheet_uuids"] == [str(record.uuid)]
+
+    data = {
+        "action": "data_sheets/delete_entry",
+        "record_id": record.pk,
+        "field_id": standard_entry.field.uuid,
+    }
+    response = post(data)
+    assert response.status_code == 200
+    records_record.refresh_from_db()
+    assert standard_entry.field.name not in json.loads(records_record.attributes)
+
+
+def test_rebuild_record_attributes(db, record, records_record, standard_entry):
+    RecordsRecord.objects.filter(pk=records_record.pk).update(attributes="{}")
+    call_command(
+        "rebuild_record_attributes", records_record.org_id, stdout=io.StringIO()
+    )
+    records_record.refresh_from_db()
+    attributes = json.loads(records_record.attributes)
+    assert attributes[standard_entry.field.name] == "test text"
+    assert "test text" in records_record.search_text
+
+
+def test_entry_changes_keep_the_attributes_of_other_fields(
+    db, record, records_record, standard_field, select_field
+):
+    org_user = OrgUser.objects.get(user__email="dummy@law-orga.de")
+    standard_field.name = "Standard"
+    standard_field.save()
+    select_field.name = "Select"
+    select_field.save()
+
+    create_or_update_entry(org_user, standard_field.uuid, record.pk, "Hallo")
+    create_or_update_entry(org_user, select_field.uuid, record.pk, "Option 1")
+
+    records_record.refresh_from_db()
+    attributes = json.loads(records_record.attributes)
+    assert attributes[standard_field.name] == "Hallo"
+    assert attributes[select_field.name] == "Option 1"
@@ -5,7 +5,7 @@ from core.auth.models import OrgUser
 from core.data_sheets.models import DataSheet
 from core.folders.domain.aggregates.folder import Folder
 from core.folders.domain.repositories.folder import FolderRepository
-from core.permissions.models import Permission
+from core.permissions.matrix import get_permission_matrix
 from core.permissions.static import PERMISSION_RECORDS_ACCESS_ALL_RECORDS
 from core.seedwork.use_case_layer import use_case
 
@@ -22,11 +22,12 @@ def deliver_access_to_users_who_should_have_access(
     ).select_related("template")
     records_2 = list(records_1)
 
-    permission = Permission.objects.get(name=PERMISSION_RECORDS_ACCESS_ALL_RECORDS)
+    matrix = get_permission_matrix(__actor.org_id)
+    should_access_ids = matrix.users_with(PERMISSION_RECORDS_ACCESS_ALL_RECORDS)
 
     users_1 = OrgUser.objects.filter(org_id=__actor.org_id)
     users_2 = list(users_1)
-    users_3 = [u for u in users_2 if u.has_permission(permission)]
+    users_3 = [u for u in users_2 if u.pk in should_access_ids]
 
     folders: dict[UUID, Folder] = r.get_dict(__actor.org_id)
     changed_folders: set[Folder] = set()
@@ -2,15 +2,17 @@ from uuid import UUID
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.files.uploadedfile import UploadedFile
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 from core.auth.models.org_user import OrgUser
 from core.data_sheets.models.data_sheet import DataSheet
+from core.data_sheets.models.template import RecordField
 from core.data_sheets.use_cases.finders import (
     find_field_from_uuid,
+    find_fields_from_uuids,
     find_file_field_from_uuid,
-    find_record_from_folder_uuid,
     find_sheets_from_folder_uuid,
+    lock_record_from_folder_uuid,
     sheet_from_id,
 )
 from core.seedwork.use_case_layer import UseCaseError, use_case
@@ -19,12 +21,33 @@ MAX_UPLOAD_FILENAME_LENGTH = 80
 
 
 def update_record_in_folder(__actor: OrgUser, folder_uuid: UUID):
-    record = find_record_from_folder_uuid(__actor, folder_uuid)
-    if not record:
-        return
-    sheets = find_sheets_from_folder_uuid(__actor, folder_uuid)
-    record.set_attributes(sheets)
-    record.save()
+    with transaction.atomic():
+        record = lock_record_from_folder_uuid(__actor, folder_uuid)
+        if not record:
+            return
+        sheets = find_sheets_from_folder_uuid(__actor, folder_uuid)
+        record.set_attributes(sheets)
+        record.save()
+
+
+def patch_record_in_folder(__actor: OrgUser, sheet: DataSheet, field: RecordField):
+    # the frontend saves every field with its own request, the lock keeps two
+    # of them from writing the attributes they read before the other one saved
+    with transaction.atomic():
+        record = lock_record_from_folder_uuid(__actor, sheet.folder_uuid)
+        if not record:
+            return
+        # encrypted entries are not part of the attributes of the record
+        if field.encrypted == "Yes":
+            record.update_timestamps()
+            record.save()
+            return
+        entry = field.entries.filter(record_id=sheet.pk).first()
+        value = entry.get_value() if entry else None
+        if not record.patch_attribute(sheet, field.name, value):
+            sheets = find_sheets_from_folder_uuid(__actor, sheet.folder_uuid)
+            record.set_attributes(sheets)
+        record.save()
 
 
 def set_sheet_updated_time(sheet: DataSheet):
@@ -57,7 +80,7 @@ def create_entry(
     field.create_entry(__actor, record_id, value)
     sheet = sheet_from_id(__actor, record_id)
     set_sheet_updated_time(sheet)
-    update_record_in_folder(__actor, sheet.folder_uuid)
+    patch_record_in_folder(__actor, sheet, field)
 
 
 @use_case
@@ -68,7 +91,7 @@ def update_entry(
     field.update_entry(__actor, record_id, value)
     sheet = sheet_from_id(__actor, record_id)
     set_sheet_updated_time(sheet)
-    update_record_in_folder(__actor, sheet.folder_uuid)
+    patch_record_in_folder(__actor, sheet, field)
 
 
 @use_case
@@ -84,7 +107,7 @@ def create_or_update_entry(
         )
     sheet = sheet_from_id(__actor, record_id)
     set_sheet_updated_time(sheet)
-    update_record_in_folder(__actor, sheet.folder_uuid)
+    patch_record_in_folder(__actor, sheet, field)
 
 
 @use_case
@@ -93,4 +116,40 @@ def delete_entry(__actor: OrgUser, field_id: UUID, record_id: int):
     field.delete_entry(record_id)
     sheet = sheet_from_id(__actor, record_id)
     set_sheet_updated_time(sheet)
+    patch_record_in_folder(__actor, sheet, field)
+
+
+@use_case
+def update_entries(
+    __actor: OrgUser, record_id: int, entries: dict[UUID, str | list[str] | None]
+):
+    """
+    Saves a whole data sheet form at once. A value of None deletes the entry of
+    that field. The key of the sheet is unwrapped once for all encrypted fields
+    and the record attributes are only computed once at the end.
+    """
+    sheet = sheet_from_id(__actor, record_id)
+    fields = find_fields_from_uuids(__actor, list(entries.keys()), sheet.template_id)
+
+    aes_key_record = None
+    if any(f.encrypted == "Yes" and entries[f.uuid] is not None for f in fields):
+        aes_key_record = sheet.get_aes_key(__actor)
+
+    try:
+        with transaction.atomic():
+            for field in fields:
+                value = entries[field.uuid]
+                if value is None:
+                    try:
+                        field.delete_entry(sheet.pk)
+                    except ObjectDoesNotExist:
+                        pass
+                    continue
+                field.create_or_update_entry(__actor, sheet.pk, value, aes_key_record)
+            set_sheet_updated_time(sheet)
+    except IntegrityError, ObjectDoesNotExist:
+        raise UseCaseError(
+            "Error: Data Sheet might be deleted. Please reload the page."
+        )
+
     update_record_in_folder(__actor, sheet.folder_uuid)
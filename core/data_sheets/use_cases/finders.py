@@ -7,7 +7,7 @@ from core.data_sheets.models import DataSheet, DataSheetTemplate
 from core.data_sheets.models.data_sheet import DataSheetEncryptedFileField
 from core.data_sheets.models.template import RecordField
 from core.records.models.record import RecordsRecord
-from core.seedwork.use_case_layer import finder_function
+from core.seedwork.use_case_layer import UseCaseError, finder_function
 
 
 @finder_function
@@ -35,6 +35,22 @@ def find_field_from_uuid(actor: OrgUser, uuid: UUID) -> RecordField:
     raise ObjectDoesNotExist()
 
 
+@finder_function
+def find_fields_from_uuids(
+    actor: OrgUser, uuids: list[UUID], template_id: int
+) -> list[RecordField]:
+    fields: list[RecordField] = []
+    for subclass in RecordField.__subclasses__():
+        fields += subclass.objects.filter(  # type: ignore
+            uuid__in=uuids, template_id=template_id, template__org__id=actor.org_id
+        )
+    if len(fields) != len(set(uuids)):
+        raise ObjectDoesNotExist()
+    if any(isinstance(f, DataSheetEncryptedFileField) for f in fields):
+        raise UseCaseError("Files can not be saved together with the other entries.")
+    return fields
+
+
 @finder_function
 def find_file_field_from_uuid(
     actor: OrgUser, uuid: UUID
@@ -54,6 +70,15 @@ def find_record_from_folder_uuid(actor: OrgUser, v: UUID) -> RecordsRecord | Non
     return RecordsRecord.objects.filter(folder_uuid=v, org_id=actor.org_id).first()
 
 
+@finder_function
+def lock_record_from_folder_uuid(actor: OrgUser, v: UUID) -> RecordsRecord | None:
+    return (
+        RecordsRecord.objects.select_for_update()
+        .filter(folder_uuid=v, org_id=actor.org_id)
+        .first()
+    )
+
+
 @finder_function
 def find_sheets_from_folder_uuid(actor: OrgUser, folder_uuid: UUID) -> list[DataSheet]:
     return list(
@@ -6,6 +6,7 @@ from core.data_sheets.use_cases.entry import (
     create_file_entry,
     create_or_update_entry,
     delete_entry,
+    update_entries,
     update_entry,
 )
 from core.data_sheets.use_cases.sheet import change_sheet_name, delete_data_sheet
@@ -28,6 +29,7 @@ USECASES = {
     "data_sheets/create_or_update_entry": create_or_update_entry,
     "data_sheets/create_entry": create_entry,
     "data_sheets/update_entry": update_entry,
+    "data_sheets/update_entries": update_entries,
     "data_sheets/create_file_entry": create_file_entry,
     "data_sheets/delete_entry": delete_entry,
     "data_sheets/delete_data_sheet": delete_data_sheet,
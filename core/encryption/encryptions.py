@@ -1,5 +1,8 @@
 from core.encryption.infrastructure.asymmetric_encryptions import AsymmetricEncryptionV1
-from core.encryption.infrastructure.symmetric_encryptions import SymmetricEncryptionV1
+from core.encryption.infrastructure.symmetric_encryptions import (
+    SymmetricEncryptionV1,
+    SymmetricEncryptionV2,
+)
 from core.encryption.tests.encryptions import (
     AsymmetricEncryptionTest1,
     AsymmetricEncryptionTest2,
@@ -11,6 +14,7 @@ ENCRYPTIONS = {
     # prod
     AsymmetricEncryptionV1.VERSION: AsymmetricEncryptionV1,
     SymmetricEncryptionV1.VERSION: SymmetricEncryptionV1,
+    SymmetricEncryptionV2.VERSION: SymmetricEncryptionV2,
     # test
     AsymmetricEncryptionTest1.VERSION: AsymmetricEncryptionTest1,
     AsymmetricEncryptionTest2.VERSION: AsymmetricEncryptionTest2,
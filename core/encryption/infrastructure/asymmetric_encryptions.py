@@ -8,6 +8,7 @@ from core.encryption.value_objects.encryption import (
     AsymmetricEncryption,
     EncryptionDecryptionError,
 )
+from core.seedwork.encryption import RSA_KEY_CACHE
 
 
 class AsymmetricEncryptionV1(AsymmetricEncryption):
@@ -45,10 +46,7 @@ class AsymmetricEncryptionV1(AsymmetricEncryption):
     def encrypt(self, data: bytes) -> bytes:
         assert self.__public_key is not None
 
-        bytes_public_key = self.__public_key.encode("utf-8")
-        object_public_key: rsa.RSAPublicKey = serialization.load_pem_public_key(  # type: ignore
-            bytes_public_key, backend=default_backend()
-        )
+        object_public_key = RSA_KEY_CACHE.load_public_key(self.__public_key)
 
         enc_key = object_public_key.encrypt(
             data,
@@ -64,10 +62,7 @@ class AsymmetricEncryptionV1(AsymmetricEncryption):
     def decrypt(self, enc_data: bytes) -> bytes:
         assert self.__private_key is not None
 
-        bytes_private_key = self.__private_key.encode("utf-8")
-        object_private_key: rsa.RSAPrivateKey = serialization.load_pem_private_key(  # type: ignore
-            bytes_private_key, None, backend=default_backend()
-        )
+        object_private_key = RSA_KEY_CACHE.load_private_key(self.__private_key)
 
         try:
             data = object_private_key.decrypt(
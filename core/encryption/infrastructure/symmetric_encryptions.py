@@ -5,6 +5,8 @@ from hashlib import sha3_256
 
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad, unpad
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from core.encryption.value_objects.encryption import (
     EncryptionDecryptionError,
@@ -19,6 +21,7 @@ class SymmetricEncryptionV1(SymmetricEncryption):
         assert isinstance(key, str)
 
         self.__key = key
+        self.__hashed_key = sha3_256(bytes(key, "utf-8")).digest()
         super().__init__()
 
     @classmethod
@@ -33,9 +36,7 @@ class SymmetricEncryptionV1(SymmetricEncryption):
         assert self.__key is not None
 
         iv = os.urandom(16)
-        bytes_key = bytes(self.__key, "utf-8")
-        hashed_key_bytes = sha3_256(bytes_key).digest()
-        cipher = AES.new(hashed_key_bytes, AES.MODE_CBC, iv)
+        cipher = AES.new(self.__hashed_key, AES.MODE_CBC, iv)
         enc_data = cipher.encrypt(pad(data, AES.block_size))
         iv_enc_data = iv + enc_data
         return iv_enc_data
@@ -45,12 +46,51 @@ class SymmetricEncryptionV1(SymmetricEncryption):
 
         iv = enc_data[:16]
         encrypted = enc_data[16:]
-        bytes_key = bytes(self.__key, "utf-8")
-        hashed_key_bytes = sha3_256(bytes_key).digest()
-        cipher = AES.new(hashed_key_bytes, AES.MODE_CBC, iv)
+        cipher = AES.new(self.__hashed_key, AES.MODE_CBC, iv)
         try:
             decrypted = cipher.decrypt(encrypted)
         except Exception as e:
             raise EncryptionDecryptionError(e)
         data = unpad(decrypted, AES.block_size)
         return data
+
+
+class SymmetricEncryptionV2(SymmetricEncryption):
+    """
+    AES GCM, the data is encrypted and authenticated in one pass. The keys
+    look the same as the keys of V1 and are hashed the same way.
+    """
+
+    VERSION = "S2"
+    NONCE_SIZE = 12
+
+    def __init__(self, key: str):
+        assert isinstance(key, str)
+
+        self.__key = key
+        self.__cipher = AESGCM(sha3_256(bytes(key, "utf-8")).digest())
+        super().__init__()
+
+    @classmethod
+    def generate_key(cls) -> tuple[str, str]:
+        password_characters = string.ascii_letters + string.digits + string.punctuation
+        return (
+            "".join(secrets.choice(password_characters) for _ in range(64)),
+            cls.VERSION,
+        )
+
+    def encrypt(self, data: bytes) -> bytes:
+        assert self.__key is not None
+
+        nonce = os.urandom(self.NONCE_SIZE)
+        return nonce + self.__cipher.encrypt(nonce, data, None)
+
+    def decrypt(self, enc_data: bytes) -> bytes:
+        assert self.__key is not None
+
+        nonce = enc_data[: self.NONCE_SIZE]
+        encrypted = enc_data[self.NONCE_SIZE :]
+        try:
+            return self.__cipher.decrypt(nonce, encrypted, None)
+        except InvalidTag as e:
+            raise EncryptionDecryptionError(e)
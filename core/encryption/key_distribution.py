@@ -0,0 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence, TypeVar
+
+from django.conf import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def distribute(lock: Callable[[T], R], receivers: Sequence[T]) -> list[R]:
+    """
+    Locks one key for many receivers, e.g. the org key for every user of an
+    org. The public key operations run on a thread pool and the results keep
+    the order of the receivers, so that the caller can store them with one
+    bulk write. Parsed public keys are shared through the rsa key cache.
+    """
+    workers = max(1, min(settings.KEY_DISTRIBUTION_WORKERS, len(receivers)))
+    if workers == 1:
+        return [lock(r) for r in receivers]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lock, receivers))
@@ -18,6 +18,7 @@ from core.encryption.value_objects.symmetric_key import (
     SymmetricKey,
 )
 from core.seedwork.domain_layer import DomainError
+from core.seedwork.encryption import RSA_KEY_CACHE
 
 from seedwork.functional import list_filter
 
@@ -215,6 +216,8 @@ class Keyring(models.Model):
 
     def invalidate(self, new_password: str):
         self.load()
+        if self.decryption_key is not None:
+            RSA_KEY_CACHE.purge(self.decryption_key.get_private_key())
         key = AsymmetricKey.generate(AsymmetricEncryptionV1)
         u1 = UserKey(key=key)
         u2 = u1.encrypt_self(new_password)
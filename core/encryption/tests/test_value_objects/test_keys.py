@@ -98,3 +98,21 @@ def test_equality_false(a_key, s_key):
     assert not s_key == a_key
     assert not a_key == "test"
     assert not s_key == "test"
+
+
+def test_lock_and_unlock_many(s_key):
+    boxes = [OpenBox(data=b"Test 1"), OpenBox(data=b""), OpenBox(data=b"Test 3")]
+    locked_boxes = s_key.lock_many(boxes)
+    assert len(locked_boxes) == 3
+    assert s_key.unlock_many(locked_boxes) == boxes
+    assert [s_key.unlock(b) for b in locked_boxes] == boxes
+
+
+def test_unlock_many_checks_the_origin(s_key, a_key, box):
+    locked_box = a_key.lock(box)
+    with pytest.raises(ValueError):
+        s_key.unlock_many([locked_box])
+
+
+def test_symmetric_key_reuses_its_encryption(s_key):
+    assert s_key.get_encryption() is s_key.get_encryption()
@@ -175,6 +175,9 @@ class EncryptedAsymmetricKey(Key):
     def unlock(self, box: LockedBox) -> OpenBox:
         raise ValueError("This key is encrypted and can not unlock a box.")
 
+    def unlock_many(self, boxes: list[LockedBox]) -> list[OpenBox]:
+        raise ValueError("This key is encrypted and can not unlock a box.")
+
     def decrypt(self, unlock_key: Union[AsymmetricKey, SymmetricKey]) -> AsymmetricKey:
         if self.__enc_private_key is None:
             raise ValueError("The private key of this key is of type 'None'.")
@@ -24,6 +24,12 @@ class Encryption:
     def decrypt(self, enc_data: bytes) -> bytes:
         raise NotImplementedError()
 
+    def encrypt_many(self, data: list[bytes]) -> list[bytes]:
+        return [self.encrypt(d) for d in data]
+
+    def decrypt_many(self, enc_data: list[bytes]) -> list[bytes]:
+        return [self.decrypt(d) for d in enc_data]
+
 
 class AsymmetricEncryption(Encryption):
     ENCRYPTION_TYPE: Literal["ASYMMETRIC"] = "ASYMMETRIC"
@@ -32,13 +32,28 @@ class Key(abc.ABC):
         enc_data = encryption.encrypt(box.value)
         return LockedBox(enc_data=enc_data, key_origin=self.origin)
 
-    def unlock(self, box: LockedBox) -> OpenBox:
+    def lock_many(self, boxes: list[OpenBox]) -> list[LockedBox]:
+        encryption = self.get_encryption()
+        enc_data = encryption.encrypt_many([box.value for box in boxes])
+        return [LockedBox(enc_data=d, key_origin=self.origin) for d in enc_data]
+
+    def __check_origin(self, box: LockedBox) -> None:
         if self.origin != box.key_origin:
             raise ValueError(
                 "This key can not unlock this box because the encryption versions do not match. '{}' != '{}'.".format(
                     self.origin, box.key_origin
                 )
             )
+
+    def unlock(self, box: LockedBox) -> OpenBox:
+        self.__check_origin(box)
         encryption = self.get_encryption()
         data = encryption.decrypt(box.value)
         return OpenBox(data=data)
+
+    def unlock_many(self, boxes: list[LockedBox]) -> list[OpenBox]:
+        for box in boxes:
+            self.__check_origin(box)
+        encryption = self.get_encryption()
+        data = encryption.decrypt_many([box.value for box in boxes])
+        return [OpenBox(data=d) for d in data]
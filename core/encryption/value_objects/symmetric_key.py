@@ -38,6 +38,7 @@ class SymmetricKey(Key):
         assert origin is not None and key is not None
 
         self.__key = key
+        self.__encryption: Optional[SymmetricEncryption] = None
 
         super().__init__(origin)
 
@@ -48,9 +49,13 @@ class SymmetricKey(Key):
         return self.__key
 
     def get_encryption(self) -> SymmetricEncryption:
-        encryption_class = ENCRYPTIONS[self.origin]
-        assert issubclass(encryption_class, SymmetricEncryption)
-        return encryption_class(key=self.get_key().decode("utf-8"))
+        # the encryption derives the cipher key from the key, which is why one
+        # encryption is reused for everything this key locks or unlocks
+        if self.__encryption is None:
+            encryption_class = ENCRYPTIONS[self.origin]
+            assert issubclass(encryption_class, SymmetricEncryption)
+            self.__encryption = encryption_class(key=self.get_key().decode("utf-8"))
+        return self.__encryption
 
     def encrypt_self(
         self, key: Union["SymmetricKey", "AsymmetricKey", "EncryptedAsymmetricKey"]
@@ -112,8 +117,14 @@ class EncryptedSymmetricKey(Key):
     def unlock(self, box: LockedBox) -> OpenBox:
         raise ValueError("This key is encrypted and can not lock a box.")
 
+    def unlock_many(self, boxes: list[LockedBox]) -> list[OpenBox]:
+        raise ValueError("This key is encrypted and can not lock a box.")
+
     def lock(self, box: OpenBox) -> LockedBox:
         raise ValueError("This key is encrypted and can not lock a box.")
 
+    def lock_many(self, boxes: list[OpenBox]) -> list[LockedBox]:
+        raise ValueError("This key is encrypted and can not lock a box.")
+
     def get_encryption(self) -> Union[SymmetricEncryption, AsymmetricEncryption]:
         raise ValueError("This key is encrypted and can not deliver a encryption.")
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from uuid import UUID, uuid4
 
 from django.core.files.storage import default_storage
@@ -6,7 +6,10 @@ from django.core.files.uploadedfile import UploadedFile
 from django.db import models
 
 from core.auth.models import OrgUser
-from core.encryption.infrastructure.symmetric_encryptions import SymmetricEncryptionV1
+from core.encryption.infrastructure.symmetric_encryptions import (
+    SymmetricEncryptionV1,
+    SymmetricEncryptionV2,
+)
 from core.encryption.value_objects.symmetric_key import (
     EncryptedSymmetricKey,
     SymmetricKey,
@@ -96,9 +99,17 @@ class EncryptedRecordDocument(FolderItemMixin, models.Model):
         self.name = name
         self.renamed(collector)
 
+    @property
+    def has_authenticated_encryption(self) -> bool:
+        # files of S2 keys are stored in the authenticated aes gcm layout
+        return (
+            self.key is not None
+            and self.key.get("origin") == SymmetricEncryptionV2.VERSION
+        )
+
     def generate_key(self, user: OrgUser):
         assert self.folder is not None and self.key is None
-        key = SymmetricKey.generate(SymmetricEncryptionV1)
+        key = SymmetricKey.generate(SymmetricEncryptionV2)
         lock_key = self.folder.get_encryption_key(requestor=user)
         enc_key = EncryptedSymmetricKey.create(key, lock_key)
         self.key = enc_key.as_dict()
@@ -120,14 +131,51 @@ class EncryptedRecordDocument(FolderItemMixin, models.Model):
         return key.get_key()
 
     def upload(self, file: UploadedFile, by: OrgUser):
+        self.prepare_upload(file, by)()
+
+    def prepare_upload(self, file: UploadedFile, by: OrgUser) -> Callable[[], None]:
+        # the key is unlocked right away, the returned function only encrypts
+        # and stores the file and can therefore run on another thread
         key = self.__get_key(by)
         location = self.__get_file_key()
-        encrypt_and_upload_file(file, location, key)
+        authenticated = self.has_authenticated_encryption
+        return lambda: encrypt_and_upload_file(file, location, key, authenticated)
 
     def download(self, by: OrgUser):
         key = self.__get_key(by)
         location = self.__get_file_key()
-        return download_and_decrypt_file(location, key)
+        return download_and_decrypt_file(
+            location, key, self.has_authenticated_encryption
+        )
+
+    def reencrypt(self, by: OrgUser) -> str | None:
+        """
+        Moves a file of an S1 key to a new S2 key. The file is encrypted again
+        into a new location, the old location is returned so that it can be
+        deleted once the new key and location are saved. If the upload fails
+        the new location is deleted again.
+        """
+        assert self.key is not None
+        if self.key.get("origin") != SymmetricEncryptionV1.VERSION:
+            return None
+
+        old_location = self.__get_file_key()
+        old_key = self.__get_key(by)
+        self.key = None
+        self.generate_key(by)
+        if not self.exists:
+            return None
+
+        file = download_and_decrypt_file(old_location, old_key)
+        self.location = ""
+        self.set_location()
+        new_location = self.__get_file_key()
+        try:
+            self.prepare_upload(file, by)()
+        except Exception:
+            default_storage.delete(new_location)
+            raise
+        return old_location
 
     def delete_on_cloud(self):
         key = self.__get_file_key()
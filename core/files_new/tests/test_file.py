@@ -1,4 +1,21 @@
+import os
+
 import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from core.encryption.infrastructure.symmetric_encryptions import SymmetricEncryptionV1
+from core.encryption.value_objects.symmetric_key import (
+    EncryptedSymmetricKey,
+    SymmetricKey,
+)
+from core.files_new.models import EncryptedRecordDocument
+from core.files_new.models import file as file_module
+from core.files_new.use_cases.file import upload_multiple_files
+from core.folders.infrastructure.folder_repository import DjangoFolderRepository
+from core.tests import test_helpers
+from messagebus.domain.collector import EventCollector
 
 
 def test_file_upload(file, user, folder):
@@ -19,3 +36,74 @@ def test_file_download(file, user):
     f = file.download(user)
     text = f.read()
     assert b"My Secret Document" in text
+
+
+def test_upload_multiple_files(db, settings):
+    settings.FILES_UPLOAD_WORKERS = 3
+    user = test_helpers.create_org_user()["org_user"]
+    folder = test_helpers.create_raw_folder(user)
+    DjangoFolderRepository().save(folder)
+    contents = [os.urandom(100 * 1024 + i) for i in range(4)]
+    files = [
+        SimpleUploadedFile(f"scan-{i}.pdf", content)
+        for i, content in enumerate(contents)
+    ]
+
+    upload_multiple_files(user, files, folder.uuid)
+
+    documents = EncryptedRecordDocument.objects.filter(folder_uuid=folder.uuid)
+    assert documents.count() == 4
+    for document in documents:
+        index = int(document.name[5])
+        assert document.download(user).read() == contents[index]
+
+
+def test_new_files_use_authenticated_encryption(file, user):
+    assert file.has_authenticated_encryption
+
+
+def create_s1_document(user, content: bytes) -> EncryptedRecordDocument:
+    folder = test_helpers.create_raw_folder(user)
+    DjangoFolderRepository().save(folder)
+    document = EncryptedRecordDocument.create(
+        SimpleUploadedFile("old.pdf", content), folder, user, EventCollector()
+    )
+    key = SymmetricKey.generate(SymmetricEncryptionV1)
+    lock_key = folder.get_encryption_key(requestor=user)
+    document.key = EncryptedSymmetricKey.create(key, lock_key).as_dict()
+    document.upload(SimpleUploadedFile("old.pdf", content), user)
+    document.save()
+    return document
+
+
+def test_reencrypt_moves_s1_file_to_s2(db):
+    user = test_helpers.create_org_user()["org_user"]
+    content = os.urandom(150 * 1024)
+    document = create_s1_document(user, content)
+    assert not document.has_authenticated_encryption
+
+    old_location = document.reencrypt(user)
+    document.save()
+
+    assert old_location is not None and default_storage.exists(old_location)
+    assert document.has_authenticated_encryption
+    assert document.download(user).read() == content
+    assert document.reencrypt(user) is None
+
+
+def test_reencrypt_deletes_the_new_location_when_the_upload_fails(db, monkeypatch):
+    user = test_helpers.create_org_user()["org_user"]
+    document = create_s1_document(user, b"My Secret Document")
+    old_location = document.location
+
+    def upload_half(file, location, key, authenticated):
+        default_storage.save(location, ContentFile(b"half"))
+        raise OSError("connection lost")
+
+    monkeypatch.setattr(file_module, "encrypt_and_upload_file", upload_half)
+    with pytest.raises(OSError):
+        document.reencrypt(user)
+
+    assert document.location != old_location
+    assert not default_storage.exists("{}.enc".format(document.location))
+    assert default_storage.exists("{}.enc".format(old_location))
@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, cast
 from uuid import UUID
 
+from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
 from django.db.models import Q
@@ -55,10 +58,27 @@ def upload_multiple_files(
             "You can not upload a file into this folder, because you have no access to this folder."
         )
 
+    documents: list[EncryptedRecordDocument] = []
+    uploads: list[Callable[[], None]] = []
     for file in files:
         f = EncryptedRecordDocument.create(file, folder, __actor, collector)
-        f.upload(file, __actor)
-        f.save()
+        documents.append(f)
+        uploads.append(f.prepare_upload(file, __actor))
+
+    # encrypting and uploading is io bound, the database work stays on this thread
+    workers = max(1, min(settings.FILES_UPLOAD_WORKERS, len(uploads)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(upload) for upload in uploads]
+
+    error: Exception | None = None
+    for document, future in zip(documents, futures):
+        exception = future.exception()
+        if exception is not None:
+            error = error or cast(Exception, exception)
+            continue
+        document.save()
+    if error is not None:
+        raise error
 
 
 @use_case
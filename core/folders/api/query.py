@@ -151,7 +151,15 @@ def build_folder(context: Context, folder: Folder, has_access: bool):
     }
 
 
-def build_children(context: Context, folder: Folder, user: OrgUser):
+class Inherited(TypedDict):
+    has_access: bool
+    access: list[dict]
+    group_access: list[dict]
+
+
+def build_children(
+    context: Context, folder: Folder, user: OrgUser, inherited: Inherited
+):
     if folder.uuid not in context["parent_dict"]:
         return []
 
@@ -159,11 +167,11 @@ def build_children(context: Context, folder: Folder, user: OrgUser):
 
     children = []
     for child in child_folders:
-        children.append(build_node(context, child, user))
+        children.append(build_node(context, child, user, inherited))
     return children
 
 
-def build_user_access(context: Context, folder: Folder, source="direct"):
+def build_direct_user_access(context: Context, folder: Folder, source="direct"):
     access = []
     for key in folder.keys:
         user = context["users_dict"].get(key.owner_uuid, None)
@@ -178,6 +186,11 @@ def build_user_access(context: Context, folder: Folder, source="direct"):
                 "actions": ["REVOKE_ACCESS"] if source == "direct" else [],
             }
         )
+    return access
+
+
+def build_user_access(context: Context, folder: Folder, source="direct"):
+    access = build_direct_user_access(context, folder, source)
     if not folder.stop_inherit and folder.parent_uuid is not None:
         parent = context["folders_dict"].get(folder.parent_uuid, None)
         if parent is None:
@@ -186,7 +199,7 @@ def build_user_access(context: Context, folder: Folder, source="direct"):
     return access
 
 
-def build_group_access(context: Context, folder: Folder, source="direct"):
+def build_direct_group_access(context: Context, folder: Folder, source="direct"):
     access = []
     for key in folder.group_keys:
         group = context["groups_dict"].get(key.owner_uuid, None)
@@ -201,6 +214,11 @@ def build_group_access(context: Context, folder: Folder, source="direct"):
                 "actions": ["REVOKE_ACCESS"] if source == "direct" else [],
             }
         )
+    return access
+
+
+def build_group_access(context: Context, folder: Folder, source="direct"):
+    access = build_direct_group_access(context, folder, source)
     if not folder.stop_inherit and folder.parent_uuid is not None:
         access += build_group_access(
             context, context["folders_dict"][folder.parent_uuid], "parent"
@@ -208,14 +226,42 @@ def build_group_access(context: Context, folder: Folder, source="direct"):
     return access
 
 
-def build_node(context: Context, folder: Folder, user: OrgUser):
-    has_access = folder.has_access(user)
+def as_parent_access(access: list[dict]) -> list[dict]:
+    return [{**a, "source": "parent", "actions": []} for a in access]
+
+
+def build_node(
+    context: Context,
+    folder: Folder,
+    user: OrgUser,
+    inherited: Optional[Inherited] = None,
+):
+    # the tree is built top down, every node takes the already computed access
+    # of its parent instead of walking up the parent chain again
+    if folder.stop_inherit:
+        inherited = None
+
+    has_access = folder.has_access_without_parents(user) or (
+        inherited is not None and inherited["has_access"]
+    )
+    access = build_direct_user_access(context, folder)
+    group_access = build_direct_group_access(context, folder)
+    if inherited is not None:
+        access += inherited["access"]
+        group_access += inherited["group_access"]
+
+    passed_on: Inherited = {
+        "has_access": has_access,
+        "access": as_parent_access(access),
+        "group_access": as_parent_access(group_access),
+    }
+
     return {
         "folder": build_folder(context, folder, has_access),
-        "children": build_children(context, folder, user),
+        "children": build_children(context, folder, user, passed_on),
         "content": folder.items if has_access else [],
-        "access": build_user_access(context, folder),
-        "group_access": build_group_access(context, folder),
+        "access": access,
+        "group_access": group_access,
     }
 
 
@@ -2,8 +2,10 @@ from typing import TYPE_CHECKING, Optional, Union
 from uuid import UUID, uuid4
 
 from core.encryption.infrastructure.symmetric_encryptions import SymmetricEncryptionV1
+from core.encryption.key_distribution import distribute
 from core.encryption.value_objects.symmetric_key import SymmetricKey
 from core.folders.domain.aggregates.item import Item
+from core.folders.domain.key_cache import get_folder_key_cache
 from core.folders.domain.value_objects.folder_item import FolderItem
 from core.folders.domain.value_objects.folder_key import (
     EncryptedFolderKeyOfGroup,
@@ -57,6 +59,7 @@ class Folder:
         self.__items = items if items is not None else []
         self.__group_keys = group_keys if group_keys is not None else []
         self.__restricted = restricted
+        self.__key_version = 0
 
     def __str__(self):
         return "folder: {}; name: {};".format(self.uuid, self.name)
@@ -154,6 +157,12 @@ class Folder:
             "stop_inherit": self.stop_inherit,
         }
 
+    def __keys_changed(self):
+        self.__key_version += 1
+        cache = get_folder_key_cache()
+        if cache is not None:
+            cache.invalidate()
+
     def invalidate_keys_of(self, owner: "OrgUser"):
         new_keys: list[EncryptedFolderKeyOfUser] = []
         for key in self.__keys:
@@ -165,6 +174,7 @@ class Folder:
                 new_key = key.invalidate_self()
             new_keys.append(new_key)
         self.__keys = new_keys
+        self.__keys_changed()
 
     def has_invalid_keys(self, owner: "OrgUser") -> bool:
         for key in self.__keys:
@@ -198,6 +208,7 @@ class Folder:
             raise ValueError("The user has no invalid keys for this folder.")
 
         self.__keys = new_keys
+        self.__keys_changed()
 
     def has_access(self, owner: "OrgUser") -> bool:
         return self._has_key(owner)
@@ -241,13 +252,18 @@ class Folder:
             return None
         return self.__parent._get_key(owner)
 
-    def _has_key(self, owner: "OrgUser") -> bool:
+    def has_access_without_parents(self, owner: "OrgUser") -> bool:
         for u_key in self.__keys:
             if u_key.owner_uuid == owner.uuid and u_key.is_valid:
                 return True
         for g_key in self.__group_keys:
             if owner.keyring.has_group_key(g_key.owner_uuid):
                 return True
+        return False
+
+    def _has_key(self, owner: "OrgUser") -> bool:
+        if self.has_access_without_parents(owner):
+            return True
         if self.__parent is None or self.__stop_inherit:
             return False
         return self.__parent._has_key(owner)
@@ -365,6 +381,20 @@ class Folder:
 
         assert requestor is not None
 
+        cache = get_folder_key_cache()
+        if cache is not None:
+            key = cache.get(self.__uuid, requestor.uuid, self.__key_version)
+            if key:
+                return key
+
+        key = self.__find_encryption_key(requestor)
+
+        if key and cache is not None:
+            cache.set(self.__uuid, requestor.uuid, self.__key_version, key)
+
+        return key
+
+    def __find_encryption_key(self, requestor: "OrgUser") -> Optional[SymmetricKey]:
         key = self.__get_encryption_key_from_user_keys(requestor)
         if key:
             return key
@@ -402,6 +432,7 @@ class Folder:
 
         lock_key = parent.get_encryption_key(requestor=by)
         self.__enc_parent_key = parent_key.encrypt_self(lock_key)
+        self.__keys_changed()
 
     def set_parent(self, parent: "Folder", by: "OrgUser"):
         assert by is not None
@@ -419,9 +450,11 @@ class Folder:
 
     def allow_inheritance(self):
         self.__stop_inherit = False
+        self.__keys_changed()
 
     def stop_inheritance(self):
         self.__stop_inherit = True
+        self.__keys_changed()
 
     def __move(self, parent: "Folder", by: "OrgUser"):
         key = self.get_decryption_key(requestor=by)
@@ -434,6 +467,7 @@ class Folder:
 
         lock_key = parent.get_encryption_key(requestor=by)
         self.__enc_parent_key = parent_key.encrypt_self(lock_key)
+        self.__keys_changed()
 
     def move(self, target: "Folder", by: "OrgUser"):
         if not self.has_access(by):
@@ -453,23 +487,27 @@ class Folder:
         self.__move(target, by)
 
     def grant_access(self, to: "OrgUser", by: Optional["OrgUser"] = None):
-        if self.has_access(to):
-            raise DomainError("This user already has access to this folder.")
+        self.grant_access_to_many([to], by)
+
+    def grant_access_to_many(self, to: list["OrgUser"], by: Optional["OrgUser"] = None):
+        for user in to:
+            if self.has_access(user):
+                raise DomainError("This user already has access to this folder.")
 
         key = self._get_encryption_key(by)
 
         assert key is not None
 
-        folder_key = FolderKey(
-            owner_uuid=to.uuid,
-            key=key,
-        )
-
-        lock_key = to.keyring.get_encryption_key()
-
-        enc_key = EncryptedFolderKeyOfUser.create_from_key(folder_key, lock_key)
+        def lock(user: "OrgUser") -> EncryptedFolderKeyOfUser:
+            folder_key = FolderKey(
+                owner_uuid=user.uuid,
+                key=key,
+            )
+            lock_key = user.keyring.get_encryption_key()
+            return EncryptedFolderKeyOfUser.create_from_key(folder_key, lock_key)
 
-        self.__keys.append(enc_key)
+        self.__keys.extend(distribute(lock, to))
+        self.__keys_changed()
 
     def grant_access_to_group(self, group: "Group", by: "OrgUser"):
         if self.has_keys(group):
@@ -489,6 +527,7 @@ class Folder:
         enc_key = EncryptedFolderKeyOfGroup.create_from_key(folder_key, lock_key)
 
         self.__group_keys.append(enc_key)
+        self.__keys_changed()
 
     def revoke_access(self, of: "OrgUser"):
         prev_length = len(self.__keys)
@@ -509,6 +548,7 @@ class Folder:
             )
 
         self.__keys = new_keys
+        self.__keys_changed()
 
     def revoke_access_from_group(self, of: "Group"):
         prev_length = len(self.__keys)
@@ -524,3 +564,4 @@ class Folder:
             raise DomainError("This group has no direct access to this folder.")
 
         self.__group_keys = new_keys
+        self.__keys_changed()
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from uuid import UUID
+
+from core.encryption.value_objects.symmetric_key import SymmetricKey
+
+CacheKey = tuple[UUID, UUID, int]
+
+
+class FolderKeyCache:
+    """
+    Holds decrypted folder keys for the duration of a request so that a folder
+    key is only unwrapped once even if many items of the folder are decrypted.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.__keys: OrderedDict[CacheKey, SymmetricKey] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def get(
+        self, folder_uuid: UUID, requestor_uuid: UUID, version: int
+    ) -> Optional[SymmetricKey]:
+        cache_key = (folder_uuid, requestor_uuid, version)
+        key = self.__keys.get(cache_key)
+        if key is not None:
+            self.__keys.move_to_end(cache_key)
+        return key
+
+    def set(
+        self, folder_uuid: UUID, requestor_uuid: UUID, version: int, key: SymmetricKey
+    ) -> None:
+        cache_key = (folder_uuid, requestor_uuid, version)
+        self.__keys[cache_key] = key
+        self.__keys.move_to_end(cache_key)
+        while len(self.__keys) > self.maxsize:
+            self.__keys.popitem(last=False)
+
+    def invalidate(self) -> None:
+        # the keys of child folders are unlocked through their parents, that is
+        # why a change to one folder invalidates everything that is cached
+        self.__keys.clear()
+
+
+_folder_key_cache: ContextVar[Optional[FolderKeyCache]] = ContextVar(
+    "folder_key_cache", default=None
+)
+
+
+def get_folder_key_cache() -> Optional[FolderKeyCache]:
+    return _folder_key_cache.get()
+
+
+@contextmanager
+def folder_key_cache(maxsize: int = 1024) -> Iterator[FolderKeyCache]:
+    """
+    Activates the folder key cache for everything that runs inside of this
+    block. Nested blocks share the cache of the outermost block.
+    """
+    cache = _folder_key_cache.get()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = FolderKeyCache(maxsize=maxsize)
+    token = _folder_key_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _folder_key_cache.reset(token)
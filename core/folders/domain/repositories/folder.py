@@ -26,6 +26,9 @@ class FolderRepository:
     def save(self, folder: Folder):
         raise NotImplementedError()
 
+    def save_many(self, folders: list[Folder]):
+        raise NotImplementedError()
+
     def delete(self, folder: Folder, repositories: list[ItemRepository]):
         raise NotImplementedError()
 
@@ -24,13 +24,21 @@ class DjangoFolderRepository(FolderRepository):
         self,
         db_folder: FOL_Folder,
         folders: dict[int, FOL_Folder],
+        revived: Optional[dict[int, Folder]] = None,
     ) -> Folder:
+        # every row is revived only once per call so that siblings share the
+        # same parent instance and parent keys are not parsed over and over
+        if revived is None:
+            revived = {}
+        if db_folder.pk in revived:
+            return revived[db_folder.pk]
+
         # find the parent
         parent: Optional[Folder] = None
         if db_folder._parent_id is not None:
             parent_db = folders.get(db_folder._parent_id)
             assert parent_db is not None
-            parent = self.__db_folder_to_domain(parent_db, folders)
+            parent = self.__db_folder_to_domain(parent_db, folders, revived)
 
         # revive keys
         enc_parent_key: Optional[ParentKey] = None
@@ -74,6 +82,7 @@ class DjangoFolderRepository(FolderRepository):
             folder.add_item(folder_item)
 
         # return
+        revived[db_folder.pk] = folder
         return folder
 
     def __db_folder_from_domain(self, folder: Folder) -> FOL_Folder:
@@ -126,35 +135,39 @@ class DjangoFolderRepository(FolderRepository):
 
     def get_or_create_records_folder(self, org_pk: int, user: "OrgUser") -> Folder:
         name = "Records"
-        if FOL_Folder.objects.filter(
-            org_id=org_pk, name=name, _parent=None, deleted=False
-        ).exists():
-            fs = FOL_Folder.objects.filter(
+        fs = list(
+            FOL_Folder.objects.filter(
                 org_id=org_pk, name=name, _parent=None, deleted=False
             )
+        )
+        if len(fs) > 0:
             f1 = fs[0]
-            if len(fs) > 1:
-                for f2 in fs:
-                    if len(f2.keys) > len(f1.keys):
-                        f1 = f2
-            return self.get_dict(org_pk)[f1.uuid]
+            for f2 in fs[1:]:
+                if len(f2.keys) > len(f1.keys):
+                    f1 = f2
+            # the records folder is a root folder, so it has no parents to load
+            return self.__db_folder_to_domain(f1, {})
         folder = Folder.create(name=name, org_pk=org_pk)
         folder.grant_access(user)
-        users = OrgUser.objects.filter(org_id=org_pk).exclude(uuid=user.uuid)
-        for u in users:
-            u.keyring.load()
-            folder.grant_access(u, user)
-        with transaction.atomic():
-            self.save(folder)
-            for u in users:
-                u.keyring.store()
+        # only the public keys of the users are needed, their keyrings stay as
+        # they are
+        users = list(
+            OrgUser.objects.filter(org_id=org_pk)
+            .exclude(uuid=user.uuid)
+            .select_related("keyring")
+        )
+        folder.grant_access_to_many(users, user)
+        self.save(folder)
 
-        return self.get_dict(org_pk)[folder.uuid]
+        return self.retrieve(org_pk, folder.uuid)
 
     def retrieve(self, org_pk: int, uuid: UUID) -> Folder:
         assert isinstance(uuid, UUID)
 
         db_folder = FOL_Folder.objects.filter(uuid=uuid, org_id=org_pk).get()
+        if db_folder._parent_id is None:
+            return self.__db_folder_to_domain(db_folder, {})
+
         closures = FOL_ClosureTable.objects.filter(
             child_id=db_folder.pk
         ).select_related("parent")
@@ -197,26 +210,30 @@ class DjangoFolderRepository(FolderRepository):
         db_parents = list_map(closures, lambda c: c.parent)
         db_parents_dict = {f.pk: f for f in db_parents}
 
+        revived: dict[int, Folder] = {}
         folders = list_map(
-            db_folders, lambda f: self.__db_folder_to_domain(f, db_parents_dict)
+            db_folders,
+            lambda f: self.__db_folder_to_domain(f, db_parents_dict, revived),
         )
         return folders
 
     def get_dict(self, org_pk: int) -> dict[UUID, Folder]:
         folders = self.__as_id_dict(org_pk)
 
+        revived: dict[int, Folder] = {}
         domain_folders = {}
         for f in folders.values():
-            domain_folders[f.uuid] = self.__db_folder_to_domain(f, folders)
+            domain_folders[f.uuid] = self.__db_folder_to_domain(f, folders, revived)
 
         return domain_folders
 
     def get_list(self, org_pk: int) -> list[Folder]:
         folders = self.__as_id_dict(org_pk)
 
+        revived: dict[int, Folder] = {}
         folders_list = []
         for folder in folders.values():
-            folders_list.append(self.__db_folder_to_domain(folder, folders))
+            folders_list.append(self.__db_folder_to_domain(folder, folders, revived))
 
         return folders_list
 
@@ -256,6 +273,76 @@ class DjangoFolderRepository(FolderRepository):
                     new_closures, ignore_conflicts=True
                 )
 
+    @staticmethod
+    def __depth(folder: Folder) -> int:
+        depth = 0
+        while folder.parent is not None:
+            folder = folder.parent
+            depth += 1
+        return depth
+
+    def save_many(self, folders: list[Folder]):
+        if len(folders) == 0:
+            return
+
+        uuids = set(f.uuid for f in folders)
+        uuids.update(f.parent.uuid for f in folders if f.parent is not None)
+        db_folders = {f.uuid: f for f in FOL_Folder.objects.filter(uuid__in=uuids)}
+
+        fields = [
+            "name",
+            "keys",
+            "group_keys",
+            "items",
+            "stop_inherit",
+            "restricted",
+            "enc_parent_key",
+        ]
+        changed: list[FOL_Folder] = []
+        new_or_moved: list[Folder] = []
+        for folder in folders:
+            assert folder.org_pk is not None
+            db_folder = db_folders.get(folder.uuid)
+            parent_id: Optional[int] = None
+            if folder.parent is not None:
+                db_parent = db_folders.get(folder.parent.uuid)
+                # a parent without a row is new and therefore a new parent
+                parent_id = db_parent.pk if db_parent is not None else -1
+            if db_folder is None or db_folder._parent_id != parent_id:
+                new_or_moved.append(folder)
+                continue
+
+            values = {
+                "name": folder.name,
+                "keys": [k.as_dict() for k in folder.keys],
+                "group_keys": [k.as_dict() for k in folder.group_keys],
+                "items": [i.as_dict() for i in folder.items],
+                "stop_inherit": folder.stop_inherit,
+                "restricted": folder.restricted,
+                "enc_parent_key": (
+                    folder.enc_parent_key.as_dict()
+                    if folder.enc_parent_key is not None
+                    else None
+                ),
+            }
+            if all(getattr(db_folder, k) == v for k, v in values.items()):
+                continue
+            for k, v in values.items():
+                setattr(db_folder, k, v)
+            changed.append(db_folder)
+
+        if len(changed) == 0 and len(new_or_moved) == 0:
+            return
+
+        with transaction.atomic():
+            FOL_Folder.objects.bulk_update(changed, fields, batch_size=500)
+            # only new folders and folders with a new parent need to touch the
+            # closure table, that is why they go through the normal save. the
+            # parents are saved first, so that their rows exist for the children
+            new_or_moved.sort(key=self.__depth)
+            for folder in new_or_moved:
+                self.save(folder)
+
     def delete(self, folder: Folder, repositories: list[ItemRepository]):
         assert folder.org_pk is not None
         f = self.__db_folder_from_domain(folder)
@@ -38,6 +38,24 @@ def test_grant_access_to_another_user():
     assert folder.has_access(user2)
 
 
+def test_grant_access_to_many(settings):
+    settings.KEY_DISTRIBUTION_WORKERS = 3
+    user = UserObject()
+    others = [UserObject() for _ in range(5)]
+
+    folder = Folder.create("New Folder")
+    folder.grant_access(to=user)
+    folder.grant_access_to_many(others, by=user)
+
+    for other in others:
+        assert folder.has_access(other)
+        assert folder.get_decryption_key(requestor=other) == (
+            folder.get_decryption_key(requestor=user)
+        )
+    with pytest.raises(DomainError):
+        folder.grant_access_to_many([UserObject(), others[0]], by=user)
+
+
 def test_encryption_version():
     folder = Folder.create("Test")
     assert folder.encryption_version is None
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from core.folders.domain.aggregates.folder import Folder
+from core.folders.domain.key_cache import folder_key_cache, get_folder_key_cache
+from core.folders.domain.value_objects.folder_key import EncryptedFolderKeyOfUser
+from core.folders.tests.test_helpers.user import UserObject
+
+
+def test_key_is_unwrapped_once_inside_cache():
+    user = UserObject()
+    folder = Folder.create("New Folder")
+    folder.grant_access(to=user)
+
+    decrypt_self = EncryptedFolderKeyOfUser.decrypt_self
+    with patch.object(
+        EncryptedFolderKeyOfUser, "decrypt_self", autospec=True
+    ) as mocked:
+        mocked.side_effect = decrypt_self
+        with folder_key_cache():
+            key1 = folder.get_decryption_key(requestor=user)
+            key2 = folder.get_decryption_key(requestor=user)
+        key3 = folder.get_decryption_key(requestor=user)
+
+    assert key1.get_key() == key2.get_key() == key3.get_key()
+    assert mocked.call_count == 2
+
+
+def test_cache_is_scoped():
+    assert get_folder_key_cache() is None
+    with folder_key_cache() as cache1:
+        with folder_key_cache() as cache2:
+            assert cache1 is cache2
+        assert get_folder_key_cache() is cache1
+    assert get_folder_key_cache() is None
+
+
+def test_cache_is_invalidated_on_key_changes():
+    user1 = UserObject()
+    user2 = UserObject()
+    parent = Folder.create("Parent")
+    parent.grant_access(to=user1)
+    child = Folder.create("Child")
+    child.grant_access(to=user1)
+    child.set_parent(parent, user1)
+
+    with folder_key_cache() as cache:
+        child.get_decryption_key(requestor=user1)
+        assert len(cache) > 0
+        parent.grant_access(to=user2, by=user1)
+        assert len(cache) == 0
+
+        parent.get_decryption_key(requestor=user2)
+        assert len(cache) > 0
+        parent.revoke_access(of=user2)
+        assert len(cache) == 0
+        assert not parent.has_access(user2)
+
+
+def test_cache_is_bounded():
+    user = UserObject()
+    folders = []
+    for i in range(5):
+        folder = Folder.create(f"Folder {i}")
+        folder.grant_access(to=user)
+        folders.append(folder)
+
+    with folder_key_cache(maxsize=2) as cache:
+        for folder in folders:
+            folder.get_decryption_key(requestor=user)
+        assert len(cache) == 2
@@ -0,0 +1,63 @@
+from core.folders.api.query import (
+    ContextBuilder,
+    build_group_access,
+    build_tree,
+    build_user_access,
+)
+from core.folders.domain.aggregates.folder import Folder
+from core.folders.infrastructure.folder_repository import DjangoFolderRepository
+from core.tests import test_helpers
+
+
+def collect(nodes: list[dict]) -> list[dict]:
+    found = []
+    for node in nodes:
+        found.append(node)
+        found += collect(node["children"])
+    return found
+
+
+def test_tree_access_matches_the_access_of_each_folder(db):
+    org = test_helpers.create_org("Test Org")["org"]
+    u1 = test_helpers.create_org_user(org=org, email="dummy@law-orga.de")["org_user"]
+    r = DjangoFolderRepository()
+
+    root = Folder.create(name="Root", org_pk=org.pk)
+    root.grant_access(to=u1)
+    child = Folder.create(name="Child", org_pk=org.pk)
+    child.grant_access(to=u1)
+    child.set_parent(root, u1)
+    grandchild = Folder.create(name="Grandchild", org_pk=org.pk)
+    grandchild.grant_access(to=u1)
+    grandchild.set_parent(child, u1)
+    hidden = Folder.create(name="Hidden", org_pk=org.pk, stop_inherit=True)
+    hidden.grant_access(to=u1)
+    hidden.set_parent(child, u1)
+    for folder in [root, child, grandchild, hidden]:
+        r.save(folder)
+
+    u2 = test_helpers.create_org_user(org=org, email="tester@law-orga.de")["org_user"]
+    child.grant_access(to=u2, by=u1)
+    r.save(child)
+
+    builder = ContextBuilder(r)
+    builder.build_available_users(org.pk).build_users_dict()
+    builder.build_available_groups(org.pk).build_groups_dict()
+    builder.build_folders(org.pk).build_folder_dicts()
+    context = builder.build()
+
+    nodes = collect(build_tree(context, u2))
+    assert len(nodes) == 4
+    for node in nodes:
+        folder = context["folders_dict"][node["folder"]["uuid"]]
+        assert node["folder"]["has_access"] == folder.has_access(u2)
+        assert node["access"] == build_user_access(context, folder)
+        assert node["group_access"] == build_group_access(context, folder)
+
+    has_access = {n["folder"]["name"]: n["folder"]["has_access"] for n in nodes}
+    assert has_access == {
+        "Root": False,
+        "Child": True,
+        "Grandchild": True,
+        "Hidden": False,
+    }
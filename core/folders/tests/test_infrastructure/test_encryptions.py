@@ -1,9 +1,15 @@
 from uuid import uuid4
 
+import pytest
+
 from core.encryption.infrastructure.asymmetric_encryptions import AsymmetricEncryptionV1
-from core.encryption.infrastructure.symmetric_encryptions import SymmetricEncryptionV1
+from core.encryption.infrastructure.symmetric_encryptions import (
+    SymmetricEncryptionV1,
+    SymmetricEncryptionV2,
+)
 from core.encryption.value_objects.asymmetric_key import AsymmetricKey, SymmetricKey
 from core.encryption.value_objects.box import OpenBox
+from core.encryption.value_objects.encryption import EncryptionDecryptionError
 from core.encryption.value_objects.symmetric_key import EncryptedSymmetricKey
 from core.folders.domain.value_objects.folder_key import FolderKey
 
@@ -67,3 +73,27 @@ def test_asymmetric_encryption_decode():
 
     assert locked.decode("ISO-8859-1").encode("ISO-8859-1") == locked.value
     locked.as_dict()
+
+
+def test_symmetric_encryption_v2():
+    key = SymmetricKey.generate(SymmetricEncryptionV2)
+    locked = key.lock(OpenBox(data=b"Secret"))
+    assert locked.key_origin == "S2"
+    assert key.unlock(locked) == OpenBox(data=b"Secret")
+
+
+def test_symmetric_encryption_v2_detects_changes():
+    key, _ = SymmetricEncryptionV2.generate_key()
+    encryption = SymmetricEncryptionV2(key)
+    enc_data = bytearray(encryption.encrypt(b"Secret"))
+    enc_data[-1] ^= 1
+    with pytest.raises(EncryptionDecryptionError):
+        encryption.decrypt(bytes(enc_data))
+
+
+def test_s1_key_can_not_unlock_s2_boxes():
+    key, _ = SymmetricEncryptionV1.generate_key()
+    s1 = SymmetricKey.create(key, SymmetricEncryptionV1.VERSION)
+    s2 = SymmetricKey.create(key, SymmetricEncryptionV2.VERSION)
+    with pytest.raises(ValueError):
+        s1.unlock(s2.lock(OpenBox(data=b"Secret")))
@@ -89,3 +89,89 @@ def test_closures_saved_and_deleted(db, user, repository):
     repository.save(folder2)
 
     assert not FOL_ClosureTable.objects.filter(parent_id=f1.pk, child_id=f2.pk).exists()
+
+
+def test_get_dict_shares_parent_instances(db, user, repository):
+    parent = Folder.create(name="Parent", org_pk=user.org_id)
+    parent.grant_access(to=user)
+    repository.save(parent)
+    children = []
+    for i in range(3):
+        child = Folder.create(name=f"Child {i}", org_pk=user.org_id)
+        child.set_parent(parent, user)
+        repository.save(child)
+        children.append(child)
+
+    folders = repository.get_dict(user.org_id)
+
+    revived_parent = folders[parent.uuid]
+    for child in children:
+        assert folders[child.uuid].parent is revived_parent
+        assert folders[child.uuid].has_access(user)
+
+
+def test_save_many(db, user, repository):
+    parent = Folder.create(name="Parent", org_pk=user.org_id)
+    parent.grant_access(to=user)
+    repository.save(parent)
+    child = Folder.create(name="Child", org_pk=user.org_id)
+    child.set_parent(parent, user)
+    repository.save(child)
+
+    folders = repository.get_list(user.org_id)
+    for folder in folders:
+        folder.update_information(name=f"{folder.name} renamed")
+    new_folder = Folder.create(name="New", org_pk=user.org_id)
+    new_folder.set_parent(repository.retrieve(user.org_id, parent.uuid), user)
+    repository.save_many(folders + [new_folder])
+
+    folders_dict = repository.get_dict(user.org_id)
+    assert folders_dict[parent.uuid].name == "Parent renamed"
+    assert folders_dict[child.uuid].name == "Child renamed"
+    assert folders_dict[new_folder.uuid].parent_uuid == parent.uuid
+    assert folders_dict[new_folder.uuid].has_access(user)
+    f_parent = FOL_Folder.objects.get(uuid=parent.uuid)
+    f_new = FOL_Folder.objects.get(uuid=new_folder.uuid)
+    assert FOL_ClosureTable.objects.filter(
+        parent_id=f_parent.pk, child_id=f_new.pk
+    ).exists()
+
+
+def test_save_many_moves_a_root_folder_under_a_new_folder(
+    db, user, repository, folder_uuid
+):
+    root = repository.retrieve(user.org_id, folder_uuid)
+    new_parent = Folder.create(name="New Parent", org_pk=user.org_id)
+    new_parent.grant_access(to=user)
+    root.set_parent(new_parent, user)
+    # the child comes first to check that the parent is saved before it
+    repository.save_many([root, new_parent])
+
+    folders_dict = repository.get_dict(user.org_id)
+    assert folders_dict[folder_uuid].parent_uuid == new_parent.uuid
+    f_parent = FOL_Folder.objects.get(uuid=new_parent.uuid)
+    f_root = FOL_Folder.objects.get(uuid=folder_uuid)
+    assert f_root._parent_id == f_parent.pk
+    assert FOL_ClosureTable.objects.filter(
+        parent_id=f_parent.pk, child_id=f_root.pk
+    ).exists()
+
+
+def test_save_many_skips_unchanged_folders(
+    db, user, repository, folder_uuid, django_assert_num_queries
+):
+    folders = repository.get_list(user.org_id)
+    with django_assert_num_queries(1):
+        repository.save_many(folders)
+
+
+def test_get_or_create_records_folder_loads_only_the_records_folder(
+    db, user, repository, folder_uuid, django_assert_num_queries
+):
+    created = repository.get_or_create_records_folder(user.org_id, user)
+    assert created.name == "Records" and created.has_access(user)
+
+    with django_assert_num_queries(1):
+        folder = repository.get_or_create_records_folder(user.org_id, user)
+    assert folder.uuid == created.uuid
+    assert folder.has_access(user)
@@ -163,7 +163,7 @@ def toggle_inheritance(__actor: OrgUser, folder_uuid: UUID):
     r.save(folder)
 
 
-@use_case
+@use_case(validate=False)
 def rename_item_in_folder(
     __actor: MessageBusActor,
     repository_name: str,
@@ -178,7 +178,7 @@ def rename_item_in_folder(
     r.save(folder)
 
 
-@use_case
+@use_case(validate=False)
 def delete_item_from_folder(__actor: MessageBusActor, uuid: UUID, folder_uuid: UUID):
     folder = folder_from_uuid(__actor, folder_uuid)
     r = get_repository()
@@ -186,7 +186,7 @@ def delete_item_from_folder(__actor: MessageBusActor, uuid: UUID, folder_uuid: U
     r.save(folder)
 
 
-@use_case
+@use_case(validate=False)
 def add_item_to_folder(
     __actor: MessageBusActor,
     repository_name: str,
@@ -201,17 +201,17 @@ def add_item_to_folder(
     r.save(folder)
 
 
-@use_case
+@use_case(validate=False)
 def invalidate_keys_of_user(__actor: MessageBusActor, user_uuid: UUID):
     user = org_user_from_uuid(__actor, user_uuid)
     r = get_repository()
     folders = r.get_list(user.org_id)
     for folder in folders:
         folder.invalidate_keys_of(user)
-        r.save(folder)
+    r.save_many(folders)
 
 
-@use_case
+@use_case(validate=False)
 def correct_keys_of_user_by_user(
     __actor: MessageBusActor, of_uuid: UUID, by_uuid: UUID
 ):
@@ -221,8 +221,10 @@ def correct_keys_of_user_by_user(
 
     r = get_repository()
     folders = r.get_list(of.org_id)
+    fixed: list[Folder] = []
     for f in folders:
         if f.has_access(by):
             if f.has_invalid_keys(of):
                 f.fix_keys(of, by)
-                r.save(f)
+                fixed.append(f)
+    r.save_many(fixed)
@@ -1,5 +1,7 @@
 from datetime import timedelta
 
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 
 from core.auth.domain.user_key import UserKey
@@ -10,7 +12,7 @@ from core.data_sheets.models.data_sheet import DataSheetRepository
 from core.files_new.models.file import FileRepository
 from core.folders.domain.repositories.folder import FolderRepository
 from core.folders.infrastructure.folder_repository import DjangoFolderRepository
-from core.other.models.logged_path import LoggedPath
+from core.other.logged_path_buffer import LOGGED_PATH_BUFFER
 from core.questionnaires.models.questionnaire import QuestionnaireRepository
 from core.records.models.record import RecordRepository
 from core.seedwork.use_case_layer.callbacks import CallbackContext
@@ -20,6 +22,7 @@ from core.upload.models.upload import UploadLinkRepository
 from messagebus.domain.bus import MessageBus
 from messagebus.domain.collector import EventCollector
 from messagebus.domain.event import Event
+from messagebus.domain.outbox import Outbox
 from messagebus.domain.store import EventStore
 
 fr = DjangoFolderRepository()
@@ -41,9 +44,25 @@ def save_event(event: Event):
     store.append(event.stream_name, [event])
 
 
+def save_events(events: list[Event]):
+    store: EventStore = EventStore()  # type: ignore
+    streams: dict[str, list[Event]] = {}
+    for event in events:
+        streams.setdefault(event.stream_name, []).append(event)
+    for stream_name, stream_events in streams.items():
+        store.append(stream_name, stream_events)
+
+
 def handle_events(context: CallbackContext, collector: EventCollector):
     if not context.success:
         return
+    if settings.MESSAGEBUS_DISPATCH == "outbox":
+        events = collector.pop_all()
+        outbox: Outbox = Outbox()  # type: ignore
+        with transaction.atomic():
+            save_events(events)
+            outbox.add(events)
+        return
     while event := collector.pop():
         save_event(event)
         BUS.handle(event)
@@ -51,7 +70,7 @@ def handle_events(context: CallbackContext, collector: EventCollector):
 
 def log_usecase(context: CallbackContext):
     if isinstance(context.actor, OrgUser) or isinstance(context.actor, UserProfile):
-        LoggedPath.objects.create(
+        LOGGED_PATH_BUFFER.add(
             user=(
                 context.actor
                 if isinstance(context.actor, UserProfile)
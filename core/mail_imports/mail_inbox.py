@@ -1,5 +1,6 @@
 import logging
-from imaplib import IMAP4_SSL
+import re
+from imaplib import IMAP4, IMAP4_SSL
 from typing import Any, Protocol, Sequence
 
 from django.conf import settings
@@ -17,12 +18,17 @@ class RawEmail(BaseModel):
     data: Any
 
 
+def uid_set(emails: Sequence[UidEmail]) -> str:
+    return ",".join(email.uid for email in emails)
+
+
 class MailInbox:
-    def __init__(self) -> None:
-        self.mailbox = IMAP4_SSL(
-            host=settings.MI_EMAIL_HOST, port=settings.MI_EMAIL_PORT
-        )
-        self.seen: set[Any] = set()
+    def __init__(self, mailbox: IMAP4 | None = None) -> None:
+        if mailbox is None:
+            mailbox = IMAP4_SSL(
+                host=settings.MI_EMAIL_HOST, port=settings.MI_EMAIL_PORT
+            )
+        self.mailbox = mailbox
 
     def __enter__(self):
         return self
@@ -41,44 +47,60 @@ class MailInbox:
         self.mailbox.login(settings.MI_EMAIL_USER, settings.MI_EMAIL_PASSWORD)
         self.mailbox.select("INBOX")
 
-    def get_raw_emails(self) -> list[RawEmail]:
-        _, [uids] = self.mailbox.uid("SEARCH", "", "ALL")
-        emails = []
-        for uid in uids.split():
-            _, data = self.mailbox.uid("FETCH", uid, "(RFC822)")
-            emails.append(RawEmail(uid=uid, data=data))
-        return emails
+    def search_uids(self) -> list[str]:
+        # mails that are flagged as deleted but not yet expunged were already
+        # imported by a run that did not finish
+        _, [uids] = self.mailbox.uid("SEARCH", "", "UNDELETED")
+        if not uids:
+            return []
+        return [uid.decode() for uid in uids.split()]
 
-    def get_raw_email(self) -> RawEmail | None:
-        _, [uids] = self.mailbox.uid("SEARCH", "", "ALL")
+    def fetch_raw_emails(self, uids: list[str]) -> list[RawEmail]:
         if not uids:
-            return None
-        for uid in uids.split():
-            if uid in self.seen:
+            return []
+        _, data = self.mailbox.uid("FETCH", ",".join(uids), "(RFC822)")
+        emails = []
+        for i, part in enumerate(data):
+            # the server answers with a (envelope, message) tuple per mail and
+            # the rest of the envelope in between, the uid can be in both
+            if not isinstance(part, tuple):
                 continue
-            self.seen.add(uid)
-            _, data = self.mailbox.uid("FETCH", uid, "(RFC822)")
-            email = RawEmail(uid=uid, data=data)
-            return email
-        return None
+            match = re.search(rb"UID (\d+)", part[0])
+            if match is None and i + 1 < len(data):
+                trailer = data[i + 1]
+                if isinstance(trailer, bytes):
+                    match = re.search(rb"UID (\d+)", trailer)
+            if match is None:
+                logger.warning(f"mail without uid in fetch response: {part[0]!r}")
+                continue
+            emails.append(RawEmail(uid=match.group(1).decode(), data=[part]))
+        missing = set(uids) - set(e.uid for e in emails)
+        if missing:
+            logger.warning(f"mails not returned by the server: {sorted(missing)}")
+        return emails
 
     def delete_emails(self, emails: Sequence[UidEmail]):
-        for email in emails:
-            try:
-                self.mailbox.uid("STORE", email.uid, "+FLAGS", "\\Deleted")
-            except IMAP4_SSL.error as e:
-                logger.warning(f"error deleting email {email.uid}: {e}")
-        self.mailbox.expunge()
+        if not emails:
+            return
+        try:
+            self.mailbox.uid("STORE", uid_set(emails), "+FLAGS", "\\Deleted")
+        except IMAP4.error as e:
+            logger.warning(f"error deleting emails {uid_set(emails)}: {e}")
 
     def mark_emails_as_error(self, emails: Sequence[UidEmail]):
-        for email in emails:
-            self.mailbox.uid("COPY", email.uid, "Errors")
-            self.mailbox.uid("STORE", email.uid, "+FLAGS", "\\Deleted")
+        if not emails:
+            return
+        self.mailbox.uid("COPY", uid_set(emails), "Errors")
+        self.mailbox.uid("STORE", uid_set(emails), "+FLAGS", "\\Deleted")
 
     def mark_emails_as_not_assignable(self, emails: Sequence[UidEmail]):
-        for email in emails:
-            self.mailbox.uid("COPY", email.uid, "Unassigned")
-            self.mailbox.uid("STORE", email.uid, "+FLAGS", "\\Deleted")
+        if not emails:
+            return
+        self.mailbox.uid("COPY", uid_set(emails), "Unassigned")
+        self.mailbox.uid("STORE", uid_set(emails), "+FLAGS", "\\Deleted")
+
+    def expunge(self):
+        self.mailbox.expunge()
 
     def get_mail_attachments(self, email: UidEmail) -> list[bytes]:
         raise NotImplementedError()
@@ -2,7 +2,7 @@ import logging
 from typing import IO, TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from django.core.files.base import ContentFile
+from django.core.files.base import File
 from django.db import models
 from django.utils.timezone import localtime
 
@@ -98,8 +98,16 @@ class MailImport(models.Model):
         self.is_pinned = not self.is_pinned
 
     def encrypt(self, user: OrgUser):
-        self.__generate_key(user)
-        key = self.get_key(user)
+        lock_key = self.folder.get_encryption_key(requestor=user)
+        self.encrypt_with_folder_key(lock_key)
+
+    def encrypt_with_folder_key(self, lock_key: SymmetricKey):
+        # the generated key is kept, so that attachments of a new mail do not
+        # need to unlock it again
+        key = SymmetricKey.generate(SymmetricEncryptionV1)
+        enc_key = EncryptedSymmetricKey.create(key, lock_key)
+        self.enc_key = enc_key.as_dict()
+        self._key = key
         for field in self.ENC_FIELDS:
             value = getattr(self, field, "")
             open_box = OpenBox(data=value.encode("utf-8"))
@@ -113,13 +121,9 @@ class MailImport(models.Model):
             open_box = key.unlock(locked_box)
             setattr(self, field, open_box.value_as_str)
 
-    def __generate_key(self, user: OrgUser):
-        key = SymmetricKey.generate(SymmetricEncryptionV1)
-        lock_key = self.folder.get_encryption_key(requestor=user)
-        enc_key = EncryptedSymmetricKey.create(key, lock_key)
-        self.enc_key = enc_key.as_dict()
-
     def get_key(self, user: OrgUser) -> SymmetricKey:
+        if hasattr(self, "_key"):
+            return self._key
         enc_key = EncryptedSymmetricKey.create_from_dict(self.enc_key)
         unlock_key = self.folder.get_decryption_key(requestor=user)
         key = enc_key.decrypt(unlock_key)
@@ -132,9 +136,10 @@ class MailAttachment(models.Model):
         cls,
         mail_import: MailImport,
         filename: str,
-        content: ContentFile,
+        content: File,
         user: OrgUser,
     ):
+        # the content is encrypted while the storage reads it
         key = mail_import.get_key(user)
         enc_content = AESEncryption.encrypt_in_memory_file(
             content, key.get_key().value_as_str
@@ -143,7 +148,7 @@ class MailAttachment(models.Model):
         attachment = cls(
             mail_import=mail_import,
             filename=filename,
-            content=ContentFile(enc_content.read(), name=storage_filename),
+            content=File(enc_content, name=storage_filename),
         )
         return attachment
 
@@ -164,6 +169,11 @@ class MailAttachment(models.Model):
         mail_import_uuid = self.mail_import.folder_uuid
         return f"mailAttachment: {self.uuid}; mailImportUUid: {mail_import_uuid}"
 
+    def upload(self):
+        # stores the file before the model is saved, the save or bulk create
+        # afterwards does not upload it again
+        self.content.save(self.content.name, self.content.file, save=False)
+
     def location(self) -> str:
         return self.content.url
 
@@ -1,9 +1,11 @@
-from email.message import Message
+from email.message import EmailMessage, Message
 from uuid import uuid4
 
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
+from django.test import override_settings
 
+from core.mail_imports.mail_inbox import MailInbox
 from core.mail_imports.models.mail_import import MailAttachment, MailImport
 from core.mail_imports.use_cases.mail_import import (
     AssignedEmail,
@@ -11,7 +13,10 @@ from core.mail_imports.use_cases.mail_import import (
     assign_email_to_folder_uuid,
     delete_mail,
     get_addresses_from_message,
+    import_emails_from_inbox,
     mark_mails_as_read,
+    parse_message,
+    spill_payload,
     toggle_mail_pinned,
 )
 from core.tests import test_helpers
@@ -137,3 +142,141 @@ def test_mail_can_be_deleted(db):
     assert MailImport.objects.filter(uuid=mail.uuid).count() == 0
     assert MailAttachment.objects.filter(mail_import__uuid=mail.uuid).count() == 0
     assert not default_storage.exists(filename)
+
+
+class LocalImap:
+    def __init__(self, mails: list[bytes], uid_after_literal: bool = False):
+        self.mails = {str(i + 1): mail for i, mail in enumerate(mails)}
+        self.uid_after_literal = uid_after_literal
+        self.deleted: set[str] = set()
+        self.folders: dict[str, list[bytes]] = {}
+        self.commands: list[str] = []
+
+    def uid(self, command: str, *args):
+        self.commands.append(command)
+        if command == "SEARCH":
+            uids = [u for u in self.mails if u not in self.deleted]
+            return "OK", [" ".join(uids).encode()]
+        uids = args[0].split(",")
+        if command == "FETCH":
+            data: list = []
+            for i, uid in enumerate(uids):
+                if uid not in self.mails:
+                    continue
+                mail = self.mails[uid]
+                if self.uid_after_literal:
+                    head = "{} (RFC822 {{{}}}".format(i + 1, len(mail))
+                    data += [(head.encode(), mail), " UID {})".format(uid).encode()]
+                else:
+                    head = "{} (UID {} RFC822 {{{}}}".format(i + 1, uid, len(mail))
+                    data += [(head.encode(), mail), b")"]
+            return "OK", data
+        if command == "COPY":
+            self.folders.setdefault(args[1], [])
+            self.folders[args[1]] += [self.mails[u] for u in uids]
+        if command == "STORE":
+            self.deleted.update(uids)
+        return "OK", [None]
+
+    def expunge(self):
+        for uid in self.deleted:
+            del self.mails[uid]
+        self.deleted = set()
+
+
+def create_mail(to: str, subject: str | None = "Test") -> bytes:
+    message = EmailMessage()
+    message["From"] = "Client <client@law-orga.de>"
+    message["To"] = to
+    message["Date"] = "Mon, 06 Jan 2025 10:00:00 +0100"
+    if subject is not None:
+        message["Subject"] = subject
+    message.set_content("Hello")
+    message.add_attachment(
+        b"attachment", maintype="application", subtype="pdf", filename="a.pdf"
+    )
+    return message.as_bytes()
+
+
+@override_settings(MI_FETCH_BATCH_SIZE=2)
+def test_mails_are_imported_in_batches(db):
+    u = test_helpers.create_org_user()
+    user = u["org_user"]
+    folder = test_helpers.create_folder(user=user)["folder"]
+    to = "{}@law-orga.de".format(folder.uuid)
+    imap = LocalImap(
+        [
+            create_mail(to, "Mail 1"),
+            create_mail("unknown@law-orga.de"),
+            create_mail(to, "Mail 2"),
+            create_mail(to, None),
+            create_mail(to, "Mail 3"),
+        ]
+    )
+
+    mails = import_emails_from_inbox(
+        MailInbox(mailbox=imap), {folder.uuid: folder}, user  # type: ignore
+    )
+
+    assert len(mails) == 5
+    assert imap.commands.count("SEARCH") == 1
+    assert imap.commands.count("FETCH") == 3
+    assert list(imap.mails.keys()) == ["2"]
+    assert len(imap.folders["Errors"]) == 1
+    imported = list(MailImport.objects.order_by("pk"))
+    assert len(imported) == 3
+    imported[0].decrypt(user)
+    assert imported[0].subject == "Mail 1"
+    attachment = MailAttachment.objects.filter(mail_import=imported[0]).get()
+    assert attachment.get_decrypted_file(user).read() == b"attachment"
+
+
+@override_settings(MI_ATTACHMENT_SPOOL_SIZE=1024)
+def test_large_attachments_are_spooled_to_disk():
+    data = bytes(range(256)) * 64
+    message = EmailMessage()
+    message["Subject"] = "Test"
+    message.set_content("Hello")
+    message.add_attachment(
+        data, maintype="application", subtype="octet-stream", filename="a.bin"
+    )
+    parsed = parse_message(message.as_bytes())
+    part = next(parsed.iter_attachments())
+
+    file = spill_payload(part)  # type: ignore
+
+    assert file.size == len(data)
+    assert file.file._rolled  # type: ignore
+    assert file.read() == data
+    assert part.get_payload() == ""
+
+
+def test_malformed_base64_attachments_are_decoded_leniently():
+    raw = (
+        b"Subject: Test\r\n"
+        b"MIME-Version: 1.0\r\n"
+        b'Content-Type: multipart/mixed; boundary="b"\r\n\r\n'
+        b"--b\r\nContent-Type: text/plain\r\n\r\nHello\r\n"
+        b"--b\r\nContent-Type: application/octet-stream\r\n"
+        b'Content-Disposition: attachment; filename="a.txt"\r\n'
+        b"Content-Transfer-Encoding: base64\r\n\r\n"
+        b"aGVsbG8gd29ybGQ=Q\r\n"
+        b"--b--\r\n"
+    )
+    part = next(parse_message(raw).iter_attachments())
+
+    file = spill_payload(part)  # type: ignore
+
+    assert file.read() == b"hello world"
+    assert file.size == len(b"hello world")
+
+
+def test_fetch_finds_the_uid_after_the_message(caplog):
+    imap = LocalImap([b"Subject: 1", b"Subject: 2"], uid_after_literal=True)
+    inbox = MailInbox(mailbox=imap)  # type: ignore
+
+    emails = inbox.fetch_raw_emails(["1", "2", "3"])
+
+    assert [e.uid for e in emails] == ["1", "2"]
+    assert emails[1].data[0][1] == b"Subject: 2"
+    assert "['3']" in caplog.text
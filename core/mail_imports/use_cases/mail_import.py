@@ -1,17 +1,23 @@
+import binascii
 import logging
-from email import message_from_bytes
+from base64 import b64decode
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.header import decode_header
 from email.message import EmailMessage
+from email.parser import BytesParser
 from email.policy import default
 from email.utils import getaddresses, parseaddr
-from typing import Any, Protocol, Sequence
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Protocol, Sequence
 from uuid import UUID
 
-from django.core.files.base import ContentFile
+from django.conf import settings
+from django.core.files.base import File
 from django.db import transaction
 from pydantic import BaseModel
 
 from core.auth.models.org_user import OrgUser
+from core.encryption.value_objects.symmetric_key import SymmetricKey
 from core.folders.domain.aggregates.folder import Folder
 from core.folders.domain.repositories.folder import FolderRepository
 from core.mail_imports.mail_inbox import MailInbox, RawEmail
@@ -53,7 +59,9 @@ class UidEmail(Protocol):
 
 class EmailMessageAttachment(BaseModel):
     filename: str
+    # a file that only stays in memory while it is small
     content: Any
+    size: int = 0
 
 
 class ValidatedEmail(BaseModel):
@@ -94,17 +102,77 @@ def get_content_from_email(message: EmailMessage):
     return content
 
 
+BASE64_CHUNK_SIZE = 64 * 1024
+
+
+def parse_message(data: bytes) -> EmailMessage:
+    return BytesParser(policy=default).parsebytes(data)  # type: ignore
+
+
+def write_decoded_payload(part: EmailMessage, file: IO[bytes]):
+    decoded = part.get_payload(decode=True)
+    if isinstance(decoded, bytes):
+        file.write(decoded)
+
+
+def spill_payload(part: EmailMessage) -> File:
+    """
+    Decodes the payload of an attachment into a file that is moved to disk
+    once it is larger than MI_ATTACHMENT_SPOOL_SIZE. Base64, which nearly all
+    attachments use, is decoded chunk by chunk, so the decoded attachment is
+    never in memory as a whole. The raw message and the encoded payload still
+    are, the encoded payload is dropped afterwards. Malformed base64 falls
+    back to the lenient decoder of the email package.
+    """
+    spooled = SpooledTemporaryFile(max_size=settings.MI_ATTACHMENT_SPOOL_SIZE)
+    payload = part.get_payload()
+    if not isinstance(payload, str):
+        pass
+    elif part.get("Content-Transfer-Encoding", "").lower() == "base64":
+        try:
+            rest = ""
+            for i in range(0, len(payload), BASE64_CHUNK_SIZE):
+                chunk = rest + "".join(payload[i : i + BASE64_CHUNK_SIZE].split())
+                cut = len(chunk) - len(chunk) % 4
+                rest = chunk[cut:]
+                spooled.write(b64decode(chunk[:cut]))
+            if rest:
+                spooled.write(b64decode(rest + "=" * (-len(rest) % 4)))
+        except binascii.Error:
+            spooled.seek(0)
+            spooled.truncate()
+            write_decoded_payload(part, spooled)
+    else:
+        write_decoded_payload(part, spooled)
+    part.set_payload("")
+    size = spooled.tell()
+    spooled.seek(0)
+    file = File(spooled)
+    file.size = size
+    return file
+
+
 def get_attachments_from_email(message: EmailMessage) -> list[EmailMessageAttachment]:
     attachments: list[EmailMessageAttachment] = []
     for part in message.iter_attachments():
+        filename = part.get_filename() or "Unknown"
+        content = spill_payload(part)  # type: ignore
         attachment = EmailMessageAttachment(
-            filename=part.get_filename() or "Unknown",
-            content=part.get_payload(decode=True),
+            filename=filename, content=content, size=content.size
         )
         attachments.append(attachment)
     return attachments
 
 
+def close_attachments(
+    emails: Sequence[ValidatedEmail | ErrorEmail | AssignedEmail | FolderEmail],
+):
+    for email in emails:
+        if isinstance(email, ValidatedEmail):
+            for attachment in email.attachments:
+                attachment.content.close()
+
+
 def get_sender_info(message: EmailMessage) -> str:
     sender = message.get("From")
     if sender is None:
@@ -166,9 +234,7 @@ def get_email_info(message: EmailMessage):
 def validate_email(raw_email: RawEmail) -> ErrorEmail | ValidatedEmail:
     try:
         data = raw_email.data
-        message: EmailMessage = message_from_bytes(
-            data[0][1], policy=default  # type: ignore
-        )
+        message = parse_message(data[0][1])
         email_info = get_email_info(message)
         return ValidatedEmail(uid=raw_email.uid, **email_info)
     except Exception as e:
@@ -190,7 +256,7 @@ def assign_email_to_folder_uuid(
         except Exception:
             continue
     if folder_uuids:
-        return AssignedEmail(folder_uuids=folder_uuids, **email.model_dump())
+        return AssignedEmail(folder_uuids=folder_uuids, **dict(email))
     return email
 
 
@@ -208,19 +274,13 @@ def assign_email_to_folder(
         assert folder.org_pk is not None
         if not folder.has_access(user):
             continue
-        return FolderEmail(
-            org_pk=folder.org_pk, **email.model_dump(), folder_uuid=folder_uuid
-        )
+        return FolderEmail(org_pk=folder.org_pk, **dict(email), folder_uuid=folder_uuid)
     return email
 
 
-def save_email(
-    email: ValidatedEmail | ErrorEmail | AssignedEmail | FolderEmail,
-    user: OrgUser,
-) -> None:
-    if not isinstance(email, FolderEmail):
-        return
-    assert isinstance(email, FolderEmail)
+def build_email(
+    email: FolderEmail, lock_key: SymmetricKey, user: OrgUser
+) -> tuple[MailImport, list[MailAttachment]]:
     obj = MailImport.create(
         sender=email.sender,
         bcc=email.bcc or "",
@@ -231,33 +291,36 @@ def save_email(
         folder_uuid=email.folder_uuid,
         org_id=email.org_pk,
     )
-    obj.encrypt(user)
+    obj.encrypt_with_folder_key(lock_key)
     attachments: list[MailAttachment] = []
     for a in email.attachments:
-        if a.content is None or len(a.content) == 0:
+        if a.size == 0:
             continue
-        content_file = ContentFile(content=a.content, name=a.filename)
         attachment = MailAttachment.create(
             mail_import=obj,
             filename=a.filename,
-            content=content_file,
+            content=a.content,
             user=user,
         )
+        attachment.upload()
         attachments.append(attachment)
+    return obj, attachments
+
+
+def save_emails(built: list[tuple[MailImport, list[MailAttachment]]]) -> None:
+    mails = [mail for mail, _ in built]
+    attachments = [a for _, mail_attachments in built for a in mail_attachments]
     with transaction.atomic():
-        obj.save()
-        for attachment in attachments:
-            attachment.save()
+        MailImport.objects.bulk_create(mails)
+        MailAttachment.objects.bulk_create(attachments)
 
 
-def move_email(
+def move_emails(
     mail_box: MailInbox,
-    email: ValidatedEmail | ErrorEmail | AssignedEmail | FolderEmail,
+    emails: Sequence[ValidatedEmail | ErrorEmail | AssignedEmail | FolderEmail],
 ) -> None:
-    if isinstance(email, FolderEmail):
-        mail_box.delete_emails([email])
-    elif isinstance(email, ErrorEmail):
-        mail_box.mark_emails_as_error([email])
+    mail_box.delete_emails(list_filter(emails, lambda e: type(e) is FolderEmail))
+    mail_box.mark_emails_as_error(list_filter(emails, lambda e: type(e) is ErrorEmail))
 
 
 def log_emails(
@@ -274,19 +337,62 @@ def log_emails(
     logger.info(f"infolder: {len(infolder)}")
 
 
+def parse_email(raw_email: RawEmail) -> AssignedEmail | ValidatedEmail | ErrorEmail:
+    validated = validate_email(raw_email)
+    return assign_email_to_folder_uuid(validated)
+
+
+def import_emails_from_inbox(
+    mail_box: MailInbox, folders: dict[UUID, Folder], user: OrgUser
+) -> list[ValidatedEmail | ErrorEmail | AssignedEmail | FolderEmail]:
+    """
+    Imports the inbox in batches. While the workers parse and encrypt one
+    batch the next batch is already fetched from the server. Parsing and
+    encryption do not touch the database, the folder keys are unlocked once
+    per folder in this thread and every batch is saved with bulk writes.
+    Imported mails are flagged per batch and expunged once at the end.
+    """
+    uids = mail_box.search_uids()
+    batch_size = settings.MI_FETCH_BATCH_SIZE
+    folder_keys: dict[UUID, SymmetricKey] = {}
+    all_mails: list[ValidatedEmail | ErrorEmail | AssignedEmail | FolderEmail] = []
+
+    def get_lock_key(folder_uuid: UUID) -> SymmetricKey:
+        if folder_uuid not in folder_keys:
+            folder = folders[folder_uuid]
+            folder_keys[folder_uuid] = folder.get_encryption_key(requestor=user)
+        return folder_keys[folder_uuid]
+
+    def finish(parsed: list[Future]):
+        emails = [assign_email_to_folder(f.result(), folders, user) for f in parsed]
+        in_folder = [e for e in emails if isinstance(e, FolderEmail)]
+        keys = [get_lock_key(e.folder_uuid) for e in in_folder]
+        built = executor.map(lambda e, k: build_email(e, k, user), in_folder, keys)
+        save_emails(list(built))
+        close_attachments(emails)
+        move_emails(mail_box, emails)
+        all_mails.extend(emails)
+
+    with ThreadPoolExecutor(max_workers=settings.MI_IMPORT_WORKERS) as executor:
+        parsed: list[Future] = []
+        for i in range(0, len(uids), batch_size):
+            raw_emails = mail_box.fetch_raw_emails(uids[i : i + batch_size])
+            if parsed:
+                finish(parsed)
+            parsed = [executor.submit(parse_email, e) for e in raw_emails]
+        if parsed:
+            finish(parsed)
+
+    mail_box.expunge()
+    return all_mails
+
+
 @use_case
 def import_mails(__actor: OrgUser, r: FolderRepository):
     folders = r.get_dict(__actor.org_id)
     with MailInbox() as mail_box:
         mail_box.login()
-        all_mails = []
-        while email := mail_box.get_raw_email():
-            validated = validate_email(email)
-            assigned = assign_email_to_folder_uuid(validated)
-            infolder = assign_email_to_folder(assigned, folders, __actor)
-            save_email(infolder, __actor)
-            move_email(mail_box, infolder)
-            all_mails.append(infolder)
+        all_mails = import_emails_from_inbox(mail_box, folders, __actor)
         log_emails(all_mails)
 
 
@@ -0,0 +1,55 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from core.data_sheets.models import DataSheet
+from core.records.helpers import build_search_text
+from core.records.models import RecordsRecord
+
+
+class Command(BaseCommand):
+    help = (
+        "Computes the attributes of all records of an org again from their "
+        "data sheets. The records are loaded in batches together with the "
+        "entries of their data sheets."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("org_id", type=int)
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def handle(self, *args, **options):
+        records = RecordsRecord.objects.filter(org_id=options["org_id"]).order_by("pk")
+
+        done = 0
+        last_pk = 0
+        while True:
+            batch = list(records.filter(pk__gt=last_pk)[: options["batch_size"]])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            sheets = DataSheet.objects.filter(
+                folder_uuid__in=[r.folder_uuid for r in batch]
+            ).prefetch_related(
+                "state_entries__field",
+                "standard_entries__field",
+                "multiple_entries__field",
+                "select_entries__field",
+                "users_entries__field",
+                "users_entries__value",
+                "statistic_entries__field",
+            )
+            sheets_by_folder: dict = defaultdict(list)
+            for sheet in sheets:
+                sheets_by_folder[sheet.folder_uuid].append(sheet)
+
+            for record in batch:
+                record.set_attributes(sheets_by_folder[record.folder_uuid])
+                record.search_text = build_search_text(record.name, record.attributes)
+            RecordsRecord.objects.bulk_update(batch, ["attributes", "search_text"])
+
+            done += len(batch)
+            self.stdout.write("rebuilt {} records".format(done))
+
+        self.stdout.write("done: {} records".format(done))
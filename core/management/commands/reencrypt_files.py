@@ -0,0 +1,76 @@
+from getpass import getpass
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.auth.models import OrgUser
+from core.encryption.infrastructure.symmetric_encryptions import SymmetricEncryptionV1
+from core.encryption.models import Keyring
+from core.encryption.value_objects.asymmetric_key import AsymmetricKey
+from core.files_new.models import EncryptedRecordDocument
+from core.folders.infrastructure.folder_repository import DjangoFolderRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves the files of an org from S1 keys to S2 keys and the authenticated "
+        "file layout. The keys can only be unlocked with the password of a user, "
+        "files in folders the user has no access to are skipped. Only the files "
+        "are moved, data sheets, messages, uploads, mail imports and the other "
+        "boxes keep their S1 keys."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("email", help="Email of the user whose keys are used.")
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        user = OrgUser.objects.select_related("user").get(user__email=options["email"])
+        keyring = Keyring.objects.load(user)
+        password = getpass("Password of {}: ".format(user.email))
+        key = keyring.get_user_key_from_password(password).key
+        assert isinstance(key, AsymmetricKey)
+        keyring.decryption_key = key
+        user.keyring = keyring
+
+        folders = DjangoFolderRepository().get_dict(user.org_id)
+        files = EncryptedRecordDocument.objects.filter(
+            org_id=user.org_id, key__origin=SymmetricEncryptionV1.VERSION
+        ).order_by("pk")
+
+        done, skipped, failed = 0, 0, 0
+        last_pk = 0
+        while True:
+            batch = list(files.filter(pk__gt=last_pk)[: options["batch_size"]])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            old_locations: list[str] = []
+            with transaction.atomic():
+                for file in batch:
+                    folder = folders.get(file.folder_uuid)
+                    if folder is None or not folder.has_access(user):
+                        skipped += 1
+                        continue
+                    file._folder = folder
+                    try:
+                        old_location = file.reencrypt(user)
+                    except Exception as e:
+                        self.stderr.write("file {} failed: {}".format(file.pk, e))
+                        failed += 1
+                        continue
+                    file.save()
+                    if old_location:
+                        old_locations.append(old_location)
+                    done += 1
+
+            # the old files are only deleted after their new keys are stored
+            for location in old_locations:
+                default_storage.delete(location)
+            self.stdout.write("re-encrypted {} files".format(done))
+
+        self.stdout.write(
+            "done: {}, skipped: {}, failed: {}".format(done, skipped, failed)
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 6.1.2 on 2026-10-18 10:03
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0170_alter_calendareventreminder_method_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="loggedpath",
+            name="time",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 6.1.2 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+from core.records.helpers import build_search_text
+
+
+def fill_search_text(apps, schema_editor):
+    RecordsRecord = apps.get_model("core", "RecordsRecord")
+    batch = []
+    for record in RecordsRecord.objects.only("pk", "name", "attributes").iterator(
+        chunk_size=2000
+    ):
+        record.search_text = build_search_text(record.name, record.attributes)
+        batch.append(record)
+        if len(batch) >= 2000:
+            RecordsRecord.objects.bulk_update(batch, ["search_text"])
+            batch = []
+    RecordsRecord.objects.bulk_update(batch, ["search_text"])
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # sqlite has no trigram indexes, the search falls back to a full scan there
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS core_records_search_text_trgm "
+        "ON core_recordsrecord USING gin (search_text gin_trgm_ops)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS core_records_name_upper_trgm "
+        'ON core_recordsrecord USING gin (UPPER("name"::text) gin_trgm_ops)'
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS core_records_search_text_trgm")
+    schema_editor.execute("DROP INDEX IF EXISTS core_records_name_upper_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0171_alter_loggedpath_time"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recordsrecord",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,145 @@
+# Generated by Django 6.1.2 on 2026-10-18 10:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0172_recordsrecord_search_text"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatisticsRollupState",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("until", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "STA_StatisticsRollupState",
+                "verbose_name_plural": "STA_StatisticsRollupStates",
+            },
+        ),
+        migrations.CreateModel(
+            name="StatisticsSheetValue",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=20)),
+                ("field", models.CharField(max_length=200)),
+                ("value", models.TextField()),
+                ("month", models.DateField()),
+                (
+                    "data_sheet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="statistics_values",
+                        to="core.datasheet",
+                    ),
+                ),
+                (
+                    "org",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="statistics_sheet_values",
+                        to="core.org",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "STA_StatisticsSheetValue",
+                "verbose_name_plural": "STA_StatisticsSheetValues",
+                "indexes": [
+                    models.Index(
+                        fields=["org", "kind", "field"],
+                        name="core_statis_org_id_e8fe3d_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="StatisticsUserDay",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(db_index=True)),
+                ("actions", models.IntegerField(default=0)),
+                ("logins", models.IntegerField(default=0)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="statistics_days",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "STA_StatisticsUserDay",
+                "verbose_name_plural": "STA_StatisticsUserDays",
+                "unique_together": {("user", "day")},
+            },
+        ),
+        migrations.CreateModel(
+            name="StatisticsValueMonth",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=20)),
+                ("field", models.CharField(max_length=200)),
+                ("value", models.TextField()),
+                ("month", models.DateField()),
+                ("count", models.IntegerField()),
+                (
+                    "org",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="statistics_value_months",
+                        to="core.org",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "STA_StatisticsValueMonth",
+                "verbose_name_plural": "STA_StatisticsValueMonths",
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "field"], name="core_statis_kind_31e3cc_idx"
+                    )
+                ],
+            },
+        ),
+    ]
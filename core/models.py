@@ -14,6 +14,7 @@ from .org.models import *
 from .other.models import *
 from .permissions.models import *
 from .records.models import *
+from .statistics.models import *
 from .tasks.models import *
 from .timeline.models import *
 from .upload.models import *
@@ -8,6 +8,7 @@ from core.encryption.value_objects.symmetric_key import (
     SymmetricKey,
 )
 from core.org.models.org import Org
+from core.permissions.matrix import invalidate_permission_matrix
 from core.seedwork.domain_layer import DomainError
 
 if TYPE_CHECKING:
@@ -99,6 +100,8 @@ class Group(models.Model):
             self.members.add(new_member)
             new_member.keyring.store()
 
+        invalidate_permission_matrix(self.org_id)
+
     def remove_member(self, member: "OrgUser"):
         if not self.has_member(member):
             raise DomainError("The user is not a member of this group.")
@@ -109,3 +112,5 @@ class Group(models.Model):
             self.save()
             self.members.remove(member)
             member.keyring.store()
+
+        invalidate_permission_matrix(self.org_id)
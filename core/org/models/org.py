@@ -6,6 +6,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import models, transaction
 from django.utils import timezone
 
+from core.encryption.key_distribution import distribute
 from core.seedwork.domain_layer import DomainError
 from core.seedwork.encryption import AESEncryption, EncryptedModelMixin, RSAEncryption
 
@@ -225,14 +226,22 @@ class Org(EncryptedModelMixin, models.Model):
         # create encryption keys for users to be able to decrypt org private key with users private key
         # the aes key is encrypted with the users public key, but only the user's private key can decrypt
         # the encrypted aes key
-        for org_user in self.users.all():
-            OrgEncryption.objects.filter(user=org_user.user, rlc=self).delete()
-            user_rlc_keys = OrgEncryption(
-                user=org_user.user, rlc=self, encrypted_key=aes_key
+        org_users = list(self.users.select_related("user", "keyring"))
+        encrypted_keys = distribute(
+            lambda u: RSAEncryption.encrypt(aes_key, u.keyring.get_public_key()),
+            org_users,
+        )
+        user_rlc_keys = []
+        for org_user, encrypted_key in zip(org_users, encrypted_keys):
+            keys = OrgEncryption(
+                user=org_user.user, rlc=self, encrypted_key=encrypted_key
             )
-            public_key_user = org_user.keyring.get_public_key()
-            user_rlc_keys.encrypt(public_key_user)
-            user_rlc_keys.save()
+            user_rlc_keys.append(keys)
+        with transaction.atomic():
+            OrgEncryption.objects.filter(
+                rlc=self, user__in=[u.user for u in org_users]
+            ).delete()
+            OrgEncryption.objects.bulk_create(user_rlc_keys)
 
     def accept_member(self, admin: "OrgUser", member: "OrgUser"):
         from core.folders.infrastructure.folder_repository import DjangoFolderRepository
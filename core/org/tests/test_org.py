@@ -2,7 +2,7 @@ import pytest
 from django.test import Client
 
 from core.models import Org
-from core.org.models import ExternalLink
+from core.org.models import ExternalLink, OrgEncryption
 from core.org.models.group import Group
 from core.org.use_cases.link import create_link, delete_link
 from core.org.use_cases.org import accept_member_to_org
@@ -90,3 +90,20 @@ def test_accepted_member_assigned_to_default_group(user, org_user, db):
     accept_member_to_org(org_user, another_user["org_user"].pk)
     group.refresh_from_db()
     assert group.has_member(another_user["org_user"])
+
+
+def test_generate_keys_wraps_the_key_for_every_user(db, settings):
+    settings.KEY_DISTRIBUTION_WORKERS = 2
+    org = Org.objects.create(name="New Clinic")
+    users = [
+        test_helpers.create_org_user(email=f"user{i}@law-orga.de", org=org)
+        for i in range(3)
+    ]
+    org.generate_keys()
+
+    assert OrgEncryption.objects.filter(rlc=org).count() == 3
+    aes_keys = {
+        org.get_aes_key(user=data["user"], private_key_user=data["private_key"])
+        for data in users
+    }
+    assert len(aes_keys) == 1
@@ -0,0 +1,80 @@
+import atexit
+import threading
+import time
+from logging import getLogger
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import transaction
+
+from core.models import UserProfile
+from core.other.models.logged_path import LoggedPath
+
+logger = getLogger("django")
+
+
+class LoggedPathBuffer:
+    """
+    Collects LoggedPath rows in memory and writes them with one bulk insert.
+    The buffer is flushed when it is full, when the oldest row is older than
+    'max_seconds', after every request and when the process exits.
+    """
+
+    def __init__(self, max_size: int = 100, max_seconds: float = 5.0):
+        self.max_size = max_size
+        self.max_seconds = max_seconds
+        self.__lock = threading.Lock()
+        self.__rows: list[LoggedPath] = []
+        self.__oldest: float | None = None
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def add(self, user: UserProfile | None, path: str, status: int, method: str):
+        row = LoggedPath(user=user, path=path, status=status, method=method)
+
+        with self.__lock:
+            self.__rows.append(row)
+            if self.__oldest is None:
+                self.__oldest = time.monotonic()
+            full = len(self.__rows) >= self.max_size
+            old = time.monotonic() - self.__oldest >= self.max_seconds
+
+        if full or old:
+            # the rows of all threads must not become part of the transaction
+            # of this caller, without a transaction the flush runs right away
+            transaction.on_commit(self.flush)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__rows = []
+            self.__oldest = None
+
+    def flush(self, *args, **kwargs) -> int:
+        with self.__lock:
+            rows = self.__rows
+            self.__rows = []
+            self.__oldest = None
+
+        if len(rows) == 0:
+            return 0
+
+        try:
+            with transaction.atomic():
+                LoggedPath.objects.bulk_create(rows)
+        except Exception:
+            logger.exception(f"{len(rows)} logged paths could not be saved.")
+            return 0
+
+        return len(rows)
+
+
+LOGGED_PATH_BUFFER = LoggedPathBuffer(
+    max_size=settings.LOGGED_PATH_BUFFER_SIZE,
+    max_seconds=settings.LOGGED_PATH_BUFFER_SECONDS,
+)
+
+request_finished.connect(
+    LOGGED_PATH_BUFFER.flush, dispatch_uid="flush_logged_path_buffer"
+)
+atexit.register(LOGGED_PATH_BUFFER.flush)
@@ -13,7 +13,7 @@ class LoggedPath(models.Model):
         on_delete=models.CASCADE,
         related_name="logged_paths",
     )
-    time = models.DateTimeField(auto_now_add=True, db_index=True)
+    time = models.DateTimeField(default=timezone.now, db_index=True)
     status = models.IntegerField(default=0)
     method = models.CharField(default="UNKNOWN", max_length=20)
 
@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from django.core.signals import request_finished
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import UserProfile
+from core.other.logged_path_buffer import LOGGED_PATH_BUFFER, LoggedPathBuffer
+from core.other.models.logged_path import LoggedPath
+
+
+def test_rows_are_written_when_the_buffer_is_full(
+    db, django_capture_on_commit_callbacks
+):
+    user = UserProfile.objects.create(email="dummy@law-orga.de", name="Dummy")
+    buffer = LoggedPathBuffer(max_size=3, max_seconds=60)
+
+    buffer.add(user=user, path="a", status=200, method="USECASE")
+    buffer.add(user=user, path="b", status=400, method="USECASE")
+    assert LoggedPath.objects.count() == 0
+    assert len(buffer) == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        buffer.add(user=user, path="c", status=200, method="USECASE")
+    assert LoggedPath.objects.count() == 3
+    assert len(buffer) == 0
+
+
+def test_rows_keep_the_time_they_were_added(db):
+    buffer = LoggedPathBuffer(max_size=10, max_seconds=60)
+    before = timezone.now()
+    buffer.add(user=None, path="a", status=200, method="USECASE")
+    assert buffer.flush() == 1
+    path = LoggedPath.objects.get()
+    assert before <= path.time <= before + timedelta(seconds=5)
+
+
+def test_old_rows_are_written_on_the_next_add(db, django_capture_on_commit_callbacks):
+    buffer = LoggedPathBuffer(max_size=10, max_seconds=0)
+    with django_capture_on_commit_callbacks(execute=True):
+        buffer.add(user=None, path="a", status=200, method="USECASE")
+    assert LoggedPath.objects.count() == 1
+
+
+def test_rows_are_not_written_inside_the_transaction_of_the_caller(db):
+    buffer = LoggedPathBuffer(max_size=1, max_seconds=60)
+    try:
+        with transaction.atomic():
+            buffer.add(user=None, path="a", status=200, method="USECASE")
+            raise ValueError()
+    except ValueError:
+        pass
+    assert LoggedPath.objects.count() == 0
+    assert buffer.flush() == 1
+    assert LoggedPath.objects.count() == 1
+
+
+def test_buffer_is_flushed_when_a_request_finishes(db, settings):
+    LOGGED_PATH_BUFFER.max_size = 10
+    try:
+        LOGGED_PATH_BUFFER.add(user=None, path="a", status=200, method="USECASE")
+        assert LoggedPath.objects.count() == 0
+        request_finished.send(sender=None)
+        assert LoggedPath.objects.count() == 1
+    finally:
+        LOGGED_PATH_BUFFER.max_size = settings.LOGGED_PATH_BUFFER_SIZE
+
+
+def test_failed_flush_does_not_raise(db):
+    buffer = LoggedPathBuffer(max_size=10, max_seconds=60)
+    unsaved_user = UserProfile(email="dummy@law-orga.de", name="Dummy")
+    buffer.add(user=unsaved_user, path="a", status=200, method="USECASE")
+    assert buffer.flush() == 0
+    assert len(buffer) == 0
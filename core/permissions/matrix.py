@@ -0,0 +1,107 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from core.permissions.models import HasPermission
+
+
+class PermissionMatrix:
+    """
+    Knows which permissions every user of an org holds, either directly or
+    through one of their groups. It is built with two queries so that loops
+    over all users of an org do not need to check permissions one by one.
+    """
+
+    @classmethod
+    def load(cls, org_id: int) -> "PermissionMatrix":
+        permissions: dict[int, set[str]] = defaultdict(set)
+
+        as_user = HasPermission.objects.filter(user__org_id=org_id)
+        for name, user_id in as_user.values_list("permission__name", "user_id"):
+            permissions[user_id].add(name)
+
+        as_group = HasPermission.objects.filter(
+            group_has_permission__org_id=org_id,
+            group_has_permission__members__isnull=False,
+        )
+        for name, user_id in as_group.values_list(
+            "permission__name", "group_has_permission__members"
+        ):
+            permissions[user_id].add(name)
+
+        return cls(org_id, permissions)
+
+    def __init__(self, org_id: int, permissions: dict[int, set[str]]):
+        self.org_id = org_id
+        self.__permissions = permissions
+
+    def has_permission(self, user_id: int, permission: str) -> bool:
+        return permission in self.__permissions.get(user_id, set())
+
+    def permissions_of(self, user_id: int) -> set[str]:
+        return set(self.__permissions.get(user_id, set()))
+
+    def users_with(self, permission: str) -> set[int]:
+        return {
+            user_id
+            for user_id, names in self.__permissions.items()
+            if permission in names
+        }
+
+
+class PermissionMatrixCache:
+    def __init__(self):
+        self.__matrices: dict[int, PermissionMatrix] = {}
+
+    def get(self, org_id: int) -> PermissionMatrix:
+        if org_id not in self.__matrices:
+            self.__matrices[org_id] = PermissionMatrix.load(org_id)
+        return self.__matrices[org_id]
+
+    def invalidate(self, org_id: Optional[int] = None) -> None:
+        if org_id is None:
+            self.__matrices.clear()
+        else:
+            self.__matrices.pop(org_id, None)
+
+
+_permission_matrix_cache: ContextVar[Optional[PermissionMatrixCache]] = ContextVar(
+    "permission_matrix_cache", default=None
+)
+
+
+def get_permission_matrix(org_id: int) -> PermissionMatrix:
+    """
+    Returns the permission matrix of the org. Inside of a permission matrix
+    cache block the matrix is loaded only once.
+    """
+    cache = _permission_matrix_cache.get()
+    if cache is None:
+        return PermissionMatrix.load(org_id)
+    return cache.get(org_id)
+
+
+def get_permission_matrix_cache() -> Optional[PermissionMatrixCache]:
+    return _permission_matrix_cache.get()
+
+
+def invalidate_permission_matrix(org_id: Optional[int] = None) -> None:
+    cache = _permission_matrix_cache.get()
+    if cache is not None:
+        cache.invalidate(org_id)
+
+
+@contextmanager
+def permission_matrix_cache() -> Iterator[PermissionMatrixCache]:
+    cache = _permission_matrix_cache.get()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = PermissionMatrixCache()
+    token = _permission_matrix_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _permission_matrix_cache.reset(token)
@@ -0,0 +1,64 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.permissions.matrix import (
+    PermissionMatrix,
+    get_permission_matrix,
+    invalidate_permission_matrix,
+    permission_matrix_cache,
+)
+from core.permissions.models import HasPermission, Permission
+from core.permissions.static import (
+    PERMISSION_ADMIN_MANAGE_USERS,
+    PERMISSION_RECORDS_ACCESS_ALL_RECORDS,
+)
+from core.tests import test_helpers
+
+
+def test_matrix_resolves_user_and_group_permissions(db):
+    org = test_helpers.create_org("Test Org")["org"]
+    u1 = test_helpers.create_org_user(org=org, email="u1@law-orga.de")["org_user"]
+    u2 = test_helpers.create_org_user(org=org, email="u2@law-orga.de")["org_user"]
+    u3 = test_helpers.create_org_user(org=org, email="u3@law-orga.de")["org_user"]
+    group = test_helpers.create_raw_group(org=org, members=[u2], save=True)
+    access_all = Permission.objects.get(name=PERMISSION_RECORDS_ACCESS_ALL_RECORDS)
+    manage_users = Permission.objects.get(name=PERMISSION_ADMIN_MANAGE_USERS)
+    HasPermission.objects.create(user=u1, permission=access_all)
+    HasPermission.objects.create(group_has_permission=group, permission=access_all)
+    HasPermission.objects.create(group_has_permission=group, permission=manage_users)
+
+    with CaptureQueriesContext(connection) as queries:
+        matrix = PermissionMatrix.load(org.pk)
+    assert len(queries) == 2
+
+    assert matrix.users_with(PERMISSION_RECORDS_ACCESS_ALL_RECORDS) == {u1.pk, u2.pk}
+    assert matrix.permissions_of(u2.pk) == {
+        PERMISSION_RECORDS_ACCESS_ALL_RECORDS,
+        PERMISSION_ADMIN_MANAGE_USERS,
+    }
+    assert matrix.permissions_of(u3.pk) == set()
+    for u in [u1, u2, u3]:
+        for name in [
+            PERMISSION_RECORDS_ACCESS_ALL_RECORDS,
+            PERMISSION_ADMIN_MANAGE_USERS,
+        ]:
+            assert matrix.has_permission(u.pk, name) == u.has_permission(name)
+
+
+def test_matrix_is_cached_and_invalidated(db):
+    org_user = test_helpers.create_org_user()["org_user"]
+
+    with permission_matrix_cache():
+        assert not org_user.has_permission(PERMISSION_ADMIN_MANAGE_USERS)
+        with CaptureQueriesContext(connection) as queries:
+            assert not org_user.has_permission(PERMISSION_ADMIN_MANAGE_USERS)
+            assert get_permission_matrix(org_user.org_id) is not None
+        assert len(queries) == 0
+
+        org_user.grant(PERMISSION_ADMIN_MANAGE_USERS)
+        assert org_user.has_permission(PERMISSION_ADMIN_MANAGE_USERS)
+
+        HasPermission.objects.filter(user=org_user).delete()
+        assert org_user.has_permission(PERMISSION_ADMIN_MANAGE_USERS)
+        invalidate_permission_matrix(org_user.org_id)
+        assert not org_user.has_permission(PERMISSION_ADMIN_MANAGE_USERS)
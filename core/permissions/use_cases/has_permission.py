@@ -1,6 +1,7 @@
 from core.auth.models.org_user import OrgUser
 from core.auth.use_cases.finders import org_user_from_id
 from core.org.use_cases.finders import group_from_id
+from core.permissions.matrix import invalidate_permission_matrix
 from core.permissions.models import HasPermission
 from core.permissions.static import PERMISSION_ADMIN_MANAGE_PERMISSIONS
 from core.permissions.use_cases.finders import (
@@ -32,8 +33,11 @@ def create_has_permission(
         has_permission = HasPermission.create(group=group, permission=permission)
         has_permission.save()
 
+    invalidate_permission_matrix(__actor.org_id)
+
 
 @use_case(permissions=[PERMISSION_ADMIN_MANAGE_PERMISSIONS])
 def delete_has_permission(__actor: OrgUser, has_permission_id: int):
     has_permission = has_permission_from_id(__actor, has_permission_id)
     has_permission.delete()
+    invalidate_permission_matrix(__actor.org_id)
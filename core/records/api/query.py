@@ -65,11 +65,14 @@ class OutputRecord(BaseModel):
 class OutputRecordsPage(BaseModel):
     records: list[OutputRecord]
     total: int
+    next_cursor: str | None = None
 
 
 class QueryInput(BaseModel):
     limit: int
-    offset: int
+    offset: int = 0
+    cursor: str | None = None
+    cached_total: bool = False
     token: str | None = None
     year: int | None = None
     general: str | None = None
@@ -91,12 +94,14 @@ def query__records_page(org_user: OrgUser, data: QueryInput):
     rr = RecordRepository()
     fr = DjangoFolderRepository()
 
-    records, total = rr.list(
+    page = rr.list_page(
         org_user.org_id,
         RrSearch(token=data.token, year=data.year, general=data.general),
-        Pagination(limit=data.limit, offset=data.offset),
+        Pagination(limit=data.limit, offset=data.offset, cursor=data.cursor),
         data.order_by,
+        cached_total=data.cached_total,
     )
+    records = page.records
     folder_uuids = list_map(records, lambda r: r.folder_uuid)
 
     foldersl = fr.list_by_uuids(org_user.org_id, folder_uuids)
@@ -118,7 +123,8 @@ def query__records_page(org_user: OrgUser, data: QueryInput):
 
     return {
         "records": records_2,
-        "total": total,
+        "total": page.total,
+        "next_cursor": page.next_cursor,
     }
 
 
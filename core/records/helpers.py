@@ -1,3 +1,6 @@
+import json
+
+
 def merge_attrs(attrs1, attrs2):
     all_attrs = list(attrs1.items()) + list(attrs2.items())
     attrs = {}
@@ -15,3 +18,22 @@ def merge_attrs(attrs1, attrs2):
         attrs[key] = attrs[key] + value
 
     return attrs
+
+
+def normalize_search_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def build_search_text(name: str, attributes: str) -> str:
+    try:
+        attrs = json.loads(attributes)
+    except ValueError:
+        attrs = {}
+
+    parts = [name]
+    if isinstance(attrs, dict):
+        for value in attrs.values():
+            values = value if isinstance(value, list) else [value]
+            parts.extend(str(v) for v in values if v is not None)
+
+    return normalize_search_text(" ".join(parts))
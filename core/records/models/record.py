@@ -1,8 +1,15 @@
 import json
-from typing import TYPE_CHECKING
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import datetime
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 from pydantic import BaseModel
 
@@ -11,7 +18,11 @@ from core.folders.domain.aggregates.folder import Folder
 from core.folders.domain.repositories.item import ItemRepository
 from core.folders.infrastructure.item_mixins import FolderItemMixin
 from core.org.models import Org
-from core.records.helpers import merge_attrs
+from core.records.helpers import (
+    build_search_text,
+    merge_attrs,
+    normalize_search_text,
+)
 from core.seedwork.domain_layer import DomainError
 from messagebus.domain.collector import EventCollector
 
@@ -22,6 +33,7 @@ if TYPE_CHECKING:
 class Pagination(BaseModel):
     limit: int = 10
     offset: int = 0
+    cursor: str | None = None
 
     @property
     def start(self):
@@ -31,20 +43,91 @@ class Pagination(BaseModel):
     def end(self):
         return self.limit
 
+    @property
+    def size(self):
+        return max(self.end - self.start, 0)
+
 
 class Search(BaseModel):
     token: str | None = None
     year: int | None = None
     general: str | None = None
 
+    @property
+    def cache_key(self) -> str:
+        return f"{self.token}|{self.year}|{self.general}"
+
+
+@dataclass
+class RecordsPage:
+    records: list["RecordsRecord"]
+    total: int
+    next_cursor: str | None = None
+
+
+def encode_cursor(order_by: str, record: "RecordsRecord") -> str:
+    value = getattr(record, order_by.lstrip("-"))
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    data = json.dumps([order_by, value, record.pk])
+    return urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, order_by: str) -> tuple[Any, int]:
+    try:
+        data = json.loads(urlsafe_b64decode(cursor.encode("ascii")))
+        cursor_order_by, value, pk = data
+    except ValueError, TypeError:
+        raise DomainError("The cursor is invalid.")
+    if cursor_order_by != order_by:
+        raise DomainError("The cursor does not belong to this ordering.")
+    if not isinstance(pk, int) or isinstance(pk, bool):
+        raise DomainError("The cursor is invalid.")
+    field = order_by.lstrip("-")
+    try:
+        if isinstance(RecordsRecord._meta.get_field(field), models.DateTimeField):
+            value = datetime.fromisoformat(value)
+    except ValueError, TypeError:
+        raise DomainError("The cursor is invalid.")
+    return value, pk
+
 
 class RecordRepository(ItemRepository):
     IDENTIFIER = "RECORDS_RECORD"
+    CURSOR_FIELDS = ["created", "updated", "name", "id"]
 
     def delete_items_of_folder(self, folder_uuid: UUID, org_pk: int | None) -> None:
         _org_id = org_pk if org_pk else 0
         RecordsRecord.objects.filter(folder_uuid=folder_uuid, org_id=_org_id).delete()
 
+    def __filter(self, org_pk: int, search: Search) -> models.QuerySet:
+        records = RecordsRecord.objects.filter(org_id=org_pk)
+        if search.token:
+            # uses the trigram index on upper(name) on postgres
+            records = records.filter(name__icontains=search.token)
+        if search.year:
+            if search.year < 1900 or search.year > 2100:
+                raise DomainError("Year must be between 1900 and 2100")
+            records = records.filter(created__year=search.year)
+        if search.general:
+            # search_text is lower case, that is why a case sensitive lookup
+            # works here and can use the trigram index on postgres
+            general = normalize_search_text(search.general)
+            records = records.filter(search_text__contains=general)
+        return records
+
+    def __count(
+        self, org_pk: int, search: Search, records: models.QuerySet, cached: bool
+    ) -> int:
+        if not cached:
+            return records.count()
+        key = f"records-total-{org_pk}-{sha256(search.cache_key.encode()).hexdigest()}"
+        total = cache.get(key)
+        if total is None:
+            total = records.count()
+            cache.set(key, total, settings.RECORDS_TOTAL_CACHE_SECONDS)
+        return total
+
     def list(
         self,
         org_pk: int,
@@ -52,23 +135,55 @@ class RecordRepository(ItemRepository):
         pagination: Pagination,
         order_by: str | None = "-created",
     ) -> tuple[list["RecordsRecord"], int]:
+        page = self.list_page(org_pk, search, pagination, order_by)
+        return page.records, page.total
+
+    def list_page(
+        self,
+        org_pk: int,
+        search: Search,
+        pagination: Pagination,
+        order_by: str | None = "-created",
+        cached_total: bool = False,
+    ) -> RecordsPage:
+        """
+        Returns a page of records. If the pagination has a cursor the page
+        starts right after the record the cursor points to, which does not get
+        slower the deeper the page is. With 'cached_total' the total is only
+        counted again after RECORDS_TOTAL_CACHE_SECONDS.
+        """
         if order_by is None:
             order_by = "-created"
-        records = RecordsRecord.objects.filter(org_id=org_pk)
-        if search.token:
-            records = records.filter(name__icontains=search.token)
-        if search.year:
-            if search.year < 1900 or search.year > 2100:
-                raise DomainError("Year must be between 1900 and 2100")
-            records = records.filter(created__year=search.year)
-        if search.general:
-            records = records.filter(attributes__icontains=search.general)
+        records = self.__filter(org_pk, search)
+        total = self.__count(org_pk, search, records, cached_total)
+
+        field = order_by.lstrip("-")
+        descending = order_by.startswith("-")
+        keyset = field in self.CURSOR_FIELDS
+        if keyset:
+            tiebreaker = "-id" if descending else "id"
+            records = records.order_by(order_by, tiebreaker)
+        else:
+            records = records.order_by(order_by)
+
+        if pagination.cursor is not None:
+            if not keyset:
+                raise DomainError("This ordering can not be used with a cursor.")
+            value, pk = decode_cursor(pagination.cursor, order_by)
+            lookup = "lt" if descending else "gt"
+            records = records.filter(
+                Q(**{f"{field}__{lookup}": value})
+                | Q(**{field: value, f"id__{lookup}": pk})
+            )
+            page = list(records[: pagination.size])
+        else:
+            page = list(records[pagination.start : pagination.end])
+
+        next_cursor = None
+        if keyset and len(page) > 0 and len(page) == pagination.size:
+            next_cursor = encode_cursor(order_by, page[-1])
 
-        filtered_count = records.count()
-        records = records.order_by(order_by)
-        if pagination:
-            records = records[pagination.start : pagination.end]
-        return list(records), filtered_count
+        return RecordsPage(records=page, total=total, next_cursor=next_cursor)
 
 
 class RecordsRecord(FolderItemMixin, models.Model):
@@ -94,6 +209,9 @@ class RecordsRecord(FolderItemMixin, models.Model):
     created = models.DateTimeField(auto_now_add=True)
     updated = models.DateTimeField(auto_now=True)
     attributes = models.TextField(default="{}")
+    # normalized token and attribute values for the dashboard search, the
+    # trigram indexes are created by migration 0172 on postgres only
+    search_text = models.TextField(default="", blank=True, editable=False)
 
     if TYPE_CHECKING:
         org_id: int
@@ -107,6 +225,15 @@ class RecordsRecord(FolderItemMixin, models.Model):
             self.uuid, self.token, self.org_pk
         )
 
+    def save(self, *args, **kwargs):
+        self.search_text = build_search_text(self.name, self.attributes)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and (
+            "name" in update_fields or "attributes" in update_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, "search_text"}
+        super().save(*args, **kwargs)
+
     @property
     def org_pk(self) -> int:
         return self.org_id
@@ -129,6 +256,28 @@ class RecordsRecord(FolderItemMixin, models.Model):
         attrs["Updated"] = self.updated.isoformat(timespec="seconds")
         self.attributes = json.dumps(attrs)
 
+    def patch_attribute(
+        self, data_sheet: "DataSheet", key: str, value: list[str] | str | None
+    ) -> bool:
+        """
+        Changes a single attribute after one entry of the data sheet changed,
+        a value of None removes the attribute. Returns False if the attributes
+        need to be rebuilt with set_attributes, because other data sheets of
+        the record could hold a value for the same key.
+        """
+        attrs = json.loads(self.attributes)
+        if attrs.get("sheet_uuids") != [str(data_sheet.uuid)]:
+            return False
+        if key in ["sheet_uuids", "Created", "Updated", "Name"]:
+            return False
+        if value is None:
+            attrs.pop(key, None)
+        else:
+            attrs[key] = value
+        attrs["Updated"] = timezone.now().isoformat(timespec="seconds")
+        self.attributes = json.dumps(attrs)
+        return True
+
     def update_timestamps(self):
         attrs = json.loads(self.attributes)
         attrs["Updated"] = timezone.now().isoformat(timespec="seconds")
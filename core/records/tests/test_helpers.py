@@ -1,4 +1,4 @@
-from core.records.helpers import merge_attrs
+from core.records.helpers import build_search_text, merge_attrs
 
 
 def test_merge_attrs():
@@ -41,3 +41,12 @@ def test_merge_attrs_list_reverse():
         "b": [4, "a", "b"],
         "d": 4,
     }
+
+
+def test_build_search_text():
+    attributes = '{"Name": "Müller  Anna", "Tags": ["Asyl", null], "Age": 3}'
+    assert build_search_text("AZ-001", attributes) == "az-001 müller anna asyl 3"
+
+
+def test_build_search_text_with_broken_attributes():
+    assert build_search_text("AZ-001", "not json") == "az-001"
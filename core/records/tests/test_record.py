@@ -1,5 +1,8 @@
 import json
+from base64 import urlsafe_b64encode
 
+import pytest
+from django.core.cache import cache
 from django.test import Client
 
 from core.data_sheets.models.data_sheet import DataSheet
@@ -10,9 +13,16 @@ from core.permissions.static import (
     PERMISSION_RECORDS_ADD_RECORD,
 )
 from core.records.models.deletion import RecordsDeletion
-from core.records.models.record import RecordsRecord
+from core.records.models.record import (
+    Pagination,
+    RecordRepository,
+    RecordsRecord,
+    Search,
+    decode_cursor,
+)
 from core.records.use_cases.deletion import accept_deletion_request
 from core.records.use_cases.record import create_record_and_folder
+from core.seedwork.domain_layer import DomainError
 from core.tests import test_helpers
 
 
@@ -84,3 +94,84 @@ def test_delete_deletes_data_sheet_as_well(db):
     deletion.save()
     accept_deletion_request(user, deletion.uuid)
     assert DataSheet.objects.count() == data_sheet_count
+
+
+def test_general_search_uses_search_text(db):
+    full_user = test_helpers.create_org_user()
+    user = full_user["org_user"]
+    user.grant(PERMISSION_RECORDS_ADD_RECORD)
+    create_record_and_folder(user, "AZ-001", None)
+    create_record_and_folder(user, "AZ-002", None)
+    record = RecordsRecord.objects.get(name="AZ-002")
+    record.attributes = json.dumps({"Client": "Jane  DOE"})
+    record.save(update_fields=["attributes"])
+    record.refresh_from_db()
+    assert record.search_text == "az-002 jane doe"
+
+    r = RecordRepository()
+    found, total = r.list(user.org_id, Search(general="jane doe"), Pagination())
+    assert total == 1 and found[0].pk == record.pk
+    found, total = r.list(user.org_id, Search(general="AZ-00"), Pagination())
+    assert total == 2
+    found, total = r.list(user.org_id, Search(token="az-001"), Pagination())
+    assert total == 1
+
+
+def test_dashboard_pages_with_a_cursor(db):
+    full_user = test_helpers.create_org_user()
+    user = full_user["org_user"]
+    user.grant(PERMISSION_RECORDS_ADD_RECORD)
+    for i in range(5):
+        create_record_and_folder(user, f"AZ-00{i}", None)
+
+    client = Client()
+    client.login(**full_user)
+    tokens: list[str] = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2, "order_by": "name"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/records/query/dashboard/", params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        tokens += [r["token"] for r in data["records"]]
+        cursor = data["next_cursor"]
+    assert tokens == [f"AZ-00{i}" for i in range(5)]
+    assert cursor is None
+
+
+def test_broken_cursors_raise_a_domain_error():
+    def cursor(data) -> str:
+        return urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+    broken = [
+        ("name", "not base64 ~"),
+        ("created", cursor(["created", "yesterday", 1])),
+        ("created", cursor(["created", None, 1])),
+        ("name", cursor(["name", "AZ-001", "1"])),
+        ("name", cursor(["name", "AZ-001", None])),
+    ]
+    for order_by, c in broken:
+        with pytest.raises(DomainError):
+            decode_cursor(c, order_by)
+
+
+def test_dashboard_total_can_be_cached(db):
+    cache.clear()
+    full_user = test_helpers.create_org_user()
+    user = full_user["org_user"]
+    user.grant(PERMISSION_RECORDS_ADD_RECORD)
+    create_record_and_folder(user, "AZ-001", None)
+
+    r = RecordRepository()
+    search = Search(general=str(user.uuid))
+    page = r.list_page(user.org_id, Search(), Pagination(), cached_total=True)
+    assert page.total == 1
+    create_record_and_folder(user, "AZ-002", None)
+    page = r.list_page(user.org_id, Search(), Pagination(), cached_total=True)
+    assert page.total == 1
+    page = r.list_page(user.org_id, Search(), Pagination())
+    assert page.total == 2
+    assert r.list_page(user.org_id, search, Pagination(), cached_total=True).total == 0
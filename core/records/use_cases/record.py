@@ -6,6 +6,7 @@ from django.db import transaction
 from core.auth.models.org_user import OrgUser
 from core.folders.domain.aggregates.folder import Folder
 from core.folders.domain.repositories.folder import FolderRepository
+from core.permissions.matrix import get_permission_matrix
 from core.permissions.static import (
     PERMISSION_RECORDS_ACCESS_ALL_RECORDS,
     PERMISSION_RECORDS_ADD_RECORD,
@@ -42,8 +43,10 @@ def create_record_and_folder(
     )
     folder.grant_access(__actor)
 
+    matrix = get_permission_matrix(__actor.org_id)
+    should_access_ids = matrix.users_with(PERMISSION_RECORDS_ACCESS_ALL_RECORDS)
     for user in list(__actor.org.users.all()):
-        should_access = user.has_permission(PERMISSION_RECORDS_ACCESS_ALL_RECORDS)
+        should_access = user.pk in should_access_ids
         has_access = folder.has_access(user)
         if should_access and not has_access:
             folder.grant_access(user, __actor)
@@ -27,7 +27,12 @@ from django.http import (
 )
 from django.urls import path
 from django.utils.module_loading import import_string
-from pydantic import BaseModel, ValidationError, create_model
+from pydantic import (
+    BaseModel,
+    PydanticSchemaGenerationError,
+    ValidationError,
+    create_model,
+)
 
 from core.seedwork.domain_layer import DomainError
 from core.seedwork.use_case_layer import UseCaseError, UseCaseInputError
@@ -219,8 +224,35 @@ def get_return_type_of_function(func: Callable[..., Any]) -> Any:
     return s.return_annotation
 
 
+def build_input_model(s: inspect.Signature) -> Optional[Type[BaseModel]]:
+    if "data" not in s.parameters:
+        return None
+    data_parameter = s.parameters["data"]
+    return create_model(
+        "Input",
+        root=(data_parameter.annotation, ...),
+    )
+
+
+def build_output_model(output_schema: Optional[Type]) -> Optional[Type[BaseModel]]:
+    if not output_schema:
+        return None
+    try:
+        return create_model(
+            "Output",
+            root=(output_schema, ...),
+        )
+    except PydanticSchemaGenerationError:
+        # schemas like FileResponse can not be validated by pydantic, the
+        # model is then created on demand if a non response is returned
+        return None
+
+
 def build_kwargs_for_api_function_from_request(
-    s: inspect.Signature, request: HttpRequest, injectors_by_return_type: dict
+    s: inspect.Signature,
+    request: HttpRequest,
+    injectors_by_return_type: dict,
+    input_model: Optional[Type[BaseModel]] = None,
 ):
     func_kwargs: dict[str, Any] = {}
 
@@ -231,12 +263,9 @@ def build_kwargs_for_api_function_from_request(
             func_kwargs[parameter.name] = inject_function(request)
 
     if "data" in s.parameters:
-        data_parameter = s.parameters["data"]
         try:
-            model = create_model(
-                "Input",
-                root=(data_parameter.annotation, ...),
-            )
+            model = input_model if input_model else build_input_model(s)
+            assert model is not None
             data = _validate(request, model)
         except ValidationError as e:
             raise ApiValidationError(e)
@@ -247,7 +276,9 @@ def build_kwargs_for_api_function_from_request(
 
 
 def build_response(
-    result: Any, output_schema: Optional[Type]
+    result: Any,
+    output_schema: Optional[Type],
+    output_model: Optional[Type[BaseModel]] = None,
 ) -> HttpResponse | FileResponse:
     if (
         output_schema
@@ -262,9 +293,13 @@ def build_response(
         return result
 
     if output_schema:
-        model = create_model(
-            "Output",
-            root=(output_schema, ...),
+        model = (
+            output_model
+            if output_model
+            else create_model(
+                "Output",
+                root=(output_schema, ...),
+            )
         )
         output_data = model(root=result)
         return JsonResponse(output_data.model_dump()["root"], safe=False)
@@ -357,14 +392,18 @@ class Router:
                     "The variable named 'data' must be typed with a pydantic model, or 'list' or 'dict'."
                 )
 
+        # compile the wrapper models once instead of on every request
+        input_model = build_input_model(s)
+        output_model = build_output_model(output_schema)
+
         def wrapper(
             request: HttpRequest, *args, **kwargs
         ) -> HttpResponse | FileResponse:
             func_kwargs = build_kwargs_for_api_function_from_request(
-                s, request, cls._injectors_by_return_type
+                s, request, cls._injectors_by_return_type, input_model
             )
             result = func(**func_kwargs)
-            response = build_response(result, output_schema)
+            response = build_response(result, output_schema, output_model)
             return response
 
         return catch_error(wrapper)
@@ -1,17 +1,21 @@
+import io
 import os
 import secrets
 import string
 import struct
-import tempfile
-from hashlib import sha3_256
-from typing import IO, List, Optional, Tuple, Type, Union
+import threading
+from collections import OrderedDict
+from hashlib import sha3_256, sha256
+from typing import IO, Any, Callable, List, Optional, Tuple, Type, Union, cast
 
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad, unpad
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding as asymmetric_padding
 from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from django.core.files.base import ContentFile, File
 from django.core.files.uploadedfile import UploadedFile
 
@@ -34,6 +38,509 @@ def to_str(val: Union[bytes, str]) -> str:
     raise ValueError("Can't turn the value with type {} into str.".format(type(val)))
 
 
+class RSAKeyCache:
+    """
+    Keeps parsed RSA key objects around, because parsing and validating a PEM
+    encoded private key is more expensive than the decryption itself.
+    The keys are stored under a digest of their PEM and never under the PEM.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.__lock = threading.Lock()
+        self.__keys: OrderedDict[bytes, Union[rsa.RSAPrivateKey, rsa.RSAPublicKey]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    @staticmethod
+    def __digest(pem: Union[bytes, str]) -> bytes:
+        return sha256(to_bytes(pem)).digest()
+
+    def __get_or_load(
+        self, pem: Union[bytes, str], load: Callable[[bytes], Any]
+    ) -> Any:
+        digest = self.__digest(pem)
+        with self.__lock:
+            key = self.__keys.get(digest)
+            if key is not None:
+                self.__keys.move_to_end(digest)
+                return key
+        key = load(to_bytes(pem))
+        with self.__lock:
+            self.__keys[digest] = key
+            while len(self.__keys) > self.maxsize:
+                self.__keys.popitem(last=False)
+        return key
+
+    def load_private_key(self, pem: Union[bytes, str]) -> rsa.RSAPrivateKey:
+        key = self.__get_or_load(
+            pem,
+            lambda b: serialization.load_pem_private_key(
+                b, None, backend=default_backend()
+            ),
+        )
+        assert isinstance(key, rsa.RSAPrivateKey)
+        return key
+
+    def load_public_key(self, pem: Union[bytes, str]) -> rsa.RSAPublicKey:
+        key = self.__get_or_load(
+            pem,
+            lambda b: serialization.load_pem_public_key(b, backend=default_backend()),
+        )
+        assert isinstance(key, rsa.RSAPublicKey)
+        return key
+
+    def purge(self, pem: Union[bytes, str, None] = None) -> None:
+        with self.__lock:
+            if pem is None:
+                self.__keys.clear()
+            else:
+                self.__keys.pop(self.__digest(pem), None)
+
+
+RSA_KEY_CACHE = RSAKeyCache()
+
+
+class DecryptedFile(io.RawIOBase):
+    """
+    Decrypts a file that was encrypted by 'encrypt_in_memory_file' while it is
+    read, so that a download can start before the whole file is decrypted and
+    nothing is written to disk. The file layout is the original size, the iv
+    and the aes cbc blocks. Seeking only needs the cipher block in front of the
+    new position, which is why 'open_at' is asked to open the encrypted file
+    at a byte offset. Storages with an 'open_range' method are read with a
+    ranged request from that offset on.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, open_at: Callable[[int], IO[bytes]], aes_key: str):
+        super().__init__()
+        self.__open_at = open_at
+        self.__key = sha3_256(to_bytes(aes_key)).digest()
+        # the stream of the header is kept, it already stands at the first block
+        self.__header_stream: IO[bytes] | None = open_at(0)
+        header = self.__read_exactly(self.__header_stream, 24)
+        self.__size: int = struct.unpack("<Q", header[:8])[0]
+        self.__iv = header[8:24]
+        self.__position = 0
+        self.__stream: IO[bytes] | None = None
+        self.__decryptor: Any = None
+        self.__buffer = b""
+
+    @staticmethod
+    def __read_exactly(stream: IO[bytes], size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = stream.read(size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.__position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.__position + offset
+        elif whence == io.SEEK_END:
+            position = self.__size + offset
+        else:
+            raise ValueError("Invalid whence value: {}.".format(whence))
+        if position < 0:
+            raise ValueError("Negative seek position {}.".format(position))
+        if position != self.__position:
+            self.__position = position
+            self.__close_streams()
+            self.__buffer = b""
+        return self.__position
+
+    def __close_streams(self) -> None:
+        for stream in [self.__header_stream, self.__stream]:
+            if stream is not None:
+                stream.close()
+        self.__header_stream = None
+        self.__stream = None
+
+    def close(self) -> None:
+        self.__close_streams()
+        super().close()
+
+    def __start_decryption(self) -> None:
+        block = self.__position // AES.block_size
+        offset = 24 + block * AES.block_size
+        if block == 0 and self.__header_stream is not None:
+            stream = self.__header_stream
+            self.__header_stream = None
+            iv = self.__iv
+        elif block == 0:
+            stream = self.__open_at(offset)
+            iv = self.__iv
+        else:
+            # in cbc mode the previous cipher block is the iv of the next one
+            self.__close_streams()
+            stream = self.__open_at(offset - AES.block_size)
+            iv = self.__read_exactly(stream, AES.block_size)
+        self.__stream = stream
+        self.__decryptor = AES.new(self.__key, AES.MODE_CBC, iv)
+        skip = self.__position - block * AES.block_size
+        self.__buffer = self.__decrypt_chunk()[skip:]
+
+    def __decrypt_chunk(self) -> bytes:
+        assert self.__stream is not None
+        chunk = self.__read_exactly(self.__stream, self.CHUNK_SIZE)
+        chunk = chunk[: len(chunk) - len(chunk) % AES.block_size]
+        if len(chunk) == 0:
+            return b""
+        return self.__decryptor.decrypt(chunk)
+
+    def readinto(self, buffer: Any) -> int:
+        remaining = self.__size - self.__position
+        if remaining <= 0 or len(buffer) == 0:
+            return 0
+
+        if self.__stream is None:
+            self.__start_decryption()
+        elif len(self.__buffer) == 0:
+            self.__buffer = self.__decrypt_chunk()
+
+        # the last block is padded, the original size cuts the padding off
+        size = min(len(buffer), len(self.__buffer), remaining)
+        buffer[:size] = self.__buffer[:size]
+        self.__buffer = self.__buffer[size:]
+        self.__position += size
+        return size
+
+
+def open_encrypted_file(file: File) -> Callable[[int], IO[bytes]]:
+    storage = getattr(file, "storage", None)
+    name = getattr(file, "name", None)
+    if storage is not None and name and hasattr(storage, "open_range"):
+        return lambda offset: storage.open_range(name, offset)
+
+    def open_at(offset: int) -> IO[bytes]:
+        file.seek(offset)
+        return cast(IO[bytes], BorrowedStream(file))
+
+    return open_at
+
+
+class BorrowedStream:
+    """
+    Reads a file that belongs to the caller. Every 'open_at' of a file without
+    ranged requests returns the same file, that is why closing a replaced
+    stream must not close it.
+    """
+
+    def __init__(self, file: File):
+        self.__file = file
+
+    def read(self, size: int = -1) -> bytes:
+        return self.__file.read(size)
+
+    def close(self) -> None:
+        pass
+
+
+class EncryptedFile(io.RawIOBase):
+    """
+    Encrypts a file while it is read, so that a storage can upload the
+    encrypted file without it being staged on disk first. The output has the
+    same layout as before: the original size, the iv and the aes cbc blocks
+    where only the last block is padded with spaces.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, file: UploadedFile | ContentFile | File, aes_key: str):
+        super().__init__()
+        self.__file = file
+        self.__key = sha3_256(to_bytes(aes_key)).digest()
+        self.__iv = AESEncryption.generate_iv()
+        self.__original_size: int = file.size or 0
+        blocks = -(-self.__original_size // AES.block_size)
+        self.size = 24 + blocks * AES.block_size
+        self.__start = file.tell() if file.seekable() else 0
+        self.__restart()
+
+    def __restart(self) -> None:
+        self.__encryptor = AES.new(self.__key, AES.MODE_CBC, self.__iv)
+        self.__buffer = struct.pack("<Q", self.__original_size) + self.__iv
+        self.__rest = b""
+        self.__done = False
+        self.__position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        # uploaders treat the file as a stream, seeking is still possible but
+        # every seek forward needs to encrypt the bytes in between
+        return False
+
+    def tell(self) -> int:
+        return self.__position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset = self.__position + offset
+        elif whence == io.SEEK_END:
+            offset = self.size + offset
+        if offset < self.__position:
+            if not self.__file.seekable():
+                raise io.UnsupportedOperation("The source file is not seekable.")
+            self.__file.seek(self.__start)
+            self.__restart()
+        while self.__position < offset and self.read(offset - self.__position):
+            pass
+        return self.__position
+
+    def __encrypt_chunk(self) -> bytes:
+        chunk = self.__rest + self.__file.read(self.CHUNK_SIZE)
+        if len(chunk) == len(self.__rest):
+            self.__done = True
+            self.__rest = b""
+            if len(chunk) == 0:
+                return b""
+            chunk += b" " * (AES.block_size - len(chunk) % AES.block_size)
+            return self.__encryptor.encrypt(chunk)
+        cut = len(chunk) - len(chunk) % AES.block_size
+        self.__rest = chunk[cut:]
+        return self.__encryptor.encrypt(chunk[:cut])
+
+    def readinto(self, buffer: Any) -> int:
+        while len(self.__buffer) == 0 and not self.__done:
+            self.__buffer = self.__encrypt_chunk()
+        size = min(len(buffer), len(self.__buffer))
+        buffer[:size] = self.__buffer[:size]
+        self.__buffer = self.__buffer[size:]
+        self.__position += size
+        return size
+
+
+class AuthenticatedEncryptedFile(io.RawIOBase):
+    """
+    Encrypts a file with aes gcm while it is read. The layout is the original
+    size followed by one record per chunk of the original file, every record
+    is a nonce, the encrypted chunk and the tag. The size and the index of
+    the chunk are authenticated as well, so that records can neither be
+    swapped nor cut off.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    NONCE_SIZE = 12
+    TAG_SIZE = 16
+
+    def __init__(self, file: UploadedFile | ContentFile | File, aes_key: str):
+        super().__init__()
+        self.__file = file
+        self.__cipher = AESGCM(sha3_256(to_bytes(aes_key)).digest())
+        self.__start = file.tell() if file.seekable() else 0
+        # the size is authenticated, the size of the file object is not always
+        # right, that is why it is measured if the file can seek
+        if file.seekable():
+            self.__original_size: int = file.seek(0, io.SEEK_END) - self.__start
+            file.seek(self.__start)
+        else:
+            self.__original_size = file.size or 0
+        chunks = -(-self.__original_size // self.CHUNK_SIZE)
+        overhead = self.NONCE_SIZE + self.TAG_SIZE
+        self.size = 8 + chunks * overhead + self.__original_size
+        self.__restart()
+
+    @classmethod
+    def associated_data(cls, size: int, index: int) -> bytes:
+        return struct.pack("<QQ", size, index)
+
+    def __restart(self) -> None:
+        self.__buffer = struct.pack("<Q", self.__original_size)
+        self.__index = 0
+        self.__position = 0
+        self.__read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self.__position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset = self.__position + offset
+        elif whence == io.SEEK_END:
+            offset = self.size + offset
+        if offset < self.__position:
+            if not self.__file.seekable():
+                raise io.UnsupportedOperation("The source file is not seekable.")
+            self.__file.seek(self.__start)
+            self.__restart()
+        while self.__position < offset and self.read(offset - self.__position):
+            pass
+        return self.__position
+
+    def __encrypt_chunk(self) -> bytes:
+        # every record except the last one needs a full chunk, the source may
+        # return less than asked for if it is a stream itself
+        chunk = b""
+        while len(chunk) < self.CHUNK_SIZE:
+            data = self.__file.read(self.CHUNK_SIZE - len(chunk))
+            if not data:
+                break
+            chunk += to_bytes(data)
+        self.__read += len(chunk)
+        if self.__read > self.__original_size:
+            raise ValueError("The file is longer than its size.")
+        if len(chunk) < self.CHUNK_SIZE and self.__read < self.__original_size:
+            raise ValueError("The file is shorter than its size.")
+        if not chunk:
+            return b""
+        nonce = os.urandom(self.NONCE_SIZE)
+        data = self.associated_data(self.__original_size, self.__index)
+        self.__index += 1
+        return nonce + self.__cipher.encrypt(nonce, chunk, data)
+
+    def readinto(self, buffer: Any) -> int:
+        if len(self.__buffer) == 0:
+            self.__buffer = self.__encrypt_chunk()
+        size = min(len(buffer), len(self.__buffer))
+        buffer[:size] = self.__buffer[:size]
+        self.__buffer = self.__buffer[size:]
+        self.__position += size
+        return size
+
+
+class AuthenticatedDecryptedFile(io.RawIOBase):
+    """
+    Decrypts a file that was encrypted by 'AuthenticatedEncryptedFile' while
+    it is read. Every chunk is checked before any of its bytes are returned,
+    a modified file raises 'cryptography.exceptions.InvalidTag'. Seeking
+    opens the encrypted file at the record of the chunk of the new position.
+    """
+
+    CHUNK_SIZE = AuthenticatedEncryptedFile.CHUNK_SIZE
+    RECORD_OVERHEAD = (
+        AuthenticatedEncryptedFile.NONCE_SIZE + AuthenticatedEncryptedFile.TAG_SIZE
+    )
+
+    def __init__(self, open_at: Callable[[int], IO[bytes]], aes_key: str):
+        super().__init__()
+        self.__open_at = open_at
+        self.__cipher = AESGCM(sha3_256(to_bytes(aes_key)).digest())
+        # the stream of the header is kept, it already stands at the first record
+        self.__header_stream: IO[bytes] | None = open_at(0)
+        header = self.__header_stream.read(8)
+        self.__size: int = struct.unpack("<Q", header)[0]
+        self.__position = 0
+        self.__stream: IO[bytes] | None = None
+        self.__index = 0
+        self.__buffer = b""
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.__position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.__position + offset
+        elif whence == io.SEEK_END:
+            position = self.__size + offset
+        else:
+            raise ValueError("Invalid whence value: {}.".format(whence))
+        if position < 0:
+            raise ValueError("Negative seek position {}.".format(position))
+        if position != self.__position:
+            self.__position = position
+            self.__close_streams()
+            self.__buffer = b""
+        return self.__position
+
+    def __close_streams(self) -> None:
+        for stream in [self.__header_stream, self.__stream]:
+            if stream is not None:
+                stream.close()
+        self.__header_stream = None
+        self.__stream = None
+
+    def close(self) -> None:
+        self.__close_streams()
+        super().close()
+
+    def __decrypt_chunk(self) -> bytes:
+        assert self.__stream is not None
+        length = min(self.CHUNK_SIZE, self.__size - self.__index * self.CHUNK_SIZE)
+        record = b""
+        while len(record) < length + self.RECORD_OVERHEAD:
+            data = self.__stream.read(length + self.RECORD_OVERHEAD - len(record))
+            if not data:
+                break
+            record += data
+        if len(record) == 0:
+            # the file was cut off after a record, the size says it goes on
+            raise InvalidTag()
+        nonce = record[: AuthenticatedEncryptedFile.NONCE_SIZE]
+        encrypted = record[AuthenticatedEncryptedFile.NONCE_SIZE :]
+        data = AuthenticatedEncryptedFile.associated_data(self.__size, self.__index)
+        self.__index += 1
+        return self.__cipher.decrypt(nonce, encrypted, data)
+
+    def readinto(self, buffer: Any) -> int:
+        remaining = self.__size - self.__position
+        if remaining <= 0 or len(buffer) == 0:
+            return 0
+
+        if self.__stream is None:
+            self.__index = self.__position // self.CHUNK_SIZE
+            record_size = self.CHUNK_SIZE + self.RECORD_OVERHEAD
+            if self.__index == 0 and self.__header_stream is not None:
+                self.__stream = self.__header_stream
+                self.__header_stream = None
+            else:
+                self.__close_streams()
+                self.__stream = self.__open_at(8 + self.__index * record_size)
+            skip = self.__position - self.__index * self.CHUNK_SIZE
+            self.__buffer = self.__decrypt_chunk()[skip:]
+        elif len(self.__buffer) == 0:
+            self.__buffer = self.__decrypt_chunk()
+        if len(self.__buffer) == 0:
+            return 0
+
+        size = min(len(buffer), len(self.__buffer), remaining)
+        buffer[:size] = self.__buffer[:size]
+        self.__buffer = self.__buffer[size:]
+        self.__position += size
+        return size
+
+
 class AESEncryption:
     @staticmethod
     def generate_iv() -> bytes:
@@ -44,16 +551,35 @@ class AESEncryption:
         password_characters = string.ascii_letters + string.digits + string.punctuation
         return "".join(secrets.choice(password_characters) for i in range(64))
 
+    @staticmethod
+    def derive_key(key: Union[bytes, str]) -> bytes:
+        return sha3_256(to_bytes(key)).digest()
+
+    @staticmethod
+    def __encrypt_with_derived_key(
+        msg: Union[bytes, memoryview, str], derived_key: bytes, iv: bytes
+    ) -> bytes:
+        cipher = AES.new(derived_key, AES.MODE_CBC, iv)
+        return cipher.encrypt(pad(to_bytes(msg), AES.block_size))
+
+    @staticmethod
+    def __decrypt_with_derived_key(
+        encrypted: Union[bytes, memoryview],
+        derived_key: bytes,
+        iv: Union[bytes, memoryview],
+    ) -> str:
+        if encrypted.__len__() == 0:
+            return ""
+        cipher = AES.new(derived_key, AES.MODE_CBC, to_bytes(iv))
+        plaintext_bytes = unpad(cipher.decrypt(to_bytes(encrypted)), AES.block_size)
+        return to_str(plaintext_bytes)
+
     @staticmethod
     def encrypt_with_iv(
         msg: Union[bytes, memoryview, str], key: Union[bytes, str], iv: bytes
     ):
-        msg = to_bytes(msg)
-        key = to_bytes(key)
-        hashed_key_bytes = sha3_256(key).digest()
-        cipher = AES.new(hashed_key_bytes, AES.MODE_CBC, iv)
-        cipher_bytes = cipher.encrypt(pad(msg, AES.block_size))
-        return cipher_bytes
+        derived_key = AESEncryption.derive_key(key)
+        return AESEncryption.__encrypt_with_derived_key(msg, derived_key, iv)
 
     @staticmethod
     def decrypt_with_iv(
@@ -61,13 +587,8 @@ class AESEncryption:
     ) -> str:
         if encrypted.__len__() == 0:
             return ""
-        bytes_key = to_bytes(key)
-        encrypted = to_bytes(encrypted)
-
-        hashed_key_bytes = sha3_256(bytes_key).digest()
-        cipher = AES.new(hashed_key_bytes, AES.MODE_CBC, iv)
-        plaintext_bytes = unpad(cipher.decrypt(encrypted), AES.block_size)
-        return to_str(plaintext_bytes)
+        derived_key = AESEncryption.derive_key(key)
+        return AESEncryption.__decrypt_with_derived_key(encrypted, derived_key, iv)
 
     @staticmethod
     def encrypt(msg: Optional[str], key: str) -> bytes:
@@ -90,55 +611,56 @@ class AESEncryption:
         plain = AESEncryption.decrypt_with_iv(encrypted, key, iv)
         return plain
 
+    @staticmethod
+    def encrypt_many(msgs: List[Optional[str]], key: str) -> List[bytes]:
+        """
+        Same as encrypt for every message, but the key is derived only once.
+        """
+        derived_key = AESEncryption.derive_key(key)
+        encrypted: List[bytes] = []
+        for msg in msgs:
+            if msg is None or msg.__len__() == 0:
+                encrypted.append(bytes())
+                continue
+            iv = AESEncryption.generate_iv()
+            cipher_bytes = AESEncryption.__encrypt_with_derived_key(
+                msg, derived_key, iv
+            )
+            encrypted.append(iv + cipher_bytes)
+        return encrypted
+
+    @staticmethod
+    def decrypt_many(values: List[Union[bytes, memoryview]], key: str) -> List[str]:
+        """
+        Same as decrypt for every value, but the key is derived only once.
+        """
+        derived_key = AESEncryption.derive_key(key)
+        return [
+            AESEncryption.__decrypt_with_derived_key(v[16:], derived_key, v[:16])
+            for v in values
+        ]
+
     @staticmethod
     def encrypt_in_memory_file(
-        file: UploadedFile | ContentFile, aes_key: str
+        file: UploadedFile | ContentFile | File,
+        aes_key: str,
+        authenticated: bool = False,
     ) -> IO[bytes]:
-        # fix the aes key
-        bytes_aes_key = to_bytes(aes_key)
-        # stuff needed
-        chunk_size = 64 * 1024
-        hashed_key_bytes = sha3_256(bytes_aes_key).digest()
-        iv = AESEncryption.generate_iv()
-        encryptor = AES.new(hashed_key_bytes, AES.MODE_CBC, iv)
-        # encrypt the file
-        encrypted_file = tempfile.TemporaryFile("wb+")
-        encrypted_file.write(struct.pack("<Q", file.size))
-        encrypted_file.write(iv)
-        while True:
-            chunk = file.read(chunk_size)
-            if len(chunk) == 0:
-                break
-            elif len(chunk) % 16 != 0:
-                chunk += b" " * (16 - len(chunk) % 16)
-            encrypted_file.write(encryptor.encrypt(chunk))
-        # fix the file
-        encrypted_file.seek(0)
-        # return
-        return encrypted_file
-
-    @staticmethod
-    def decrypt_bytes_file(file: File, aes_key: str) -> IO[bytes]:
-        # fix the aes key
-        bytes_aes_key = to_bytes(aes_key)
-        # stuff needed
-        chunk_size = 64 * 1024
-        hashed_key_bytes = sha3_256(bytes_aes_key).digest()
-        org_size = struct.unpack("<Q", file.read(struct.calcsize("Q")))[0]
-        iv = file.read(16)
-        decryptor = AES.new(hashed_key_bytes, AES.MODE_CBC, iv)
-        # decrypt
-        outfile = tempfile.TemporaryFile("wb+")
-        while True:
-            chunk = file.read(chunk_size)
-            if len(chunk) == 0:
-                break
-            outfile.write(decryptor.decrypt(chunk))
-        # improve the file
-        outfile.truncate(org_size)
-        outfile.seek(0)
-        # return
-        return outfile
+        if authenticated:
+            return cast(IO[bytes], AuthenticatedEncryptedFile(file, aes_key))
+        return cast(IO[bytes], EncryptedFile(file, aes_key))
+
+    @staticmethod
+    def decrypt_bytes_file(
+        file: File, aes_key: str, authenticated: bool = False
+    ) -> IO[bytes]:
+        if authenticated:
+            return cast(
+                IO[bytes],
+                AuthenticatedDecryptedFile(open_encrypted_file(file), aes_key),
+            )
+        decrypted = DecryptedFile(open_encrypted_file(file), aes_key)
+        return cast(IO[bytes], decrypted)
 
 
 class RSAEncryption:
@@ -168,9 +690,7 @@ class RSAEncryption:
     def encrypt(msg, pem_public_key: bytes):
         msg = to_bytes(msg)
 
-        public_key: rsa.RSAPublicKey = serialization.load_pem_public_key(  # type: ignore
-            pem_public_key, backend=default_backend()
-        )
+        public_key = RSA_KEY_CACHE.load_public_key(pem_public_key)
         ciphertext = public_key.encrypt(
             msg,
             asymmetric_padding.OAEP(
@@ -183,10 +703,7 @@ class RSAEncryption:
 
     @staticmethod
     def decrypt(ciphertext, pem_private_key):
-        pem_private_key = to_bytes(pem_private_key)
-        private_key = serialization.load_pem_private_key(
-            pem_private_key, None, backend=default_backend()
-        )
+        private_key = RSA_KEY_CACHE.load_private_key(pem_private_key)
 
         if not isinstance(ciphertext, bytes):
             try:
@@ -204,6 +721,14 @@ class RSAEncryption:
         )
         return to_str(plaintext)
 
+    @staticmethod
+    def encrypt_many(msgs: list, pem_public_key: bytes) -> List[bytes]:
+        return [RSAEncryption.encrypt(msg, pem_public_key) for msg in msgs]
+
+    @staticmethod
+    def decrypt_many(ciphertexts: list, pem_private_key) -> List[str]:
+        return [RSAEncryption.decrypt(c, pem_private_key) for c in ciphertexts]
+
 
 class EncryptedModelMixin:
     encrypted_fields: List[str] = []
@@ -227,21 +752,31 @@ class EncryptedModelMixin:
                 )
         super().save(*args, **kwargs)  # type: ignore
 
+    @classmethod
+    def decrypt_all(cls, objects: list["EncryptedModelMixin"], key) -> None:
+        """
+        Decrypts the encrypted fields of all objects with one key in one go,
+        which derives the key only once instead of once per field.
+        """
+        todo = [
+            o for o in objects if getattr(o, "encryption_status", "") != "DECRYPTED"
+        ]
+        values = [getattr(o, f) for o in todo for f in o.encrypted_fields]
+        decrypted = iter(cls.encryption_class.decrypt_many(values, key))
+        for o in todo:
+            for field in o.encrypted_fields:
+                setattr(o, field, next(decrypted))
+        for o in objects:
+            setattr(o, "encryption_status", "DECRYPTED")
+
     def decrypt(self, key) -> None:
-        if getattr(self, "encryption_status", "") != "DECRYPTED":
-            for field in self.encrypted_fields:
-                decrypted_field = self.encryption_class.decrypt(
-                    getattr(self, field), key
-                )
-                setattr(self, field, decrypted_field)
-        setattr(self, "encryption_status", "DECRYPTED")
+        self.decrypt_all([self], key)
 
     def encrypt(self, key) -> None:
         if getattr(self, "encryption_status", "") != "ENCRYPTED":
-            for field in self.encrypted_fields:
-                encrypted_field = self.encryption_class.encrypt(
-                    getattr(self, field), key
-                )
+            values = [getattr(self, field) for field in self.encrypted_fields]
+            encrypted = self.encryption_class.encrypt_many(values, key)
+            for field, encrypted_field in zip(self.encrypted_fields, encrypted):
                 setattr(self, field, encrypted_field)
         setattr(self, "encryption_status", "ENCRYPTED")
 
@@ -1,16 +1,25 @@
+from functools import partial
+
 from django.core.files.storage import default_storage
 
-from core.seedwork.encryption import AESEncryption
+from core.seedwork.encryption import (
+    AESEncryption,
+    AuthenticatedDecryptedFile,
+    DecryptedFile,
+)
 
 
-def encrypt_and_upload_file(file, key, aes_key):
-    file = AESEncryption.encrypt_in_memory_file(file, aes_key)
+def encrypt_and_upload_file(file, key, aes_key, authenticated=False):
+    file = AESEncryption.encrypt_in_memory_file(file, aes_key, authenticated)
     file = default_storage.save(key, file)
     return file
 
 
-def download_and_decrypt_file(file_key, aes_key):
+def download_and_decrypt_file(file_key, aes_key, authenticated=False):
+    if hasattr(default_storage, "open_range"):
+        open_at = partial(default_storage.open_range, file_key)
+        if authenticated:
+            return AuthenticatedDecryptedFile(open_at, aes_key)
+        return DecryptedFile(open_at, aes_key)
     file = default_storage.open(file_key)
-    file = AESEncryption.decrypt_bytes_file(file, aes_key)
-    file.seek(0)
-    return file
+    return AESEncryption.decrypt_bytes_file(file, aes_key, authenticated)
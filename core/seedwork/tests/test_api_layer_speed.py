@@ -0,0 +1,44 @@
+import time
+
+from django.test import RequestFactory
+from pydantic import BaseModel
+
+from core.seedwork.api_layer import Router
+
+
+class InputSpeed(BaseModel):
+    name: str
+    count: int
+    tags: list[str]
+
+
+class OutputSpeed(BaseModel):
+    name: str
+    count: int
+    tags: list[str]
+
+
+def test_api_layer_overhead_per_request():
+    def echo(data: InputSpeed) -> OutputSpeed:
+        return OutputSpeed(name=data.name, count=data.count, tags=data.tags)
+
+    router = Router()
+    view = router.generate_view(echo, OutputSpeed)
+    factory = RequestFactory()
+    request = factory.post(
+        "/",
+        data={"name": "speed", "count": 1, "tags": ["a", "b", "c"]},
+        content_type="application/json",
+    )
+
+    L = 1000
+
+    t1 = time.time()
+
+    for _ in range(L):
+        response = view(request)
+
+    t2 = time.time()
+
+    assert response.status_code == 200
+    assert t2 - t1 < 2
@@ -1,6 +1,22 @@
-from django.test import SimpleTestCase
+import io
+import os
+import struct
+from hashlib import sha3_256
 
-from core.seedwork.encryption import AESEncryption, RSAEncryption
+import pytest
+from Crypto.Cipher import AES
+from cryptography.exceptions import InvalidTag
+from django.core.files.base import ContentFile, File
+from django.http import FileResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from config.middleware import file_range_middleware
+from core.seedwork.encryption import (
+    AESEncryption,
+    DecryptedFile,
+    RSAEncryption,
+    RSAKeyCache,
+)
 
 
 class EncryptionTests(SimpleTestCase):
@@ -49,3 +65,181 @@ class EncryptionTests(SimpleTestCase):
         decrypted = AESEncryption.decrypt(encrypted, key)
 
         self.assertEqual(decrypted, msg)
+
+    def test_rsa_key_cache_reuses_parsed_keys(self):
+        cache = RSAKeyCache(maxsize=2)
+        private_key, public_key = RSAEncryption.generate_keys()
+
+        key1 = cache.load_private_key(private_key)
+        key2 = cache.load_private_key(private_key.decode("utf-8"))
+        self.assertIs(key1, key2)
+
+        cache.purge(private_key)
+        self.assertIsNot(cache.load_private_key(private_key), key1)
+
+    def test_rsa_key_cache_is_bounded(self):
+        cache = RSAKeyCache(maxsize=2)
+        for _ in range(3):
+            _, public_key = RSAEncryption.generate_keys()
+            cache.load_public_key(public_key)
+
+        self.assertEqual(len(cache), 2)
+        cache.purge()
+        self.assertEqual(len(cache), 0)
+
+    def test_decrypted_file_streams_and_seeks(self):
+        key = AESEncryption.generate_secure_key()
+        content = os.urandom(200 * 1024 + 7)
+        encrypted = AESEncryption.encrypt_in_memory_file(ContentFile(content), key)
+
+        decrypted = AESEncryption.decrypt_bytes_file(File(encrypted), key)
+        self.assertEqual(decrypted.read(), content)
+        self.assertEqual(decrypted.seek(0, io.SEEK_END), len(content))
+
+        for start in [0, 5, 16, 17, 65535, 65536, 100000, len(content) - 3]:
+            decrypted.seek(start)
+            self.assertEqual(decrypted.read(5000), content[start : start + 5000])
+
+    def test_range_middleware_answers_partial_requests(self):
+        key = AESEncryption.generate_secure_key()
+        content = b"0123456789" * 10
+        encrypted = AESEncryption.encrypt_in_memory_file(ContentFile(content), key)
+
+        def view(request):
+            return FileResponse(AESEncryption.decrypt_bytes_file(File(encrypted), key))
+
+        middleware = file_range_middleware(view)
+        request = RequestFactory().get("/", HTTP_RANGE="bytes=10-19")
+        response = middleware(request)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 10-19/100")
+        self.assertEqual(b"".join(response.streaming_content), content[10:20])
+
+        request = RequestFactory().get("/", HTTP_RANGE="bytes=200-")
+        self.assertEqual(middleware(request).status_code, 416)
+
+    def test_range_middleware_ignores_ranges_it_does_not_support(self):
+        key = AESEncryption.generate_secure_key()
+        content = b"0123456789" * 10
+        encrypted = AESEncryption.encrypt_in_memory_file(ContentFile(content), key)
+
+        def view(request):
+            return FileResponse(AESEncryption.decrypt_bytes_file(File(encrypted), key))
+
+        middleware = file_range_middleware(view)
+        for header in ["bytes=0-1,5-6", "items=0-5", "bytes=9-3", "bytes=-"]:
+            request = RequestFactory().get("/", HTTP_RANGE=header)
+            response = middleware(request)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(b"".join(response.streaming_content), content)
+
+    def test_range_middleware_rejects_ranges_outside_of_the_file(self):
+        key = AESEncryption.generate_secure_key()
+        content = b"0123456789" * 10
+        encrypted = AESEncryption.encrypt_in_memory_file(ContentFile(content), key)
+
+        def view(request):
+            return FileResponse(AESEncryption.decrypt_bytes_file(File(encrypted), key))
+
+        middleware = file_range_middleware(view)
+        for header in ["bytes=100-", "bytes=100-200", "bytes=-0"]:
+            request = RequestFactory().get("/", HTTP_RANGE=header)
+            response = middleware(request)
+            self.assertEqual(response.status_code, 416)
+            self.assertEqual(response["Content-Range"], "bytes */100")
+
+    def test_encrypted_file_has_the_layout_of_the_old_format(self):
+        key = AESEncryption.generate_secure_key()
+        content = os.urandom(64 * 1024 + 5)
+        encrypted = AESEncryption.encrypt_in_memory_file(ContentFile(content), key)
+        data = encrypted.read()
+
+        self.assertEqual(len(data), 24 + 64 * 1024 + 16)
+        self.assertEqual(struct.unpack("<Q", data[:8])[0], len(content))
+        cipher = AES.new(sha3_256(key.encode()).digest(), AES.MODE_CBC, data[8:24])
+        plain = cipher.decrypt(data[24:])
+        self.assertEqual(plain, content + b" " * 11)
+
+
+def test_decrypted_file_reuses_the_header_stream_and_closes_streams():
+    key = AESEncryption.generate_secure_key()
+    content = os.urandom(1000)
+    data = AESEncryption.encrypt_in_memory_file(ContentFile(content), key).read()
+    opened: list[io.BytesIO] = []
+
+    def open_at(offset: int) -> io.BytesIO:
+        stream = io.BytesIO(data[offset:])
+        opened.append(stream)
+        return stream
+
+    decrypted = DecryptedFile(open_at, key)
+    assert decrypted.read() == content
+    assert len(opened) == 1
+
+    decrypted.seek(500)
+    assert opened[0].closed
+    assert decrypted.read() == content[500:]
+    decrypted.close()
+    assert len(opened) == 2 and all(s.closed for s in opened)
+
+
+def test_aes_encrypt_and_decrypt_many():
+    key = AESEncryption.generate_secure_key()
+    msgs = ["one", "", None, "four" * 100]
+    encrypted = AESEncryption.encrypt_many(msgs, key)
+    assert encrypted[1] == bytes() and encrypted[2] == bytes()
+    assert [AESEncryption.decrypt(e, key) for e in encrypted] == [
+        "one",
+        "",
+        "",
+        "four" * 100,
+    ]
+    assert AESEncryption.decrypt_many(encrypted, key) == ["one", "", "", "four" * 100]
+    single = AESEncryption.encrypt("five", key)
+    assert AESEncryption.decrypt_many([memoryview(single)], key) == ["five"]
+
+
+def test_authenticated_file_layout_and_range():
+    key = AESEncryption.generate_secure_key()
+    content = os.urandom(3 * 64 * 1024 + 100)
+    encrypted = AESEncryption.encrypt_in_memory_file(
+        ContentFile(content), key, authenticated=True
+    ).read()
+    assert len(encrypted) == 8 + 4 * 28 + len(content)
+    assert struct.unpack("<Q", encrypted[:8])[0] == len(content)
+
+    decrypted = AESEncryption.decrypt_bytes_file(
+        File(io.BytesIO(encrypted)), key, authenticated=True
+    )
+    assert decrypted.read() == content
+    decrypted.seek(64 * 1024 + 7)
+    assert decrypted.read() == content[64 * 1024 + 7 :]
+
+
+def test_authenticated_file_detects_changes():
+    key = AESEncryption.generate_secure_key()
+    encrypted = bytearray(
+        AESEncryption.encrypt_in_memory_file(
+            ContentFile(b"secret" * 100), key, authenticated=True
+        ).read()
+    )
+    encrypted[30] ^= 1
+    decrypted = AESEncryption.decrypt_bytes_file(
+        File(io.BytesIO(bytes(encrypted))), key, authenticated=True
+    )
+    with pytest.raises(InvalidTag):
+        decrypted.read()
+
+
+def test_authenticated_file_detects_a_missing_record():
+    key = AESEncryption.generate_secure_key()
+    content = os.urandom(2 * 64 * 1024 + 100)
+    encrypted = AESEncryption.encrypt_in_memory_file(
+        ContentFile(content), key, authenticated=True
+    ).read()
+    cut = encrypted[: -(100 + 28)]
+    decrypted = AESEncryption.decrypt_bytes_file(
+        File(io.BytesIO(cut)), key, authenticated=True
+    )
+    with pytest.raises(InvalidTag):
+        decrypted.read()
@@ -0,0 +1,32 @@
+from uuid import uuid4
+
+from core.injections import handle_events
+from core.seedwork.use_case_layer.callbacks import CallbackContext
+from messagebus.domain.collector import EventCollector
+from messagebus.domain.event import Event
+from messagebus.models import Message, OutboxMessage
+
+
+class Boat:
+    class Sailed(Event):
+        miles: int
+
+
+def test_events_are_stored_in_outbox(db, settings):
+    settings.MESSAGEBUS_DISPATCH = "outbox"
+    uuid = uuid4()
+    collector = EventCollector()
+    collector.collect(Boat.Sailed(uuid=uuid, miles=1))
+    collector.collect(Boat.Sailed(uuid=uuid, miles=2))
+    collector.collect(Boat.Sailed(uuid=uuid4(), miles=3))
+
+    handle_events(CallbackContext(True, None, "sail"), collector)
+
+    assert collector.pop() is None
+    assert Message.objects.filter(stream_name=f"Boat-{uuid}").count() == 2
+    assert list(
+        Message.objects.filter(stream_name=f"Boat-{uuid}")
+        .order_by("position")
+        .values_list("position", flat=True)
+    ) == [1, 2]
+    assert OutboxMessage.objects.filter(processed_at__isnull=True).count() == 3
@@ -1,3 +1,4 @@
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -293,3 +294,41 @@ def test_callbacks_context_is_not_overwritten():
     collect_event(__actor=Actor())
 
     assert len(CONTEXTS) == len(set(CONTEXTS))
+
+
+def test_validation_can_be_turned_off():
+    @use_case(context=InjectionContext({}), callbacks=[], validate=False)
+    def t7(__actor: Actor, x: int):
+        assert x == "5"
+
+    t7(__actor=Actor(), x="5")
+
+    @use_case(context=InjectionContext({}), callbacks=[])
+    def t8(__actor: Actor, x: int):
+        assert x == 5
+
+    t8(__actor=Actor(), x="5")
+
+
+def test_callback_type_hints_are_resolved_once():
+    calls = []
+
+    def callback(unique_object: UniqueObject):
+        calls.append(unique_object)
+
+    injections = InjectionContext({UniqueObject: lambda: UniqueObject()})
+
+    @use_case(context=injections, callbacks=[callback])
+    def t9(__actor: Actor):
+        pass
+
+    t9(__actor=Actor())
+
+    with patch(
+        "core.seedwork.use_case_layer.injector.get_type_hints",
+        side_effect=AssertionError("type hints should be cached"),
+    ):
+        t9(__actor=Actor())
+        t9(__actor=Actor())
+
+    assert len(calls) == 3
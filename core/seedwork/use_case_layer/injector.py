@@ -50,13 +50,37 @@ class InjectionContext:
         self.resolved_callable_injections = {}
 
 
+InjectionPlan = list[tuple[str, Any]]
+
+_injection_plans: dict[Callable[..., Any], InjectionPlan] = {}
+
+
+def get_injection_plan(func: Callable[..., Any]) -> InjectionPlan:
+    """
+    Returns the parameter names and type hints of the function.
+    The type hints are only resolved once per function because resolving
+    them is expensive and the same functions are injected over and over.
+    """
+    key = getattr(func, "__func__", func)
+    plan = _injection_plans.get(key)
+    if plan is None:
+        hints = get_type_hints(func)
+        hints.pop("return", None)
+        plan = list(hints.items())
+        _injection_plans[key] = plan
+    return plan
+
+
 def inject_kwargs(
-    func: Callable[..., RT], kwargs: dict[str, Any], context: InjectionContext
+    func: Callable[..., RT],
+    kwargs: dict[str, Any],
+    context: InjectionContext,
+    plan: InjectionPlan | None = None,
 ) -> dict[str, Any]:
-    hints = get_type_hints(func)
-    hints.pop("return", None)
+    if plan is None:
+        plan = get_injection_plan(func)
 
-    for name, hint in hints.items():
+    for name, hint in plan:
         if context.has(hint) and name not in kwargs:
             kwargs[name] = context.get(hint)
         else:
@@ -13,6 +13,7 @@ from core.seedwork.use_case_layer.error import UseCaseError
 from core.seedwork.use_case_layer.injector import (
     InjectionContext,
     convert_args_to_kwargs,
+    get_injection_plan,
     inject_kwargs,
 )
 
@@ -34,6 +35,7 @@ def use_case(
     permissions: None = ...,
     context: InjectionContext = ...,
     callbacks: list[Callable[..., Any]] = ...,
+    validate: bool = ...,
 ) -> Callable[..., RetType]: ...
 
 
@@ -44,6 +46,7 @@ def use_case(
     permissions: list[str] | None = ...,
     context: InjectionContext = ...,
     callbacks: list[Callable[..., Any]] = ...,
+    validate: bool = ...,
 ) -> Callable[[Callable[..., RetType]], Callable[..., RetType]]: ...
 
 
@@ -53,6 +56,7 @@ def use_case(
     permissions: list[str] | None = None,
     context: InjectionContext = DJANGO_INJECTION_CONTEXT,
     callbacks: list[Callable[..., Any]] = DJANGO_CALLBACKS,
+    validate: bool = True,
 ) -> (
     Callable[..., RetType] | Callable[[Callable[..., RetType]], Callable[..., RetType]]
 ):
@@ -60,19 +64,29 @@ def use_case(
         permissions = []
 
     def decorator(usecase_func: Callable[..., RetType]) -> Callable[..., RetType]:
+        # everything that only depends on the function is prepared once here
+        # instead of on every call of the use case
         type_hints = get_type_hints(usecase_func)
+        injection_plan = get_injection_plan(usecase_func)
+        func_code = usecase_func.__code__
+        func_name = func_code.co_name
+        # validation can be turned off for use cases that are only called
+        # internally, for example by the message bus, with already typed input
+        validated_func = (
+            validate_call(config={"arbitrary_types_allowed": True})(usecase_func)
+            if validate
+            else usecase_func
+        )
 
         @wraps(usecase_func)
         def wrapper(*args, **kwargs) -> RetType:
             kwargs = convert_args_to_kwargs(usecase_func, args, kwargs)
 
-            func_code = usecase_func.__code__
-            func_name = func_code.co_name
             actor = __check_actor(kwargs, func_code, type_hints)
 
             context.reset()
             context.injections[type_hints["__actor"]] = actor
-            kwargs = inject_kwargs(usecase_func, kwargs, context)
+            kwargs = inject_kwargs(usecase_func, kwargs, context, injection_plan)
 
             check_permissions(actor, permissions)
 
@@ -89,9 +103,7 @@ def use_case(
                     c(**inj_kwargs)
 
             try:
-                ret = validate_call(config={"arbitrary_types_allowed": True})(
-                    usecase_func
-                )(**kwargs)
+                ret = validated_func(**kwargs)
                 msg = "SUCCESS: '{}' called '{}'.".format(str(actor), func_name)
                 logger.info(msg)
                 run_callbacks()
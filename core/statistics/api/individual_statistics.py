@@ -1,4 +1,5 @@
-from django.db import connection
+from django.db.models import Sum
+from django.utils import timezone
 from pydantic import BaseModel
 
 from core.auth.models import OrgUser
@@ -6,6 +7,8 @@ from core.data_sheets.models.data_sheet import DataSheet
 from core.seedwork.api_layer import Router
 from core.seedwork.statistics import execute_statement
 from core.statistics.api.utils import get_available_datasheet_years
+from core.statistics.models import StatisticsUserDay
+from core.statistics.rollups import one_month_before
 
 from seedwork.functional import list_filter
 
@@ -19,33 +22,17 @@ class OutputIndividualUserActionsMonth(BaseModel):
 
 @router.get("user_actions_month/", output_schema=list[OutputIndividualUserActionsMonth])
 def query__user_actions_month(org_user: OrgUser):
-    if connection.vendor == "sqlite":
-        statement = """
-            select u.email as email, count(*) as actions
-            from core_userprofile as u
-            left join core_orguser ru on ru.user_id = u.id
-            left join core_loggedpath path on u.id = path.user_id
-            where path.user_id is not null
-            and path.time > date('now', '-1 month')
-            and ru.org_id = {}
-            group by u.email
-            order by count(*) desc;
-            """.format(org_user.org_id)
-    else:
-        statement = """
-            select u.email as email, count(*) as actions
-            from core_userprofile as u
-            left join core_orguser ru on ru.user_id = u.id
-            left join core_loggedpath path on u.id = path.user_id
-            where path.user_id is not null
-            and path.time > date_trunc('day', NOW() - interval '1 month')
-            and ru.org_id = {}
-            group by u.email
-            order by count(*) desc;
-            """.format(org_user.org_id)
-    data = execute_statement(statement)
-    data = map(lambda x: {"email": x[0], "actions": x[1]}, data)
-    return list(data)
+    # read from the rollup tables that are updated by the statistics cronjob
+    start = one_month_before(timezone.localdate())
+    rows = (
+        StatisticsUserDay.objects.filter(
+            day__gte=start, user__org_user__org_id=org_user.org_id
+        )
+        .values("user__email")
+        .annotate(actions=Sum("actions"))
+        .order_by("-actions")
+    )
+    return [{"email": r["user__email"], "actions": r["actions"]} for r in rows]
 
 
 class OutputRecordStates(BaseModel):
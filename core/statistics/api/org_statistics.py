@@ -1,14 +1,18 @@
 from datetime import date
 
 from django.db import connection
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
 from pydantic import BaseModel
 
 from core.auth.models import OrgUser, StatisticUser
-from core.data_sheets.models.data_sheet import DataSheetStatisticEntry
 from core.data_sheets.models.template import DataSheetStatisticField
 from core.seedwork.api_layer import Router
 from core.seedwork.statistics import execute_statement
 from core.statistics.api.utils import get_available_datasheet_years
+from core.statistics.models import StatisticsUserDay, StatisticsValueMonth
+from core.statistics.rollups import one_month_before
 
 from seedwork.functional import list_filter, list_map
 
@@ -22,29 +26,15 @@ class OutputUserActions(BaseModel):
 
 @router.get(url="user_actions_month/", output_schema=list[OutputUserActions])
 def query__user_actions(statistics_user: StatisticUser):
-    if connection.vendor == "sqlite":
-        statement = """
-        select u.id as email, count(*) as actions
-        from core_userprofile as u
-        left join core_loggedpath path on u.id = path.user_id
-        where user_id is not null
-        and path.time > date('now', '-1 month')
-        group by u.email, u.id
-        order by count(*) desc;
-        """
-    else:
-        statement = """
-        select u.id as email, count(*) as actions
-        from core_userprofile as u
-        left join core_loggedpath path on u.id = path.user_id
-        where user_id is not null
-        and path.time > date_trunc('day', NOW() - interval '1 month')
-        group by u.email, u.id
-        order by count(*) desc;
-        """
-    data = execute_statement(statement)
-    data = map(lambda x: {"email": x[0], "actions": x[1]}, data)
-    return list(data)
+    # read from the rollup tables that are updated by the statistics cronjob
+    start = one_month_before(timezone.localdate())
+    rows = (
+        StatisticsUserDay.objects.filter(day__gte=start)
+        .values("user_id")
+        .annotate(actions=Sum("actions"))
+        .order_by("-actions")
+    )
+    return [{"email": r["user_id"], "actions": r["actions"]} for r in rows]
 
 
 class OutputUniqueUsers(BaseModel):
@@ -54,23 +44,15 @@ class OutputUniqueUsers(BaseModel):
 
 @router.get(url="unique_users_month/", output_schema=list[OutputUniqueUsers])
 def query__unique_users(statistics_user: StatisticUser):
-    if connection.vendor == "sqlite":
-        statement = """
-        select strftime('%Y/%m', time) as month, count(distinct path.user_id) as logins
-        from core_loggedpath as path
-        group by strftime('%Y/%m', time)
-        order by date(time) asc
-        """
-    else:
-        statement = """
-        select to_char(time, 'YYYY/MM') as month, count(distinct path.user_id) as logins
-        from core_loggedpath as path
-        group by to_char(time, 'YYYY/MM')
-        order by to_char(time, 'YYYY/MM') asc;
-        """
-    data = execute_statement(statement)
-    data = map(lambda x: {"month": x[0], "logins": x[1]}, data)
-    return list(data)
+    rows = (
+        StatisticsUserDay.objects.annotate(month=TruncMonth("day"))
+        .values("month")
+        .annotate(logins=Count("user_id", distinct=True))
+        .order_by("month")
+    )
+    return [
+        {"month": r["month"].strftime("%Y/%m"), "logins": r["logins"]} for r in rows
+    ]
 
 
 class OutputUserLoginsMonth(BaseModel):
@@ -80,27 +62,16 @@ class OutputUserLoginsMonth(BaseModel):
 
 @router.get(url="user_logins_month/", output_schema=list[OutputUserLoginsMonth])
 def query__user_logins_month(statistics_user: StatisticUser):
-    if connection.vendor == "sqlite":
-        statement = """
-        select strftime('%Y/%m', time) as month, count(*) as logins
-        from core_loggedpath as path
-        where path.path like '%login%'
-        and (path.status = 200 or path.status = 0)
-        group by strftime('%Y/%m', time)
-        order by date(time) asc;
-        """
-    else:
-        statement = """
-        select to_char(time, 'YYYY/MM') as month, count(*) as logins
-        from core_loggedpath as path
-        where path.path like '%login%'
-        and (path.status = 200 or path.status = 0)
-        group by to_char(time, 'YYYY/MM')
-        order by to_char(time, 'YYYY/MM') asc;
-        """
-    data = execute_statement(statement)
-    data = map(lambda x: {"month": x[0], "logins": x[1]}, data)
-    return list(data)
+    rows = (
+        StatisticsUserDay.objects.filter(logins__gt=0)
+        .annotate(month=TruncMonth("day"))
+        .values("month")
+        .annotate(logins=Sum("logins"))
+        .order_by("month")
+    )
+    return [
+        {"month": r["month"].strftime("%Y/%m"), "logins": r["logins"]} for r in rows
+    ]
 
 
 class OutputUserLogins(BaseModel):
@@ -110,17 +81,13 @@ class OutputUserLogins(BaseModel):
 
 @router.get(url="user_logins/", output_schema=list[OutputUserLogins])
 def query__user_logins(statistics_user: StatisticUser):
-    statement = """
-            select date(time) as date, count(*) as logins
-            from core_loggedpath as path
-            where path.path like '%login%'
-            and (path.status = 200 or path.status = 0)
-            group by date(time)
-            order by date(time) asc;
-            """
-    data = execute_statement(statement)
-    data = map(lambda x: {"date": x[0], "logins": x[1]}, data)
-    return list(data)
+    rows = (
+        StatisticsUserDay.objects.filter(logins__gt=0)
+        .values("day")
+        .annotate(logins=Sum("logins"))
+        .order_by("day")
+    )
+    return [{"date": r["day"], "logins": r["logins"]} for r in rows]
 
 
 class OutputOrgMembers(BaseModel):
@@ -303,21 +270,16 @@ class OutputDataSheetStatisticFieldStats(BaseModel):
     url="data_sheet_statistic_fields/", output_schema=OutputDataSheetStatisticFieldStats
 )
 def query__statistic_fields(org_user: OrgUser, data: InputDataSheetStatisticFields):
-    fields = DataSheetStatisticField.objects.filter(template__org=org_user.org)
-    entries = DataSheetStatisticEntry.objects.filter(field__in=fields).select_related(
-        "field"
-    )
-    if data.year:
-        entries = entries.filter(record__created__year=int(data.year))
+    names = DataSheetStatisticField.objects.filter(template__org=org_user.org)
     ret: dict[str, dict[str, int]] = {}
-    for field in fields:
-        ret[field.name] = {}
-    for entry in entries:
-        field_name = entry.field.name
-        value = entry.value
+    for name in names.values_list("name", flat=True):
+        ret[name] = {}
+    rows = StatisticsValueMonth.objects.filter(org=org_user.org, kind="statistic")
+    if data.year:
+        rows = rows.filter(month__year=int(data.year))
+    for field_name, value, count in rows.values_list("field", "value", "count"):
         ret.setdefault(field_name, {})
-        ret[field_name].setdefault(value, 0)
-        ret[field_name][value] += 1
+        ret[field_name][value] = ret[field_name].get(value, 0) + count
     years = get_available_datasheet_years(org_user.org.pk)
     return {
         "years": list(years),
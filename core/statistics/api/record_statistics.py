@@ -7,9 +7,12 @@ from pydantic import BaseModel
 
 from core.auth.models import StatisticUser
 from core.auth.models.org_user import OrgUser
+from core.data_sheets.models import DataSheet
 from core.records.models.record import RecordsRecord
 from core.seedwork.api_layer import Router
 from core.seedwork.statistics import execute_statement
+from core.statistics.models import StatisticsSheetValue
+from core.statistics.rollups import count_values, sheet_values_until
 from core.statistics.use_cases.records import create_statistic
 
 router = Router()
@@ -32,6 +35,29 @@ def query__created_records(org_user: OrgUser):
     return list(qs)
 
 
+def count_client_values(field: str) -> list[dict[str, Any]]:
+    # read from the rollup tables that are updated by the statistics cronjob,
+    # data sheets without any statistic entry are counted as 'Unset'. only the
+    # sheets that existed at the last run are counted, newer ones have no
+    # values yet.
+    counts = count_values("statistic", field)
+    until = sheet_values_until()
+    if until is None:
+        return [{"value": value, "count": count} for value, count in counts.items()]
+    with_statistics = (
+        StatisticsSheetValue.objects.filter(
+            kind="statistic", data_sheet__created__lt=until
+        )
+        .values("data_sheet_id")
+        .distinct()
+        .count()
+    )
+    unset = DataSheet.objects.filter(created__lt=until).count() - with_statistics
+    if unset > 0:
+        counts["Unset"] = counts.get("Unset", 0) + unset
+    return [{"value": value, "count": count} for value, count in counts.items()]
+
+
 class OutputRecordClientState(BaseModel):
     value: str
     count: int
@@ -42,19 +68,7 @@ class OutputRecordClientState(BaseModel):
     output_schema=list[OutputRecordClientState],
 )
 def query__record_client_state(statistics_user: StatisticUser):
-    statement = """
-           select
-           case when entry.value is null then 'Unset' else entry.value end as value,
-           count(*) as count
-           from core_datasheet record
-           left join core_datasheetstatisticentry entry on record.id = entry.record_id
-           left join core_datasheetstatisticfield field on entry.field_id = field.id
-           where field.name='Current status of the client' or field.name is null
-           group by value
-           """
-    data = execute_statement(statement)
-    data = map(lambda x: {"value": x[0], "count": x[1]}, data)
-    return list(data)
+    return count_client_values("Current status of the client")
 
 
 class OutputRecordClientAge(BaseModel):
@@ -67,19 +81,7 @@ class OutputRecordClientAge(BaseModel):
     output_schema=list[OutputRecordClientAge],
 )
 def query__record_client_age(statistics_user: StatisticUser):
-    statement = """
-            select
-            case when entry.value is null then 'Unset' else entry.value end as value,
-            count(*) as count
-            from core_datasheet record
-            left join core_datasheetstatisticentry entry on record.id = entry.record_id
-            left join core_datasheetstatisticfield field on entry.field_id = field.id
-            where field.name='Age in years of the client' or field.name is null
-            group by value
-            """
-    data = execute_statement(statement)
-    data = map(lambda x: {"value": x[0], "count": x[1]}, data)
-    return list(data)
+    return count_client_values("Age in years of the client")
 
 
 class OutputRecordClientNationality(BaseModel):
@@ -92,19 +94,7 @@ class OutputRecordClientNationality(BaseModel):
     output_schema=list[OutputRecordClientNationality],
 )
 def query__record_client_nationality(statistics_user: StatisticUser):
-    statement = """
-            select
-            case when entry.value is null then 'Unset' else entry.value end as value,
-            count(*) as count
-            from core_datasheet record
-            left join core_datasheetstatisticentry entry on record.id = entry.record_id
-            left join core_datasheetstatisticfield field on entry.field_id = field.id
-            where field.name='Nationality of the client' or field.name is null
-            group by value
-            """
-    data = execute_statement(statement)
-    data = map(lambda x: {"value": x[0], "count": x[1]}, data)
-    return list(data)
+    return count_client_values("Nationality of the client")
 
 
 class OutputRecordClientSex(BaseModel):
@@ -117,19 +107,7 @@ class OutputRecordClientSex(BaseModel):
     output_schema=list[OutputRecordClientSex],
 )
 def query__record_client_sex(statistics_user: StatisticUser):
-    statement = """
-            select
-            case when entry.value is null then 'Unset' else entry.value end as value,
-            count(*) as count
-            from core_datasheet record
-            left join core_datasheetstatisticentry entry on record.id = entry.record_id
-            left join core_datasheetstatisticfield field on entry.field_id = field.id
-            where field.name='Sex of the client' or field.name is null
-            group by value
-            """
-    data = execute_statement(statement)
-    data = map(lambda x: {"value": x[0], "count": x[1]}, data)
-    return list(data)
+    return count_client_values("Sex of the client")
 
 
 class OutputRecordStates(BaseModel):
@@ -0,0 +1,8 @@
+from core.statistics.rollups import refresh_rollups
+
+
+def update_statistics_rollups() -> str:
+    result = refresh_rollups()
+    return "Updated {} data sheets, {} value months and {} user days.".format(
+        result["sheets"], result["months"], result["days"]
+    )
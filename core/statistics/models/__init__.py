@@ -0,0 +1,13 @@
+from .rollup import (
+    StatisticsRollupState,
+    StatisticsSheetValue,
+    StatisticsUserDay,
+    StatisticsValueMonth,
+)
+
+__all__ = [
+    "StatisticsRollupState",
+    "StatisticsSheetValue",
+    "StatisticsUserDay",
+    "StatisticsValueMonth",
+]
@@ -0,0 +1,81 @@
+from django.db import models
+
+from core.auth.models import UserProfile
+from core.data_sheets.models import DataSheet
+from core.org.models import Org
+
+
+class StatisticsSheetValue(models.Model):
+    """
+    One row per entry value of a data sheet, for the entry types that are not
+    encrypted. Replaces the union over every entry table in the statistics.
+    """
+
+    data_sheet = models.ForeignKey(
+        DataSheet, related_name="statistics_values", on_delete=models.CASCADE
+    )
+    org = models.ForeignKey(
+        Org, related_name="statistics_sheet_values", on_delete=models.CASCADE
+    )
+    kind = models.CharField(max_length=20)
+    field = models.CharField(max_length=200)
+    value = models.TextField()
+    month = models.DateField()
+
+    class Meta:
+        verbose_name = "STA_StatisticsSheetValue"
+        verbose_name_plural = "STA_StatisticsSheetValues"
+        indexes = [models.Index(fields=["org", "kind", "field"])]
+
+    def __str__(self):
+        return "statisticsSheetValue: {}; field: {};".format(self.pk, self.field)
+
+
+class StatisticsValueMonth(models.Model):
+    org = models.ForeignKey(
+        Org, related_name="statistics_value_months", on_delete=models.CASCADE
+    )
+    kind = models.CharField(max_length=20)
+    field = models.CharField(max_length=200)
+    value = models.TextField()
+    month = models.DateField()
+    count = models.IntegerField()
+
+    class Meta:
+        verbose_name = "STA_StatisticsValueMonth"
+        verbose_name_plural = "STA_StatisticsValueMonths"
+        indexes = [models.Index(fields=["kind", "field"])]
+
+    def __str__(self):
+        return "statisticsValueMonth: {}; field: {}; month: {};".format(
+            self.pk, self.field, self.month
+        )
+
+
+class StatisticsUserDay(models.Model):
+    user = models.ForeignKey(
+        UserProfile, related_name="statistics_days", on_delete=models.CASCADE
+    )
+    day = models.DateField(db_index=True)
+    actions = models.IntegerField(default=0)
+    logins = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = "STA_StatisticsUserDay"
+        verbose_name_plural = "STA_StatisticsUserDays"
+        unique_together = ["user", "day"]
+
+    def __str__(self):
+        return "statisticsUserDay: {}; day: {};".format(self.user_id, self.day)
+
+
+class StatisticsRollupState(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+    until = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "STA_StatisticsRollupState"
+        verbose_name_plural = "STA_StatisticsRollupStates"
+
+    def __str__(self):
+        return "statisticsRollupState: {}; until: {};".format(self.name, self.until)
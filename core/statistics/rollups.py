@@ -0,0 +1,190 @@
+import calendar
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Iterator
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from core.data_sheets.models import DataSheet
+from core.data_sheets.models.data_sheet import (
+    DataSheetSelectEntry,
+    DataSheetStandardEntry,
+    DataSheetStateEntry,
+    DataSheetStatisticEntry,
+)
+from core.other.models import LoggedPath
+from core.statistics.models import (
+    StatisticsRollupState,
+    StatisticsSheetValue,
+    StatisticsUserDay,
+    StatisticsValueMonth,
+)
+
+EntryModel = (
+    type[DataSheetStateEntry]
+    | type[DataSheetStatisticEntry]
+    | type[DataSheetSelectEntry]
+    | type[DataSheetStandardEntry]
+)
+
+ENTRY_KINDS: list[tuple[str, EntryModel]] = [
+    ("state", DataSheetStateEntry),
+    ("statistic", DataSheetStatisticEntry),
+    ("select", DataSheetSelectEntry),
+    ("standard", DataSheetStandardEntry),
+]
+
+# free text is only needed for the dynamic statistic and is not counted per month
+COUNTED_KINDS = ["state", "statistic", "select"]
+
+BATCH_SIZE = 500
+
+
+def first_of_month(d: date | datetime) -> date:
+    return date(d.year, d.month, 1)
+
+
+def one_month_before(d: date) -> date:
+    year, month = (d.year - 1, 12) if d.month == 1 else (d.year, d.month - 1)
+    day = min(d.day, calendar.monthrange(year, month)[1])
+    return date(year, month, day)
+
+
+def __batches(ids: list[int]) -> Iterator[list[int]]:
+    for i in range(0, len(ids), BATCH_SIZE):
+        yield ids[i : i + BATCH_SIZE]
+
+
+def refresh_sheet_values(since: datetime | None = None) -> int:
+    """
+    Writes the entry values of every data sheet that changed since 'since'
+    again. Entries are saved together with their sheet, that is why the
+    updated time of the sheet is enough to find the changed values. The
+    values also hold the name of their field, so the sheets with entries of
+    fields that changed since then are written again as well.
+    """
+    sheets = DataSheet.objects.all()
+    if since is not None:
+        changed = Q(updated__gte=since)
+        for _, entry_model in ENTRY_KINDS:
+            renamed = entry_model.objects.filter(field__updated__gte=since)
+            changed |= Q(pk__in=renamed.values("record_id"))
+        sheets = sheets.filter(changed)
+    info = {
+        pk: (org_id, first_of_month(created))
+        for pk, org_id, created in sheets.values_list(
+            "pk", "template__org_id", "created"
+        )
+    }
+
+    for batch in __batches(list(info.keys())):
+        values: list[StatisticsSheetValue] = []
+        for kind, entry_model in ENTRY_KINDS:
+            entries = entry_model.objects.filter(record_id__in=batch).values_list(
+                "record_id", "field__name", "value"
+            )
+            for sheet_id, field, value in entries:
+                org_id, month = info[sheet_id]
+                values.append(
+                    StatisticsSheetValue(
+                        data_sheet_id=sheet_id,
+                        org_id=org_id,
+                        kind=kind,
+                        field=field,
+                        value=value,
+                        month=month,
+                    )
+                )
+        with transaction.atomic():
+            StatisticsSheetValue.objects.filter(data_sheet_id__in=batch).delete()
+            StatisticsSheetValue.objects.bulk_create(values, batch_size=BATCH_SIZE)
+
+    return len(info)
+
+
+def refresh_value_months() -> int:
+    """
+    Counts the sheet values per org, field, value and month. This is one
+    group by over the sheet values, which also drops the counts of deleted
+    data sheets.
+    """
+    counts = (
+        StatisticsSheetValue.objects.filter(kind__in=COUNTED_KINDS)
+        .values("org_id", "kind", "field", "value", "month")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    months = [StatisticsValueMonth(**c) for c in counts]
+    with transaction.atomic():
+        StatisticsValueMonth.objects.all().delete()
+        StatisticsValueMonth.objects.bulk_create(months, batch_size=BATCH_SIZE)
+    return len(months)
+
+
+def refresh_user_days(since: date | None = None) -> int:
+    """
+    Counts the actions and logins of every user per day from 'since' on.
+    Logged paths are only ever appended, days before 'since' stay as they are.
+    """
+    paths = LoggedPath.objects.filter(user__isnull=False)
+    if since is not None:
+        start = timezone.make_aware(datetime.combine(since, time.min))
+        paths = paths.filter(time__gte=start)
+    login = Q(path__contains="login") & (Q(status=200) | Q(status=0))
+    counts = (
+        paths.annotate(day=TruncDate("time"))
+        .values("user_id", "day")
+        .annotate(actions=Count("id"), logins=Count("id", filter=login))
+        .order_by()
+    )
+    days = [StatisticsUserDay(**c) for c in counts]
+    with transaction.atomic():
+        old = StatisticsUserDay.objects.all()
+        if since is not None:
+            old = old.filter(day__gte=since)
+        old.delete()
+        StatisticsUserDay.objects.bulk_create(days, batch_size=BATCH_SIZE)
+    return len(days)
+
+
+def sheet_values_until() -> datetime | None:
+    """
+    The time of the last refresh of the sheet values. Sheets created after it
+    have no values yet.
+    """
+    state = StatisticsRollupState.objects.filter(name="sheet_values").first()
+    return state.until if state else None
+
+
+def refresh_rollups() -> dict[str, int]:
+    started = timezone.now()
+    state, created = StatisticsRollupState.objects.get_or_create(
+        name="sheet_values", defaults={"until": started}
+    )
+    sheets = refresh_sheet_values(None if created else state.until)
+    state.until = started
+    state.save()
+
+    months = refresh_value_months()
+
+    last_day = StatisticsUserDay.objects.order_by("-day").values_list("day").first()
+    days = refresh_user_days(last_day[0] if last_day else None)
+
+    return {"sheets": sheets, "months": months, "days": days}
+
+
+def count_values(
+    kind: str, field: str, org_id: int | None = None, year: int | None = None
+) -> dict[str, int]:
+    rows = StatisticsValueMonth.objects.filter(kind=kind, field=field)
+    if org_id is not None:
+        rows = rows.filter(org_id=org_id)
+    if year is not None:
+        rows = rows.filter(month__year=year)
+    counts: dict[str, int] = defaultdict(int)
+    for value, count in rows.values_list("value", "count"):
+        counts[value] += count
+    return dict(counts)
@@ -0,0 +1,163 @@
+import json
+from datetime import date
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from core.data_sheets.models import (
+    DataSheetStatisticEntry,
+    DataSheetStatisticField,
+    DataSheetTemplate,
+)
+from core.data_sheets.use_cases.templates import update_field
+from core.org.models import Org
+from core.other.models import LoggedPath
+from core.permissions.static import PERMISSION_ADMIN_MANAGE_RECORD_TEMPLATES
+from core.statistics.api.record_statistics import count_client_values
+from core.statistics.cronjobs import update_statistics_rollups
+from core.statistics.models import StatisticsSheetValue, StatisticsUserDay
+from core.statistics.rollups import count_values, one_month_before, refresh_rollups
+from core.tests import test_helpers
+
+
+@pytest.fixture
+def data(db):
+    org = Org.objects.create(name="Test RLC")
+    user = test_helpers.create_org_user(org=org)
+    statistics_user = test_helpers.create_statistics_user(
+        email="statistics@law-orga.de", name="Mr. Statistics"
+    )
+    org.generate_keys()
+    template = DataSheetTemplate.objects.create(org=org, name="Record Template")
+    field = DataSheetStatisticField.objects.create(
+        template=template, name="Sex of the client", helptext=""
+    )
+    sheets = []
+    for value in ["Male", "Female", "Female"]:
+        sheet = test_helpers.create_data_sheet(template=template, users=[user["user"]])
+        DataSheetStatisticEntry.objects.create(
+            field=field, record=sheet["record"], value=value
+        )
+        sheets.append(sheet["record"])
+    test_helpers.create_data_sheet(template=template, users=[user["user"]])
+    LoggedPath.objects.create(user=user["user"], path="/api/auth/login/", status=200)
+    LoggedPath.objects.create(user=user["user"], path="/api/records/", status=200)
+    yield {
+        "user": user,
+        "statistics_user": statistics_user,
+        "field": field,
+        "sheets": sheets,
+    }
+
+
+def test_one_month_before():
+    assert one_month_before(date(2024, 3, 31)) == date(2024, 2, 29)
+    assert one_month_before(date(2024, 1, 15)) == date(2023, 12, 15)
+
+
+def test_refresh_rollups(data):
+    assert "Updated 4 data sheets" in update_statistics_rollups()
+    assert StatisticsSheetValue.objects.count() == 3
+    day = StatisticsUserDay.objects.get()
+    assert day.actions == 2 and day.logins == 1
+
+
+def test_refresh_only_updates_changed_sheets(data):
+    refresh_rollups()
+    entry = DataSheetStatisticEntry.objects.get(record=data["sheets"][0])
+    entry.value = "Female"
+    entry.save()
+    data["sheets"][0].save()
+
+    result = refresh_rollups()
+
+    assert result["sheets"] == 1
+    assert set(StatisticsSheetValue.objects.values_list("value", flat=True)) == {
+        "Female"
+    }
+
+
+def test_renaming_a_field_refreshes_the_sheet_values(data):
+    refresh_rollups()
+    org_user = data["user"]["org_user"]
+    org_user.grant(PERMISSION_ADMIN_MANAGE_RECORD_TEMPLATES)
+
+    update_field(org_user, data["field"].uuid, "Gender of the client", 1)
+    result = refresh_rollups()
+
+    assert result["sheets"] == 3
+    fields = set(StatisticsSheetValue.objects.values_list("field", flat=True))
+    assert fields == {"Gender of the client"}
+    assert count_values("statistic", "Gender of the client") == {
+        "Male": 1,
+        "Female": 2,
+    }
+
+
+def test_record_client_sex_reads_rollups(data):
+    refresh_rollups()
+    c = Client()
+    c.login(**data["statistics_user"])
+    response = c.get("/api/statistics/record/record_client_sex/")
+    counts = {d["value"]: d["count"] for d in response.json()}
+    assert counts == {"Male": 1, "Female": 2, "Unset": 1}
+
+
+def test_sheets_created_after_the_rollup_are_not_unset(data):
+    refresh_rollups()
+    test_helpers.create_data_sheet(
+        template=data["field"].template, users=[data["user"]["user"]]
+    )
+
+    counts = count_client_values("Sex of the client")
+
+    assert {d["value"]: d["count"] for d in counts} == {
+        "Male": 1,
+        "Female": 2,
+        "Unset": 1,
+    }
+
+
+def test_statistic_fields_read_rollups(data):
+    refresh_rollups()
+    c = Client()
+    c.login(**data["user"])
+    year = timezone.now().year
+    response = c.get(
+        "/api/statistics/org/data_sheet_statistic_fields/?year={}".format(year)
+    )
+    stats = response.json()["stats"]
+    assert stats["Sex of the client"] == {"Male": 1, "Female": 2}
+
+
+def test_user_statistics_read_rollups(data):
+    refresh_rollups()
+    c = Client()
+    c.login(**data["user"])
+    response = c.get("/api/statistics/individual/user_actions_month/")
+    assert response.json() == [{"email": "dummy@law-orga.de", "actions": 2}]
+
+    c.login(**data["statistics_user"])
+    response = c.get("/api/statistics/org/user_logins_month/")
+    assert response.json() == [
+        {"month": timezone.localdate().strftime("%Y/%m"), "logins": 1}
+    ]
+
+
+def test_dynamic_statistic_reads_sheet_values(data):
+    refresh_rollups()
+    c = Client()
+    c.login(**data["statistics_user"])
+    response = c.post(
+        "/api/statistics/record/dynamic/",
+        data=json.dumps(
+            {
+                "field_1": "Sex of the client",
+                "value_1": "Female",
+                "field_2": "Sex of the client",
+            }
+        ),
+        content_type="application/json",
+    )
+    assert response.json()["data"] == [["Female", 2, 0]]
@@ -27,40 +27,15 @@ def create_statistic(__actor: StatisticUser, field_1: str, value_1: str, field_2
             "Only a-z, A-Z, 0-9, %, -, _ and space is allowed."
         )
 
+    # the sheet values are the union of all entry tables, see rollups.py
     statement = """
-    with t as (
-        select id, k.name as field, value from
-        core_datasheet record
-        left join (
-
-            select name, value, record_id
-            from core_datasheetstatefield state_field
-            inner join core_datasheetstateentry state_entry
-                on state_field.id = state_entry.field_id
-            union all
-            select name, value, record_id from core_datasheetstatisticfield statistic_field
-            inner join core_datasheetstatisticentry statistic_entry
-                on statistic_field.id = statistic_entry.field_id
-            union all
-            select name, value, record_id from core_datasheetselectfield select_field
-            inner join core_datasheetselectentry select_entry
-                on select_field.id = select_entry.field_id
-            union all
-            select name, value, record_id
-            from core_datasheetstandardfield standard_field
-            inner join core_datasheetstandardentry standard_entry
-                on standard_field.id = standard_entry.field_id
-
-        ) k on k.record_id = record.id
-    )
-
     select value, count(*) as count, max(error) as error
     from (
-        select t1.id, t2.value as value, count(*) as count, COUNT('x') over (partition by t1.id) - 1 as error
-        from t t1
-        inner join t t2 on t1.id = t2.id
+        select t1.data_sheet_id, t2.value as value, count(*) as count, COUNT('x') over (partition by t1.data_sheet_id) - 1 as error
+        from core_statisticssheetvalue t1
+        inner join core_statisticssheetvalue t2 on t1.data_sheet_id = t2.data_sheet_id
         where (lower(t1.field) like lower('{}') and lower(t1.value) like lower('{}')) and lower(t2.field) = lower('{}')
-        group by t1.id, t2.value
+        group by t1.data_sheet_id, t2.value
     ) m
     group by value;
     """.format(cleaned_field_1, cleaned_value_1, cleaned_field_2)
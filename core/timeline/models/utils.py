@@ -14,20 +14,24 @@ class EncryptDecryptMethods:
     def encrypt(self, folder: Folder, user: OrgUser) -> None:
         assert folder.uuid == self.folder_uuid, "folder uuid mismatch"
         key = folder.get_encryption_key(requestor=user)
-        for field in self.ENCRYPTED_FIELDS:
-            value: str = getattr(self, field)
-            box = OpenBox(value.encode("utf-8"))
-            if value is not None:
-                setattr(self, "{}_enc".format(field), key.lock(box).as_dict())
+        fields = [f for f in self.ENCRYPTED_FIELDS if getattr(self, f) is not None]
+        boxes = [OpenBox(getattr(self, f).encode("utf-8")) for f in fields]
+        for field, locked_box in zip(fields, key.lock_many(boxes)):
+            setattr(self, "{}_enc".format(field), locked_box.as_dict())
         self.is_encrypted = True
 
     def decrypt(self, folder: Folder, user: OrgUser) -> None:
         assert folder.uuid == self.folder_uuid, "folder uuid mismatch"
         key = folder.get_decryption_key(requestor=user)
-        for field in self.ENCRYPTED_FIELDS:
-            value: dict = getattr(self, "{}_enc".format(field))
-            if value is not None:
-                locked_box = LockedBox.create_from_dict(value)
-                box = key.unlock(locked_box)
-                setattr(self, field, box.value_as_str)
+        fields = [
+            f
+            for f in self.ENCRYPTED_FIELDS
+            if getattr(self, "{}_enc".format(f)) is not None
+        ]
+        locked_boxes = [
+            LockedBox.create_from_dict(getattr(self, "{}_enc".format(f)))
+            for f in fields
+        ]
+        for field, box in zip(fields, key.unlock_many(locked_boxes)):
+            setattr(self, field, box.value_as_str)
         self.is_encrypted = False
@@ -1,4 +1,3 @@
-from tempfile import _TemporaryFileWrapper
 from typing import IO, TYPE_CHECKING
 from uuid import UUID, uuid4
 
@@ -116,9 +115,7 @@ class UploadLink(FolderItemMixin, models.Model):
 
         return file
 
-    def download(
-        self, uuid: UUID, user: OrgUser
-    ) -> tuple[str, IO | _TemporaryFileWrapper]:
+    def download(self, uuid: UUID, user: OrgUser) -> tuple[str, IO[bytes]]:
         file = self.upload_files[uuid]
         enc_key = EncryptedAsymmetricKey.create_from_dict(self.key)
         unlock_key = self.folder.get_decryption_key(requestor=user)
@@ -195,11 +192,9 @@ class UploadFile(models.Model):
         )
         self.file.save(file_name, DjangoFile(enc_f), save=False)
 
-    def download(self, link_key: AsymmetricKey) -> IO | _TemporaryFileWrapper:
+    def download(self, link_key: AsymmetricKey) -> IO[bytes]:
         key = self.get_key(link_key)
-        f = AESEncryption.decrypt_bytes_file(
-            self.file.file, key.get_key().decode("utf-8")
-        )
+        f = AESEncryption.decrypt_bytes_file(self.file, key.get_key().decode("utf-8"))
         return f
 
     def delete_file(self):
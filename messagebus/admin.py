@@ -1,5 +1,6 @@
 from django.contrib import admin
 
-from messagebus.models import Message
+from messagebus.models import Message, OutboxMessage
 
 admin.site.register(Message)
+admin.site.register(OutboxMessage)
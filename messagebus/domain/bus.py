@@ -41,6 +41,30 @@ class MessageBus:
             self._run_nesting_check(event_type)
             self._run_duplicate_check(event_type)
 
+    @staticmethod
+    def _get_all_event_types() -> list[Type[Event]]:
+        found: list[Type[Event]] = []
+        todo = list(Event.__subclasses__())
+        while todo:
+            event_type = todo.pop()
+            found.append(event_type)
+            todo += event_type.__subclasses__()
+        return found
+
+    @classmethod
+    def get_event_model(cls, name: str) -> Type[Event]:
+        if cls.event_models is None or name not in cls.event_models:
+            # events that are not nested inside a class, e.g. in tests, can not
+            # be stored and are skipped
+            cls.event_models = {
+                e._get_name(): e
+                for e in [*cls._get_all_event_types(), *cls.handlers.keys()]
+                if e.__qualname__.count(".") == 1
+            }
+        if name not in cls.event_models:
+            raise ValueError(f"No event with the name '{name}' exists.")
+        return cls.event_models[name]
+
     def register_handler(self, event_class: Type[Event], handler: Callable):
         if not issubclass(event_class, Event):
             raise TypeError(
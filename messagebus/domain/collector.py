@@ -13,5 +13,10 @@ class EventCollector:
     def pop(self):
         return self.events.pop(0) if self.events else None
 
+    def pop_all(self) -> list[Event]:
+        events = self.events
+        self.events = []
+        return events
+
     def clear_events(self):
         self.events.clear()
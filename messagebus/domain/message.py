@@ -28,3 +28,14 @@ class DomainMessage(BaseModel):
 
     def add_to_metadata(self, key: str, value: Any) -> None:
         self.metadata[key] = value
+
+
+def get_aggregate_name(stream_name: str) -> str:
+    # the category of a stream is everything in front of the first dash
+    return stream_name.split("-", 1)[0]
+
+
+class Snapshot(BaseModel):
+    stream_name: str
+    position: int
+    data: dict
@@ -0,0 +1,23 @@
+from typing import Sequence
+
+from messagebus.domain.bus import MessageBus
+from messagebus.domain.event import Event
+
+from seedwork.repository import SingletonRepository
+
+
+class Outbox(SingletonRepository):
+    """
+    The Outbox holds events whose handlers should not run inside the request
+    that raised them. Events are added in the same transaction in which they
+    are appended to the EventStore and a worker dispatches them to the
+    MessageBus later on.
+    """
+
+    SETTING = "MESSAGEBUS_OUTBOX"
+
+    def add(self, events: Sequence[Event]) -> None:
+        raise NotImplementedError()
+
+    def process(self, bus: MessageBus, batch_size: int = 100) -> int:
+        raise NotImplementedError()
@@ -1,12 +1,23 @@
 from typing import Optional, Sequence, TypeVar
 
-from messagebus.domain.message import DomainMessage, Message
+from messagebus.domain.message import DomainMessage, Message, Snapshot
 
 from seedwork.repository import SingletonRepository
 
 M = TypeVar("M", bound=Message)
 
 
+class WrongExpectedVersionError(Exception):
+    def __init__(self, stream_name: str, expected: int, actual: int):
+        super().__init__(
+            f"The stream '{stream_name}' is at version {actual} "
+            f"but version {expected} was expected."
+        )
+        self.stream_name = stream_name
+        self.expected = expected
+        self.actual = actual
+
+
 class EventStore(SingletonRepository):
     """
     The EventStore is responsible for storing and loading messages.
@@ -20,8 +31,41 @@ class EventStore(SingletonRepository):
         stream_name: str,
         messages: Sequence[Message],
         position: Optional[int] = None,
+        expected_version: Optional[int] = None,
     ):
+        """
+        Appends the messages to the stream. If 'expected_version' is set the
+        messages are only appended if the stream is still at that version,
+        otherwise a WrongExpectedVersionError is raised.
+        """
         raise NotImplementedError()
 
-    def load(self, stream_name: str, exact=True) -> list[DomainMessage]:
+    def load(
+        self, stream_name: str, exact=True, from_position: Optional[int] = None
+    ) -> list[DomainMessage]:
+        """
+        Loads the messages of the stream. With 'exact=False' all streams that
+        start with 'stream_name' are loaded. With 'from_position' only the
+        messages at or after that position are loaded.
+        """
         raise NotImplementedError()
+
+    def load_aggregate(self, aggregate_name: str) -> list[DomainMessage]:
+        raise NotImplementedError()
+
+    def save_snapshot(self, snapshot: Snapshot) -> None:
+        raise NotImplementedError()
+
+    def load_snapshot(self, stream_name: str) -> Optional[Snapshot]:
+        raise NotImplementedError()
+
+    def load_since_snapshot(
+        self, stream_name: str
+    ) -> tuple[Optional[Snapshot], list[DomainMessage]]:
+        """
+        Returns the latest snapshot of the stream together with the messages
+        that were appended after it, so that only the tail has to be replayed.
+        """
+        snapshot = self.load_snapshot(stream_name)
+        from_position = snapshot.position + 1 if snapshot else None
+        return snapshot, self.load(stream_name, from_position=from_position)
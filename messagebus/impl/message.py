@@ -2,10 +2,14 @@ from django.db import models
 from django.utils import timezone
 
 from messagebus.domain.message import DomainMessage
+from messagebus.domain.message import Snapshot as DomainSnapshot
 
 
 class Message(models.Model):
     stream_name = models.CharField(max_length=1000)
+    aggregate_name = models.CharField(
+        max_length=1000, blank=True, default="", db_index=True
+    )
     action = models.SlugField(max_length=200)
     position = models.IntegerField()
     data = models.JSONField()
@@ -16,6 +20,14 @@ class Message(models.Model):
         verbose_name = "Message"
         verbose_name_plural = "Messages"
         unique_together = ["position", "stream_name"]
+        indexes = [
+            # allows prefix queries on the stream name to use the index
+            models.Index(
+                fields=["stream_name"],
+                name="messagebus_stream_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
 
     def __str__(self):
         return f"{self.stream_name}: {self.data}"
@@ -29,3 +41,22 @@ class Message(models.Model):
             position=self.position,
             time=self.time,
         )
+
+
+class Snapshot(models.Model):
+    stream_name = models.CharField(max_length=1000, unique=True)
+    position = models.IntegerField()
+    data = models.JSONField()
+    time = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "Snapshot"
+        verbose_name_plural = "Snapshots"
+
+    def __str__(self):
+        return f"{self.stream_name}: {self.position}"
+
+    def to_domain_snapshot(self) -> DomainSnapshot:
+        return DomainSnapshot(
+            stream_name=self.stream_name, position=self.position, data=self.data
+        )
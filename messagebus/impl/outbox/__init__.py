@@ -0,0 +1 @@
+from .django import DjangoOutbox
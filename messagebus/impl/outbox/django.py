@@ -0,0 +1,88 @@
+from datetime import timedelta
+from logging import getLogger
+from typing import Sequence
+
+from django.db import transaction
+from django.utils import timezone
+
+from messagebus.domain.bus import MessageBus
+from messagebus.domain.event import Event
+from messagebus.domain.outbox import Outbox
+from messagebus.impl.outbox_message import OutboxMessage
+
+logger = getLogger("messagebus")
+
+
+class DjangoOutbox(Outbox):
+    MAX_ATTEMPTS = 5
+
+    @staticmethod
+    def _retry_delay(attempts: int) -> timedelta:
+        return timedelta(seconds=min(3600, 10 * 2**attempts))
+
+    def add(self, events: Sequence[Event]) -> None:
+        if len(events) == 0:
+            return
+
+        messages = [
+            OutboxMessage(
+                stream_name=event.stream_name,
+                event_name=event._get_name(),
+                payload=event.model_dump(mode="json"),
+            )
+            for event in events
+        ]
+        OutboxMessage.objects.bulk_create(messages)
+
+    def process(self, bus: MessageBus, batch_size: int = 100) -> int:
+        now = timezone.now()
+
+        with transaction.atomic():
+            messages = list(
+                OutboxMessage.objects.select_for_update(skip_locked=True)
+                .filter(
+                    processed_at__isnull=True,
+                    attempts__lt=self.MAX_ATTEMPTS,
+                    available_at__lte=now,
+                )
+                .order_by("pk")[:batch_size]
+            )
+
+            # events of one stream are handled in order, so a stream with an
+            # event that waits for its retry is blocked until that event passed
+            blocked_streams = set(
+                OutboxMessage.objects.filter(
+                    processed_at__isnull=True,
+                    attempts__gt=0,
+                    attempts__lt=self.MAX_ATTEMPTS,
+                    available_at__gt=now,
+                ).values_list("stream_name", flat=True)
+            )
+
+            handled: list[OutboxMessage] = []
+            for message in messages:
+                if message.stream_name in blocked_streams:
+                    continue
+
+                try:
+                    event_class = bus.get_event_model(message.event_name)
+                    event = event_class.model_validate(message.payload)
+                    with transaction.atomic():
+                        bus.handle(event)
+                    message.processed_at = timezone.now()
+                    message.last_error = ""
+                except Exception as e:
+                    logger.exception(f"Handling outbox message '{message.pk}' failed.")
+                    blocked_streams.add(message.stream_name)
+                    message.attempts += 1
+                    message.last_error = str(e)
+                    message.available_at = timezone.now() + self._retry_delay(
+                        message.attempts
+                    )
+                handled.append(message)
+
+            OutboxMessage.objects.bulk_update(
+                handled, ["processed_at", "attempts", "last_error", "available_at"]
+            )
+
+        return len(handled)
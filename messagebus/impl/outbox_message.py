@@ -0,0 +1,24 @@
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxMessage(models.Model):
+    stream_name = models.CharField(max_length=1000)
+    event_name = models.CharField(max_length=200)
+    payload = models.JSONField()
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    created = models.DateTimeField(default=timezone.now)
+    available_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "OutboxMessage"
+        verbose_name_plural = "OutboxMessages"
+        ordering = ["pk"]
+        indexes = [
+            models.Index(fields=["processed_at", "available_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.stream_name}: {self.event_name}"
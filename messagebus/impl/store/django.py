@@ -1,59 +1,120 @@
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
 
+from django.db import transaction
 from django.db.models import Max, Q
 
-from messagebus.domain.message import DomainMessage, Message
-from messagebus.domain.store import EventStore
+from messagebus.domain.message import (
+    DomainMessage,
+    Message,
+    Snapshot,
+    get_aggregate_name,
+)
+from messagebus.domain.store import EventStore, WrongExpectedVersionError
 from messagebus.impl.message import Message as DjangoMessage
+from messagebus.impl.message import Snapshot as DjangoSnapshot
+from messagebus.impl.stream_head import StreamHead
 
 
 class DjangoEventStore(EventStore):
+    @staticmethod
+    def __legacy_version(stream_name: str) -> int:
+        # streams that were written before the stream heads existed
+        messages_max = DjangoMessage.objects.filter(stream_name=stream_name).aggregate(
+            max_position=Max("position")
+        )
+        return messages_max["max_position"] or 0
+
+    def __lock_head(self, stream_name: str) -> StreamHead:
+        heads = StreamHead.objects.select_for_update()
+        head = heads.filter(stream_name=stream_name).first()
+        if head is None:
+            version = self.__legacy_version(stream_name)
+            StreamHead.objects.get_or_create(
+                stream_name=stream_name, defaults={"version": version}
+            )
+            # another writer could have created the head in between
+            head = heads.get(stream_name=stream_name)
+        return head
+
     def append(
         self,
         stream_name: str,
         messages: Sequence[Message],
         position: Optional[int] = None,
+        expected_version: Optional[int] = None,
     ):
         if len(messages) == 0:
             return
 
-        messages_to_save: list[DjangoMessage] = []
+        with transaction.atomic():
+            head = self.__lock_head(stream_name)
 
-        if position is None:
-            messages_max = DjangoMessage.objects.filter(
-                stream_name=stream_name
-            ).aggregate(max_position=Max("position"))
-            position = (
-                messages_max["max_position"] + 1 if messages_max["max_position"] else 1
-            )
+            if expected_version is not None and head.version != expected_version:
+                raise WrongExpectedVersionError(
+                    stream_name, expected_version, head.version
+                )
 
-        assert position is not None
+            if position is None:
+                position = head.version + 1
 
-        for message in messages:
-            message_to_save = DjangoMessage(
-                stream_name=stream_name,
-                action=message.action,
-                position=position,
-                data=message.data,
-                metadata=message.metadata,
-            )
-            messages_to_save.append(message_to_save)
-            position += 1
+            assert position is not None
 
-        DjangoMessage.objects.bulk_create(messages_to_save)
+            aggregate_name = get_aggregate_name(stream_name)
+            messages_to_save: list[DjangoMessage] = []
+            for message in messages:
+                message_to_save = DjangoMessage(
+                    stream_name=stream_name,
+                    aggregate_name=aggregate_name,
+                    action=message.action,
+                    position=position,
+                    data=message.data,
+                    metadata=message.metadata,
+                )
+                messages_to_save.append(message_to_save)
+                position += 1
 
-    def load(self, stream_name: str, exact=True) -> list[DomainMessage]:
-        if exact:
-            query_filter = Q(stream_name=stream_name)
-        else:
-            query_filter = Q(stream_name__contains=stream_name)
-        messages1 = DjangoMessage.objects.filter(query_filter).order_by("position")
-        messages2 = list(messages1)
-        messages3: list[DomainMessage] = []
-        for message1 in messages2:
+            DjangoMessage.objects.bulk_create(messages_to_save)
+
+            version = max(head.version, position - 1)
+            StreamHead.objects.filter(pk=head.pk).update(version=version)
+
+    @staticmethod
+    def __to_domain_messages(messages: Iterable[DjangoMessage]) -> list[DomainMessage]:
+        domain_messages: list[DomainMessage] = []
+        for message1 in messages:
             message2 = message1.to_domain_message()
             message2.add_to_metadata("position", message1.position)
             message2.add_to_metadata("time", message1.time)
             message2.add_to_metadata("stream_name", message1.stream_name)
-            messages3.append(message2)
-        return messages3
+            domain_messages.append(message2)
+        return domain_messages
+
+    def load(
+        self, stream_name: str, exact=True, from_position: Optional[int] = None
+    ) -> list[DomainMessage]:
+        if exact:
+            query_filter = Q(stream_name=stream_name)
+        else:
+            query_filter = Q(stream_name__startswith=stream_name)
+        if from_position is not None:
+            query_filter &= Q(position__gte=from_position)
+        messages = DjangoMessage.objects.filter(query_filter).order_by("position")
+        return self.__to_domain_messages(messages)
+
+    def load_aggregate(self, aggregate_name: str) -> list[DomainMessage]:
+        messages = DjangoMessage.objects.filter(aggregate_name=aggregate_name).order_by(
+            "time", "pk"
+        )
+        return self.__to_domain_messages(messages)
+
+    def save_snapshot(self, snapshot: Snapshot) -> None:
+        DjangoSnapshot.objects.update_or_create(
+            stream_name=snapshot.stream_name,
+            defaults={"position": snapshot.position, "data": snapshot.data},
+        )
+
+    def load_snapshot(self, stream_name: str) -> Optional[Snapshot]:
+        snapshot = DjangoSnapshot.objects.filter(stream_name=stream_name).first()
+        if snapshot is None:
+            return None
+        return snapshot.to_domain_snapshot()
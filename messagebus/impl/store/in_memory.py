@@ -2,8 +2,13 @@ from typing import Optional, Sequence
 
 from django.utils import timezone
 
-from messagebus.domain.message import DomainMessage, Message
-from messagebus.domain.store import EventStore
+from messagebus.domain.message import (
+    DomainMessage,
+    Message,
+    Snapshot,
+    get_aggregate_name,
+)
+from messagebus.domain.store import EventStore, WrongExpectedVersionError
 
 
 class InMemoryEventStore(EventStore):
@@ -11,16 +16,26 @@ class InMemoryEventStore(EventStore):
         super().__init__()
         if not hasattr(self, "_messages"):
             self._messages: dict[str, list[DomainMessage]] = {}
+        if not hasattr(self, "_snapshots"):
+            self._snapshots: dict[str, Snapshot] = {}
 
     def append(
         self,
         stream_name: str,
         messages: Sequence[Message],
         position: Optional[int] = None,
+        expected_version: Optional[int] = None,
     ):
         if len(messages) == 0:
             return
 
+        if expected_version is not None:
+            version = 0
+            if stream_name in self._messages and len(self._messages[stream_name]):
+                version = self._messages[stream_name][-1].metadata["position"]
+            if version != expected_version:
+                raise WrongExpectedVersionError(stream_name, expected_version, version)
+
         if position is None:
             position = 1
             if stream_name in self._messages and len(self._messages[stream_name]):
@@ -50,18 +65,29 @@ class InMemoryEventStore(EventStore):
 
         self._messages[stream_name] += to_be_saved
 
-    def load(self, stream_name: str, exact=True) -> list[DomainMessage]:
+    def load(
+        self, stream_name: str, exact=True, from_position: Optional[int] = None
+    ) -> list[DomainMessage]:
+        messages: list[DomainMessage] = []
         if exact:
-            try:
-                messages1 = self._messages[stream_name]
-            except KeyError:
-                return []
-            messages2 = list(messages1)
-            return messages2
-
+            messages = list(self._messages.get(stream_name, []))
         else:
-            messages: list[DomainMessage] = []
             for key in self._messages:
-                if stream_name in key:
+                if key.startswith(stream_name):
                     messages += self._messages[key]
-            return messages
+        if from_position is not None:
+            messages = [m for m in messages if m.metadata["position"] >= from_position]
+        return messages
+
+    def load_aggregate(self, aggregate_name: str) -> list[DomainMessage]:
+        messages: list[DomainMessage] = []
+        for key in self._messages:
+            if get_aggregate_name(key) == aggregate_name:
+                messages += self._messages[key]
+        return messages
+
+    def save_snapshot(self, snapshot: Snapshot) -> None:
+        self._snapshots[snapshot.stream_name] = snapshot
+
+    def load_snapshot(self, stream_name: str) -> Optional[Snapshot]:
+        return self._snapshots.get(stream_name)
@@ -0,0 +1,13 @@
+from django.db import models
+
+
+class StreamHead(models.Model):
+    stream_name = models.CharField(max_length=1000, unique=True)
+    version = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = "StreamHead"
+        verbose_name_plural = "StreamHeads"
+
+    def __str__(self):
+        return f"{self.stream_name}: {self.version}"
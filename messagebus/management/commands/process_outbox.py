@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from messagebus.domain.bus import MessageBus
+from messagebus.domain.outbox import Outbox
+
+
+class Command(BaseCommand):
+    help = "Dispatches the events of the outbox to their handlers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit as soon as the outbox is drained.",
+        )
+
+    def handle(self, *args, **options):
+        bus = MessageBus()
+        outbox: Outbox = Outbox()  # type: ignore
+
+        total = 0
+        while True:
+            processed = outbox.process(bus, batch_size=options["batch_size"])
+            total += processed
+            if processed > 0:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["sleep"])
+
+        self.stdout.write(f"{total} outbox messages processed.")
@@ -0,0 +1,50 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:57
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("messagebus", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("stream_name", models.CharField(max_length=1000)),
+                ("event_name", models.CharField(max_length=200)),
+                ("payload", models.JSONField()),
+                ("attempts", models.IntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "available_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "OutboxMessage",
+                "verbose_name_plural": "OutboxMessages",
+                "ordering": ["pk"],
+                "indexes": [
+                    models.Index(
+                        fields=["processed_at", "available_at"],
+                        name="messagebus__process_33a764_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:58
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def create_stream_heads(apps, schema_editor):
+    Message = apps.get_model("messagebus", "Message")
+    StreamHead = apps.get_model("messagebus", "StreamHead")
+    heads = (
+        Message.objects.values("stream_name")
+        .annotate(version=Max("position"))
+        .order_by()
+    )
+    StreamHead.objects.bulk_create(
+        [StreamHead(stream_name=h["stream_name"], version=h["version"]) for h in heads],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("messagebus", "0002_outboxmessage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StreamHead",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("stream_name", models.CharField(max_length=1000, unique=True)),
+                ("version", models.IntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "StreamHead",
+                "verbose_name_plural": "StreamHeads",
+            },
+        ),
+        migrations.RunPython(create_stream_heads, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 6.1.2 on 2026-10-18 10:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def fill_aggregate_name(apps, schema_editor):
+    Message = apps.get_model("messagebus", "Message")
+    batch = []
+    for message in Message.objects.only("pk", "stream_name").iterator(chunk_size=2000):
+        message.aggregate_name = message.stream_name.split("-", 1)[0]
+        batch.append(message)
+        if len(batch) >= 2000:
+            Message.objects.bulk_update(batch, ["aggregate_name"])
+            batch = []
+    Message.objects.bulk_update(batch, ["aggregate_name"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("messagebus", "0003_streamhead"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Snapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("stream_name", models.CharField(max_length=1000, unique=True)),
+                ("position", models.IntegerField()),
+                ("data", models.JSONField()),
+                ("time", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "verbose_name": "Snapshot",
+                "verbose_name_plural": "Snapshots",
+            },
+        ),
+        migrations.AddField(
+            model_name="message",
+            name="aggregate_name",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=1000
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["stream_name"],
+                name="messagebus_stream_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        migrations.RunPython(fill_aggregate_name, migrations.RunPython.noop),
+    ]
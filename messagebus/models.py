@@ -1,3 +1,5 @@
-from .impl.message import Message
+from .impl.message import Message, Snapshot
+from .impl.outbox_message import OutboxMessage
+from .impl.stream_head import StreamHead
 
-__all__ = ["Message"]
+__all__ = ["Message", "OutboxMessage", "Snapshot", "StreamHead"]
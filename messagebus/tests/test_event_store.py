@@ -1,8 +1,11 @@
+import pytest
 from django.conf import settings
 
-from messagebus.domain.message import DomainMessage
-from messagebus.domain.store import EventStore
+from messagebus.domain.message import DomainMessage, Snapshot
+from messagebus.domain.store import EventStore, WrongExpectedVersionError
+from messagebus.impl.message import Message as DjangoMessage
 from messagebus.impl.store import DjangoEventStore, InMemoryEventStore
+from messagebus.models import StreamHead
 
 
 def test_settings_repository():
@@ -115,3 +118,57 @@ def test_like_query_memory(db):
     r.append("testab1", events)
     events = r.load("testab", exact=False)
     assert len(events) == 1
+
+
+def test_expected_version(db):
+    for r in [InMemoryEventStore(), DjangoEventStore()]:
+        stream_name = f"testversion-{type(r).__name__}"
+        r.append(stream_name, [DomainMessage(action="a1", data={})], expected_version=0)
+        r.append(stream_name, [DomainMessage(action="a2", data={})], expected_version=1)
+        with pytest.raises(WrongExpectedVersionError):
+            r.append(
+                stream_name, [DomainMessage(action="a3", data={})], expected_version=1
+            )
+        events = r.load(stream_name)
+        assert [e.metadata["position"] for e in events] == [1, 2]
+
+
+def test_django_event_store_continues_legacy_streams(db):
+    DjangoMessage.objects.create(
+        stream_name="testlegacy", action="a1", position=1, data={}, metadata={}
+    )
+    r = DjangoEventStore()
+    r.append("testlegacy", [DomainMessage(action="a2", data={})])
+    events = r.load("testlegacy")
+    assert [e.metadata["position"] for e in events] == [1, 2]
+    assert StreamHead.objects.get(stream_name="testlegacy").version == 2
+
+
+def test_load_from_position_and_aggregate(db):
+    for r in [InMemoryEventStore(), DjangoEventStore()]:
+        name = f"TestAgg{type(r).__name__}"
+        r.append(
+            f"{name}-1", [DomainMessage(action=f"a{i}", data={}) for i in range(5)]
+        )
+        r.append(f"{name}-2", [DomainMessage(action="b", data={})])
+        r.append(f"{name}Other-1", [DomainMessage(action="c", data={})])
+
+        events = r.load(f"{name}-1", from_position=4)
+        assert [e.metadata["position"] for e in events] == [4, 5]
+        assert len(r.load(f"{name}-", exact=False)) == 6
+        assert len(r.load_aggregate(name)) == 6
+
+
+def test_load_since_snapshot(db):
+    for r in [InMemoryEventStore(), DjangoEventStore()]:
+        stream_name = f"TestSnap{type(r).__name__}-1"
+        r.append(
+            stream_name, [DomainMessage(action=f"a{i}", data={}) for i in range(3)]
+        )
+        snapshot, events = r.load_since_snapshot(stream_name)
+        assert snapshot is None and len(events) == 3
+
+        r.save_snapshot(Snapshot(stream_name=stream_name, position=2, data={"n": 2}))
+        snapshot, events = r.load_since_snapshot(stream_name)
+        assert snapshot is not None and snapshot.data == {"n": 2}
+        assert [e.metadata["position"] for e in events] == [3]
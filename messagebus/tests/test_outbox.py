@@ -0,0 +1,120 @@
+from uuid import uuid4
+
+from django.core.management import call_command
+
+from messagebus import Event, MessageBus
+from messagebus.domain.outbox import Outbox
+from messagebus.impl.outbox import DjangoOutbox
+from messagebus.models import OutboxMessage
+
+bus = MessageBus()
+
+
+class OutboxAggregate:
+    class SomethingStored(Event):
+        value: int
+
+    class SomethingBroke(Event):
+        pass
+
+
+HANDLED: list[int] = []
+
+
+def handle_something_stored(event: OutboxAggregate.SomethingStored):
+    HANDLED.append(event.value)
+
+
+def handle_something_broke(event: OutboxAggregate.SomethingBroke):
+    raise ValueError("broken handler")
+
+
+bus.register_handler(OutboxAggregate.SomethingStored, handle_something_stored)
+bus.register_handler(OutboxAggregate.SomethingBroke, handle_something_broke)
+
+
+def test_settings_outbox():
+    assert isinstance(Outbox(), DjangoOutbox)
+
+
+def test_events_are_handled_by_the_worker(db):
+    HANDLED.clear()
+    uuid = uuid4()
+    outbox = DjangoOutbox()
+    outbox.add(
+        [
+            OutboxAggregate.SomethingStored(uuid=uuid, value=1),
+            OutboxAggregate.SomethingStored(uuid=uuid, value=2),
+        ]
+    )
+    assert HANDLED == []
+
+    assert outbox.process(bus) == 2
+    assert HANDLED == [1, 2]
+    assert not OutboxMessage.objects.filter(processed_at__isnull=True).exists()
+    assert outbox.process(bus) == 0
+
+
+def test_failed_events_are_retried_and_block_their_stream(db):
+    HANDLED.clear()
+    uuid1 = uuid4()
+    uuid2 = uuid4()
+    outbox = DjangoOutbox()
+    outbox.add(
+        [
+            OutboxAggregate.SomethingBroke(uuid=uuid1),
+            OutboxAggregate.SomethingStored(uuid=uuid1, value=1),
+            OutboxAggregate.SomethingStored(uuid=uuid2, value=2),
+        ]
+    )
+
+    outbox.process(bus)
+
+    assert HANDLED == [2]
+    broken = OutboxMessage.objects.get(event_name="OutboxAggregate.SomethingBroke")
+    assert broken.attempts == 1
+    assert "broken handler" in broken.last_error
+    assert broken.processed_at is None
+
+    outbox.process(bus)
+    assert HANDLED == [2]
+
+
+def test_process_outbox_command(db):
+    HANDLED.clear()
+    DjangoOutbox().add([OutboxAggregate.SomethingStored(uuid=uuid4(), value=3)])
+    call_command("process_outbox", "--once")
+    assert HANDLED == [3]
+
+
+class OutboxBaseAggregate:
+    class BaseEvent(Event):
+        pass
+
+
+class OutboxChildAggregate:
+    class SomethingInherited(OutboxBaseAggregate.BaseEvent):
+        value: int
+
+
+def test_events_are_found_next_to_events_that_are_not_nested(db):
+    class NotNestedEvent(Event):
+        pass
+
+    HANDLED.clear()
+    MessageBus.event_models = None
+    bus.register_handler(
+        OutboxChildAggregate.SomethingInherited,
+        lambda e: HANDLED.append(e.value),
+    )
+    uuid = uuid4()
+    outbox = DjangoOutbox()
+    outbox.add(
+        [
+            OutboxAggregate.SomethingStored(uuid=uuid, value=1),
+            OutboxChildAggregate.SomethingInherited(uuid=uuid, value=2),
+        ]
+    )
+
+    assert outbox.process(bus) == 2
+    assert HANDLED == [1, 2]